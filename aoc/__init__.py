@@ -0,0 +1 @@
+"""Tooling shared by the Advent of Code 2017 solutions."""
@@ -0,0 +1,124 @@
+"""Benchmark harness: repeated timings, saved baselines and regression checks."""
+
+import fnmatch
+import json
+import platform
+import statistics
+import time
+
+from collections import namedtuple
+
+from .measure import format_seconds
+
+# A benchmark case.  <setup> takes one of <sizes> and returns a callable
+# doing the timed work; parsing and input generation stay outside of it.
+Case = namedtuple("Case", "name sizes setup")
+
+Timing = namedtuple("Timing", "name size min median repeat")
+
+Change = namedtuple("Change", "key baseline current ratio regressed")
+
+CASES = []
+
+
+def case(name, sizes):
+    """Register decorated setup function as benchmark case <name>."""
+    def register(setup):
+        CASES.append(Case(name, tuple(sizes), setup))
+        return setup
+    return register
+
+
+def key(name, size):
+    return "%s[%s]" % (name, size)
+
+
+def select(patterns=None, cases=None):
+    """Return registered cases matching any of shell-style <patterns>."""
+    if cases is None:
+        from . import benchmarks     # noqa: F401, registers cases
+        cases = CASES
+    if not patterns:
+        return list(cases)
+    return [c for c in cases if any(fnmatch.fnmatch(c.name, p) for p in patterns)]
+
+
+def time_case(case, size, repeat=5, warmup=1):
+    """Time <case> at <size>, returning min and median of <repeat> runs."""
+    run = case.setup(size)
+
+    for _ in range(warmup):
+        run()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    return Timing(case.name, size, min(times), statistics.median(times), repeat)
+
+
+def run_cases(cases, repeat=5, warmup=1, quick=False):
+    """Time all <cases> at all of their sizes, or only the smallest if <quick>."""
+    for case in cases:
+        for size in case.sizes[:1] if quick else case.sizes:
+            yield time_case(case, size, repeat=repeat, warmup=warmup)
+
+
+def save(timings, path):
+    doc = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {key(t.name, t.size): t._asdict() for t in timings},
+    }
+    with open(path, "w") as f:
+        json.dump(doc, f, indent=2)
+        f.write("\n")
+
+
+def load(path):
+    """Return baseline timings from <path>, keyed by case name and size."""
+    with open(path) as f:
+        doc = json.load(f)
+    return {k: Timing(**v) for k, v in doc["results"].items()}
+
+
+def compare(timings, baseline, threshold=10.0, stat="min"):
+    """Compare <timings> to <baseline>.
+
+    A case regressed if its <stat> grew by more than <threshold> percent.
+    Cases missing from the baseline are skipped.
+    """
+    changes = []
+    for t in timings:
+        base = baseline.get(key(t.name, t.size))
+        if base is None:
+            continue
+        old, new = getattr(base, stat), getattr(t, stat)
+        ratio = new / old if old else float("inf")
+        changes.append(Change(key(t.name, t.size), old, new, ratio,
+                              ratio > 1 + threshold / 100))
+    return changes
+
+
+def format_timings(timings, changes=None):
+    changes = {c.key: c for c in changes or ()}
+    rows = [("case", "size", "min", "median", "baseline", "change")]
+
+    for t in timings:
+        c = changes.get(key(t.name, t.size))
+        rows.append((
+            t.name,
+            str(t.size),
+            format_seconds(t.min),
+            format_seconds(t.median),
+            format_seconds(c.baseline) if c else "-",
+            "%+.1f%%%s" % ((c.ratio - 1) * 100, " !" if c.regressed else "") if c else "-",
+        ))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(c.ljust(w) if i == 0 else c.rjust(w)
+                  for i, (c, w) in enumerate(zip(row, widths))).rstrip()
+        for row in rows)
@@ -0,0 +1,297 @@
+"""Benchmark cases for the solvers, on synthetic inputs of growing size."""
+
+import importlib.util
+import random
+import tempfile
+
+from array import array
+from itertools import islice
+from pathlib import Path
+
+from . import days
+from .bench import case
+
+
+def solver(number, module="run"):
+    return days.load(days.select([number])[0], module)
+
+
+def generate(number, size, **kwargs):
+    return solver(number, "gen").generate(size, **kwargs)
+
+
+@case("day01.doubled_digit_captcha", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run, s = solver(1), generate(1, size).strip()
+    return lambda: run.solve_doubled_digit_captcha(s)
+
+
+@case("day01.halfway_captcha", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run, s = solver(1), generate(1, size).strip()
+    return lambda: run.solve_halfway_captcha(s)
+
+
+def captcha_file(size, **kwargs):
+    run = solver(1)
+    tmp = tempfile.TemporaryDirectory()
+    path = Path(tmp.name) / "input"
+    path.write_text(generate(1, size))
+    # <tmp> is kept alive, and the file with it, as long as the closure.
+    return lambda: (tmp, run.solve_captcha_file(path, halfway=True, **kwargs))
+
+
+@case("day01.captcha_file", sizes=(10**6, 10**7, 10**8))
+def _(size):
+    return captcha_file(size, backend="python")
+
+
+if importlib.util.find_spec("numpy"):
+    @case("day01.captcha_file_numpy", sizes=(10**6, 10**7, 10**8))
+    def _(size):
+        return captcha_file(size, backend="numpy")
+
+
+@case("day02.min_max_checksum", sizes=(16, 256, 4096))
+def _(size):
+    run, s = solver(2), generate(2, size)
+    return lambda: run.spreadsheet_checksum(s.split('\n'), run.row_min_max_checksum)
+
+
+@case("day02.evenly_divisible_checksum", sizes=(16, 256, 4096))
+def _(size):
+    run, s = solver(2), generate(2, size)
+    return lambda: run.spreadsheet_checksum(s.split('\n'), run.row_evenly_divisible_checksum)
+
+
+@case("day02.both_checksums", sizes=(16, 256, 4096))
+def _(size):
+    run, s = solver(2), generate(2, size)
+    return lambda: run.Spreadsheet.parse(s.split('\n')).checksums()
+
+
+@case("day02.wide_row_divisible_checksum", sizes=(10**3, 10**4, 3 * 10**4))
+def _(size):
+    run, s = solver(2), generate(2, 4, width=size)
+    return lambda: run.spreadsheet_checksum(s.split('\n'), run.row_evenly_divisible_checksum)
+
+
+@case("day03.distances_to_center", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(3)
+    rng = random.Random(0)
+    ns = [rng.randrange(1, 10**12) for _ in range(size)]
+    return lambda: run.distances_to_center_many(ns)
+
+
+@case("day03.neighbour_sums", sizes=(10**10, 10**100, 10**500))
+def _(size):
+    run = solver(3)
+    return lambda: run.puzzle(size)
+
+
+@case("day04.passphrases", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run, s = solver(4), generate(4, size)
+    return lambda: (run.part1(s), run.part2(s))
+
+
+@case("day04.count_valid_file", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run = solver(4)
+    tmp = tempfile.TemporaryDirectory()
+    path = Path(tmp.name) / "input"
+    path.write_text(generate(4, size))
+    return lambda: (tmp, run.count_valid_file(path, processes=None))
+
+
+@case("day05.strange_jump", sizes=(100, 300, 1000))
+def _(size):
+    run = solver(5)
+    maze = [int(n) for n in generate(5, size).split()]
+    return lambda: run.puzzle(maze, increase_func=run.strange_jump)
+
+
+@case("day05.settled_maze", sizes=(100, 300, 1000))
+def _(size):
+    run = solver(5)
+    maze = [int(n) for n in generate(5, size).split()]
+    return lambda: run.run_settled_maze(maze)
+
+
+@case("day06.locate_redistribute_loop", sizes=(8, 12, 16))
+def _(size):
+    run = solver(6)
+    banks = [int(n) for n in generate(6, size).split()]
+    return lambda: run.locate_redistribute_loop(banks[:])
+
+
+@case("day06.locate_redistribute_loop_brent", sizes=(8, 12, 16))
+def _(size):
+    run = solver(6)
+    banks = [int(n) for n in generate(6, size).split()]
+    return lambda: run.locate_redistribute_loop(banks, mode='brent')
+
+
+@case("day06.redistribute", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(6)
+    banks = array('q', map(int, generate(6, size, max_blocks=10**7).split()))
+
+    def redistribute_many():
+        state = banks[:]
+        for _ in range(10):
+            run.redistribute(state)
+    return redistribute_many
+
+
+@case("day07.build_tree", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run, s = solver(7), generate(7, size)
+    return lambda: run.build_tree(s)
+
+
+@case("day07.balance_tower", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run, s = solver(7), generate(7, size)
+    return lambda: run.puzzle2(run.build_tree(s))
+
+
+@case("day07.set_weight", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(7)
+    tower = run.build_tree(generate(7, size))
+    rng = random.Random(0)
+    updates = [(name, rng.randint(1, 99)) for name in rng.choices(sorted(tower), k=1000)]
+
+    def what_if():
+        for name, weight in updates:
+            old = tower[name].weight
+            tower.set_weight(name, weight)
+            tower.corrective_weight()
+            tower.set_weight(name, old)
+    return what_if
+
+
+@case("day08.max_register_value", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(8)
+    program = generate(8, size).strip().split('\n')
+    return lambda: run.max_register_value(program)
+
+
+@case("day09.parse_stream", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run, s = solver(9), generate(9, size).strip()
+    return lambda: run.get_score(list(run.parse_stream(s)))
+
+
+@case("day10.knot_hash", sizes=(16, 256, 4096))
+def _(size):
+    run = solver(10)
+    msg = random.Random(0).randbytes(size).hex()
+    return lambda: run.puzzle_hash(msg)
+
+
+@case("day11.max_distance", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(11)
+    movements = generate(11, size).strip().split(',')
+    return lambda: run.puzzle_max_distance(movements)
+
+
+@case("day12.count_groups", sizes=(100, 300, 1000))
+def _(size):
+    run, s = solver(12), generate(12, size)
+    return lambda: run.count_groups(run.parse_graph(s))
+
+
+@case("day13.safe_trip", sizes=(10, 20, 40))
+def _(size):
+    run = solver(13)
+    depths = run.parse_depths(generate(13, size, delay=size * 100))
+    return lambda: run.safe_trip(depths)
+
+
+@case("day14.disk_grid", sizes=(128,))
+def _(size):
+    run, key = solver(14), generate(14, 8).strip()
+    return lambda: run.disk_grid(key)
+
+
+@case("day14.build_grids", sizes=(1, 2, 4))
+def _(size):
+    run = solver(14)
+    keys = [generate(14, 8, seed=seed).strip() for seed in range(16)]
+    return lambda: run.build_grids(keys, processes=size)
+
+
+@case("day14.count_regions", sizes=(32, 64, 128))
+def _(size):
+    run = solver(14)
+    rng = random.Random(0)
+    grid = '\n'.join(''.join(rng.choice('01') for _ in range(size))
+                     for _ in range(size))
+    return lambda: run.count_regions(grid)
+
+
+@case("day15.judge", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run = solver(15)
+    seed_a, seed_b = run.read_seeds(generate(15, 0))
+    return lambda: run.judge(run.generator(16807, seed=seed_a),
+                             run.generator(48271, seed=seed_b), size)
+
+
+@case("day16.dance", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(16)
+    moves = generate(16, size).strip().split(',')
+    return lambda: run.dance_rounds(moves, 1)
+
+
+@case("day17.spinlock", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run = solver(17)
+    return lambda: next(islice(run.spinlock(376), size, size + 1))
+
+
+@case("day18.interpreter", sizes=(31, 63, 127))
+def _(size):
+    run, s = solver(18), generate(18, size)
+    return lambda: run.part2(s)
+
+
+@case("day19.follow_diagram", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run, s = solver(19), generate(19, size)
+    return lambda: run.get_path_length(s)
+
+
+@case("day20.simulate", sizes=(100, 300, 1000))
+def _(size):
+    run = solver(20)
+    particles = [run.particle_from_string(line)
+                 for line in generate(20, size).strip().split('\n')]
+    return lambda: next(islice(run.simulate_with_collision(particles), 100, 101))
+
+
+@case("day21.grid_states", sizes=(5, 8, 11))
+def _(size):
+    run = solver(21)
+    rules = run.read_rules(generate(21, 0))
+    return lambda: next(islice(run.grid_states(rules), size, size + 1))
+
+
+@case("day22.bursts", sizes=(10**3, 10**4, 10**5))
+def _(size):
+    run, s = solver(22), generate(22, 25)
+    return lambda: sum(v for v in run.bursts(s, stop=size) if type(v) == int)
+
+
+@case("day25.turing_machine", sizes=(10**4, 10**5, 10**6))
+def _(size):
+    run = solver(25)
+    initial_state, checksum_after, rules = run.read_rules(generate(25, size))
+    return lambda: next(islice(run.turing_machine(initial_state, rules, checksum_after),
+                               checksum_after, checksum_after + 1))
@@ -0,0 +1,96 @@
+"""On-disk cache of answers, keyed by puzzle input and solver source."""
+
+import hashlib
+import json
+import os
+
+from pathlib import Path
+
+from .days import ROOT
+
+DEFAULT_DIR = ROOT / ".aoc-cache"
+
+# Least recently used entries are evicted beyond this many bytes.
+MAX_SIZE = 16 * 1024 * 1024
+
+
+def solver_version(day):
+    """Return a hash of the sources <day>'s solution depends on.
+
+    That is the day's modules other than tests and input generators, and
+    the shared code in this package, so editing either invalidates the
+    day's cached answers.
+    """
+    package = Path(__file__).parent
+    paths = sorted(p for p in day.path.glob("*.py") if p.name not in ("test.py", "gen.py"))
+    paths += sorted(p for p in package.glob("*.py") if p.name != "test.py")
+
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+class Cache:
+    """Answers and timings of solved parts, one JSON file per entry."""
+
+    def __init__(self, path=None, max_size=MAX_SIZE):
+        if path is None:
+            path = os.environ.get("AOC_CACHE_DIR", DEFAULT_DIR)
+        self.path = Path(path)
+        self.max_size = max_size
+        self._versions = {}
+
+    def _file(self, day, part, text):
+        if day.number not in self._versions:
+            self._versions[day.number] = solver_version(day)
+        h = hashlib.sha256(self._versions[day.number].encode())
+        h.update(text.encode())
+        return self.path / ("day%02d-part%d-%s.json" % (day.number, part, h.hexdigest()))
+
+    def get(self, day, part, text):
+        """Return cached fields of a Result for <text>, or None on a miss."""
+        path = self._file(day, part, text)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)      # mark as recently used
+        return entry
+
+    def put(self, day, part, text, result):
+        """Store <result>, then evict old entries beyond the size limit."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self._file(day, part, text)
+        tmp = path.with_suffix(".tmp%d" % os.getpid())
+        with open(tmp, "w") as f:
+            json.dump(result._asdict(), f)
+        os.replace(tmp, path)
+        self.evict()
+
+    def entries(self, day=None):
+        pattern = "day*.json" if day is None else "day%02d-*.json" % day
+        return sorted(self.path.glob(pattern))
+
+    def evict(self):
+        entries = [(p.stat(), p) for p in self.entries()]
+        total = sum(st.st_size for st, _ in entries)
+        for st, path in sorted(entries, key=lambda e: e[0].st_mtime):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+    def clear(self, days=None):
+        """Remove entries of <days>, or all of them; return how many."""
+        paths = [p for d in days for p in self.entries(d)] if days else self.entries()
+        for path in paths:
+            path.unlink(missing_ok=True)
+        return len(paths)
+
+    def info(self):
+        """Return number of entries and their total size in bytes."""
+        entries = self.entries()
+        return len(entries), sum(p.stat().st_size for p in entries)
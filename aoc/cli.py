@@ -0,0 +1,156 @@
+"""Command line interface: `aoc run`, `aoc gen`, `aoc cache` and `aoc bench`."""
+
+import argparse
+import sys
+
+from . import days as _days
+from . import bench, runner
+from .cache import Cache
+from .measure import format_bytes
+
+
+def _cmd_run(args):
+    days = _days.select(args.days)
+    parts = (args.part,) if args.part else runner.PARTS
+    costs = runner.load_costs(args.history) if args.history else None
+
+    results = list(runner.run_days(days, parts=parts, input_dir=args.input_dir,
+                                   generate=args.generate, seed=args.seed,
+                                   trace_memory=args.trace_memory, jobs=args.jobs,
+                                   costs=costs, cache=Cache() if args.cache else None,
+                                   progress=args.progress))
+    if not args.quiet:
+        print(runner.format_table(results))
+
+    if args.json:
+        doc = runner.to_json(results)
+        if args.json == "-":
+            print(doc)
+        else:
+            with open(args.json, "w") as f:
+                f.write(doc + "\n")
+
+    failed = [r for r in results if r.status.startswith(("error", "import error"))]
+    return 1 if failed else 0
+
+
+def _cmd_gen(args):
+    day, = _days.select([args.day])
+    if not _days.has_module(day, "gen"):
+        raise ValueError("No input generator for day %d" % day.number)
+
+    text = _days.load(day, "gen").generate(args.size, seed=args.seed)
+    if args.output in (None, "-"):
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text)
+    return 0
+
+
+def _cmd_cache(args):
+    cache = Cache()
+    if args.action == "clear":
+        print("removed %d entries from %s" % (cache.clear(args.days), cache.path))
+    else:
+        entries, size = cache.info()
+        print("%s: %d entries, %s" % (cache.path, entries, format_bytes(size)))
+    return 0
+
+
+def _cmd_bench(args):
+    cases = bench.select(args.filter)
+    if not cases:
+        raise ValueError("No benchmark matches %s" % " ".join(args.filter))
+
+    baseline = bench.load(args.compare) if args.compare else None
+    timings = list(bench.run_cases(cases, repeat=args.repeat, warmup=args.warmup,
+                                   quick=args.quick))
+
+    changes = bench.compare(timings, baseline, args.threshold) if baseline else None
+    print(bench.format_timings(timings, changes))
+
+    if args.save:
+        bench.save(timings, args.save)
+
+    regressed = [c for c in changes or () if c.regressed]
+    if regressed:
+        print("aoc: %d benchmark(s) regressed by more than %g%%"
+              % (len(regressed), args.threshold), file=sys.stderr)
+    return 1 if regressed else 0
+
+
+def parser():
+    p = argparse.ArgumentParser(prog="aoc", description="Advent of Code 2017")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run solutions and report timings")
+    run.add_argument("days", nargs="*", type=int, metavar="DAY",
+                     help="days to run (default: all)")
+    run.add_argument("-p", "--part", type=int, choices=runner.PARTS,
+                     help="run only this part")
+    run.add_argument("-i", "--input-dir", metavar="DIR",
+                     help="read inputs from DIR/<day dir>/input or DIR/dayNN.txt")
+    run.add_argument("-g", "--generate", type=int, metavar="SIZE",
+                     help="run on synthetic inputs of SIZE instead (see `aoc gen`)")
+    run.add_argument("--seed", type=int, default=0,
+                     help="random seed for --generate (default: 0)")
+    run.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                     help="run parts in N worker processes, 0 for one per CPU "
+                          "(default: 1)")
+    run.add_argument("--history", metavar="FILE",
+                     help="start parts that were slowest in FILE, a previous "
+                          "--json output, first")
+    run.add_argument("--cache", action="store_true",
+                     help="reuse answers to unchanged inputs and solvers "
+                          "(in .aoc-cache/ or $AOC_CACHE_DIR)")
+    run.add_argument("--progress", action="store_true",
+                     help="report steps/s and ETA of long-running solvers to stderr")
+    run.add_argument("--trace-memory", action="store_true",
+                     help="also report peak tracemalloc usage (slow)")
+    run.add_argument("--json", metavar="FILE",
+                     help="write results as JSON to FILE ('-' for stdout)")
+    run.add_argument("-q", "--quiet", action="store_true",
+                     help="do not print the results table")
+    run.set_defaults(func=_cmd_run)
+
+    gen = sub.add_parser("gen", help="generate a synthetic puzzle input")
+    gen.add_argument("day", type=int, metavar="DAY")
+    gen.add_argument("size", type=int, metavar="SIZE",
+                     help="input size, its unit depends on the day")
+    gen.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    gen.add_argument("-o", "--output", metavar="FILE", help="output file (default: stdout)")
+    gen.set_defaults(func=_cmd_gen)
+
+    cache = sub.add_parser("cache", help="show or clear cached answers")
+    cache.add_argument("action", choices=("info", "clear"))
+    cache.add_argument("days", nargs="*", type=int, metavar="DAY",
+                       help="clear only these days (default: all)")
+    cache.set_defaults(func=_cmd_cache)
+
+    b = sub.add_parser("bench", help="benchmark solvers on synthetic inputs")
+    b.add_argument("filter", nargs="*", metavar="PATTERN",
+                   help="run only cases matching PATTERN, e.g. 'day14.*'")
+    b.add_argument("-r", "--repeat", type=int, default=5,
+                   help="timed runs per case and size (default: 5)")
+    b.add_argument("-w", "--warmup", type=int, default=1,
+                   help="untimed runs before timing (default: 1)")
+    b.add_argument("--quick", action="store_true",
+                   help="run only the smallest size of each case")
+    b.add_argument("--save", metavar="FILE", help="save timings as a baseline to FILE")
+    b.add_argument("--compare", metavar="FILE", help="compare timings to baseline FILE")
+    b.add_argument("--threshold", type=float, default=10.0, metavar="PERCENT",
+                   help="fail if a case is slower than the baseline by more "
+                        "than PERCENT (default: 10)")
+    b.set_defaults(func=_cmd_bench)
+
+    return p
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print("aoc: %s" % e, file=sys.stderr)
+        return 2
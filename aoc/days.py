@@ -0,0 +1,81 @@
+"""Discover and load the per-day solution modules."""
+
+import importlib
+import sys
+import time
+
+from collections import namedtuple
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+Day = namedtuple("Day", "number name path")
+
+
+def discover(root=ROOT):
+    """Return all day directories under <root>, ordered by day number."""
+    days = []
+    for path in sorted(root.glob("day[0-9][0-9]-*")):
+        if path.is_dir():
+            number, name = path.name[3:].split("-", 1)
+            days.append(Day(int(number), name, path))
+    return days
+
+
+def select(numbers=None, root=ROOT):
+    """Return discovered days, limited to <numbers> if given."""
+    days = discover(root)
+    if not days:
+        raise ValueError("No dayNN-* directories in %s; run from a checkout" % root)
+    if not numbers:
+        return days
+
+    by_number = {day.number: day for day in days}
+    missing = sorted(set(numbers) - set(by_number))
+    if missing:
+        raise ValueError("No such day: %s" % ", ".join(map(str, missing)))
+    return [by_number[n] for n in sorted(set(numbers))]
+
+
+def has_module(day, module="run"):
+    return (day.path / ("%s.py" % module)).is_file()
+
+
+def load(day, module="run"):
+    """Import <module> of given day, e.g. `day01-inverse-captcha.run`."""
+    root = str(day.path.parent)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    return importlib.import_module("%s.%s" % (day.path.name, module))
+
+
+def import_time(day, module="run"):
+    """Return seconds taken to import <module> of <day> from scratch."""
+    name = "%s.%s" % (day.path.name, module)
+    previous = sys.modules.pop(name, None)
+    start = time.perf_counter()
+    load(day, module)
+    elapsed = time.perf_counter() - start
+
+    # Keep the module already in use, e.g. so its functions can be pickled.
+    if previous is not None:
+        sys.modules[name] = previous
+    return elapsed
+
+
+def find_input(day, input_dir=None):
+    """Return path of puzzle input for <day>, or None if there is none.
+
+    Without <input_dir>, the input is read from the `input` file next to
+    `run.py`.  Otherwise <input_dir> is searched for `<day dir>/input`
+    (same layout as this repository) and `dayNN.txt`.
+    """
+    if input_dir is None:
+        candidates = [day.path / "input"]
+    else:
+        input_dir = Path(input_dir)
+        candidates = [
+            input_dir / day.path.name / "input",
+            input_dir / ("day%02d.txt" % day.number),
+        ]
+    return next((p for p in candidates if p.is_file()), None)
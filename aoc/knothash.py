@@ -0,0 +1,74 @@
+"""Knot hash, as used by days 10 and 14.
+
+The circle is a bytearray reversed in place at the current position, a
+span that wraps around the end being reversed in its two pieces.
+"""
+
+from functools import reduce
+from operator import xor
+
+SUFFIX = bytes([17, 31, 73, 47, 23])
+
+
+def knot(lengths, size=256, rounds=1):
+    """Return the circle of <size> marks after <rounds> of tying <lengths>."""
+    if not 0 < size <= 256:
+        raise ValueError("size must be between 1 and 256, not %d" % size)
+
+    if any(length > size for length in lengths):
+        raise ValueError("lengths must be at most the size %d" % size)
+
+    state = bytearray(range(size))
+    pos = skip = 0
+
+    for _ in range(rounds):
+        for length in lengths:
+            end = pos + length
+            if end <= size:
+                if length > 1:
+                    state[pos:end] = state[end - 1:pos - 1 if pos else None:-1]
+            else:
+                span = state[pos:] + state[:end - size]
+                span.reverse()
+                state[pos:] = span[:size - pos]
+                state[:end - size] = span[size - pos:]
+            pos = (end + skip) % size
+            skip += 1
+
+    return state
+
+
+def _digest(data):
+    sparse = knot(bytes(data) + SUFFIX, rounds=64)
+    return bytes(reduce(xor, sparse[i:i + 16]) for i in range(0, 256, 16))
+
+
+class KnotHash:
+    """Knot hash with the interface of hashlib's hash objects.
+
+    Every round goes over the whole message, so update() only buffers
+    data and the hash is computed by digest().
+    """
+
+    name = "knothash"
+    digest_size = 16
+
+    def __init__(self, data=b""):
+        self._data = bytearray(data)
+
+    def update(self, data):
+        self._data += data
+
+    def digest(self):
+        return _digest(self._data)
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+    def copy(self):
+        return KnotHash(self._data)
+
+
+def hash_many(messages):
+    """Return the digests of all <messages>, in order."""
+    return [_digest(m) for m in messages]
@@ -0,0 +1,88 @@
+"""Wall clock, CPU time and peak memory of a single call."""
+
+import sys
+import time
+import tracemalloc
+
+from collections import namedtuple
+
+try:
+    import resource
+except ImportError:     # not available on Windows
+    resource = None
+
+Measurement = namedtuple("Measurement", "wall cpu peak_rss peak_traced")
+
+
+def reset_peak_rss():
+    """Reset the kernel's peak RSS counter (Linux only, best effort)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss():
+    """Return peak resident set size of this process in bytes, if known."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def measure(func, *args, trace_memory=False, **kwargs):
+    """Call <func> and return its result along with a Measurement.
+
+    Peak traced memory is only collected with <trace_memory>, since
+    tracemalloc slows the measured code down considerably.
+    """
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    reset_peak_rss()
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        result = func(*args, **kwargs)
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+        traced = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if tracing:
+            tracemalloc.stop()
+
+    return result, Measurement(wall, cpu, peak_rss(), traced)
+
+
+def format_seconds(s):
+    if s is None:
+        return "-"
+    if s < 1e-3:
+        return "%.0fus" % (s * 1e6)
+    if s < 1:
+        return "%.1fms" % (s * 1e3)
+    return "%.2fs" % s
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return "%.0f%s" % (n, unit) if unit == "B" else "%.1f%s" % (n, unit)
+        n /= 1024
+    return "%.1fGiB" % n
@@ -0,0 +1,120 @@
+"""Progress reports from long-running solvers.
+
+Solvers take an optional <progress>, a Progress or None.  Their hot loop
+compares a step counter to the step its last update() asked to be called
+at next, so that without progress it costs one comparison per step:
+
+    check = progress.update(0) if progress else -1
+    for step in count():
+        if step == check:
+            check = progress.update(step)
+        ...
+
+The runner passes one from tracker() to `partN()` functions that take a
+<progress> argument, so day modules never import this one.  tracker() only
+returns a Progress while reports are enabled, e.g. by `aoc run --progress`,
+and solvers that know how many steps they will take set its `total`.
+"""
+
+import sys
+import time
+
+from collections import namedtuple
+
+from .measure import format_seconds
+
+Report = namedtuple("Report", "name done total elapsed rate eta")
+
+INTERVAL = 1.0
+
+# (report, interval) while enabled
+_enabled = None
+
+
+def format_report(r):
+    done = "%d steps" % r.done
+    if r.total:
+        done += " of %d (%.0f%%)" % (r.total, 100 * r.done / r.total)
+    line = "%s: %s, %.0f steps/s, %s elapsed" % (
+        r.name, done, r.rate or 0, format_seconds(r.elapsed))
+    if r.eta is not None:
+        line += ", ETA %s" % format_seconds(r.eta)
+    return line
+
+
+def print_report(r):
+    print("aoc: %s" % format_report(r), file=sys.stderr, flush=True)
+
+
+class Progress:
+    """Steps of a solver called <name>, out of <total> if known.
+
+    <report> is called with a Report at most every <interval> seconds, and
+    defaults to printing it to stderr.
+    """
+
+    def __init__(self, name, total=None, report=None, interval=INTERVAL):
+        self.name = name
+        self.total = total
+        self.report = report or print_report
+        self.interval = interval
+        self.done = 0
+        self.every = 1
+        self.start = self._last = time.perf_counter()
+        self._due = self.start + interval
+
+    def update(self, done):
+        """Record <done> steps, and return the step to be called at next.
+
+        The steps between calls double or halve until there are a few
+        calls per interval, so the clock is seldom read.
+        """
+        now = time.perf_counter()
+        if now - self._last < self.interval / 8:
+            self.every *= 2
+        elif now - self._last > self.interval and self.every > 1:
+            self.every //= 2
+        self._last = now
+        self.done = done
+
+        if now >= self._due:
+            self._due = now + self.interval
+            self.report(self.current(now))
+        return done + self.every
+
+    def finish(self, done):
+        """Record <done> steps at the end, reporting them if it took a while."""
+        self.done = done
+        now = time.perf_counter()
+        if now - self.start >= self.interval:
+            self.report(self.current(now))
+
+    def current(self, now=None):
+        """Return a Report of the steps so far."""
+        if now is None:
+            now = time.perf_counter()
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else None
+        eta = None
+        if self.total is not None and rate:
+            eta = max(self.total - self.done, 0) / rate
+        return Report(self.name, self.done, self.total, elapsed, rate, eta)
+
+
+def enable(report=None, interval=INTERVAL):
+    """Have tracker() return a Progress calling <report> every <interval> seconds."""
+    global _enabled
+    _enabled = (report, interval)
+
+
+def disable():
+    global _enabled
+    _enabled = None
+
+
+def tracker(name, total=None):
+    """Return a Progress for solver <name> if reports are enabled, else None."""
+    if _enabled is None:
+        return None
+    report, interval = _enabled
+    return Progress(name, total, report=report, interval=interval)
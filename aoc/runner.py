@@ -0,0 +1,218 @@
+"""Run day solutions and report their answers, timings and memory use."""
+
+import inspect
+import json
+import os
+import platform
+import traceback
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from . import days as _days
+from . import progress as _progress
+from .measure import measure, format_seconds, format_bytes
+
+PARTS = (1, 2)
+
+Result = namedtuple(
+    "Result", "day name part answer wall cpu peak_rss peak_traced status")
+
+# Rough wall time in seconds of (day, part) on a real puzzle input, used to
+# start the slowest jobs first when running in parallel.  Unlisted parts are
+# taken to be quick.
+EXPECTED_COST = {
+    (5, 2): 15,
+    (13, 2): 5,
+    (14, 1): 2,
+    (14, 2): 3,
+    (15, 1): 60,
+    (15, 2): 30,
+    (16, 2): 1,
+    (17, 2): 120,
+    (18, 2): 1,
+    (20, 1): 10,
+    (20, 2): 10,
+    (21, 2): 10,
+    (22, 1): 1,
+    (25, 1): 15,
+}
+
+
+def _jsonable(answer):
+    return answer if answer is None or isinstance(answer, (int, str)) else str(answer)
+
+
+def run_part(day, part, text, trace_memory=False, cache=None):
+    """Run <part> of <day> on input <text> and return a Result.
+
+    With a <cache>, a previous answer to the same input by the same solver
+    is returned instead, with its original timings and status "cached".
+    """
+    if cache is not None:
+        entry = cache.get(day, part, text)
+        if entry is not None:
+            return Result(**dict(entry, status="cached"))
+
+    blank = dict(day=day.number, name=day.name, part=part, answer=None,
+                 wall=None, cpu=None, peak_rss=None, peak_traced=None)
+
+    if not _days.has_module(day):
+        return Result(**blank, status="missing solution")
+
+    try:
+        module = _days.load(day)
+    except Exception:
+        return Result(**blank, status="import error: %s" % _last_error())
+
+    solve = getattr(module, "part%d" % part, None)
+    if solve is None:
+        return Result(**blank, status="not implemented")
+
+    kwargs = {}
+    if "progress" in inspect.signature(solve).parameters:
+        tracker = _progress.tracker("day%02d part %d" % (day.number, part))
+        if tracker is not None:
+            kwargs["progress"] = tracker
+
+    try:
+        answer, m = measure(solve, text, trace_memory=trace_memory, **kwargs)
+    except Exception:
+        return Result(**blank, status="error: %s" % _last_error())
+
+    blank.update(answer=_jsonable(answer), **m._asdict())
+    result = Result(**blank, status="ok")
+    if cache is not None:
+        cache.put(day, part, text, result)
+    return result
+
+
+def _last_error():
+    return traceback.format_exc().strip().split("\n")[-1]
+
+
+def read_input(day, input_dir=None, generate=None, seed=0):
+    """Return puzzle input text for <day>, or None if there is none.
+
+    With <generate>, a synthetic input of that size is made by the day's
+    `gen.py` instead of reading one from <input_dir>.
+    """
+    if generate is not None:
+        if not _days.has_module(day, "gen"):
+            return None
+        return _days.load(day, "gen").generate(generate, seed=seed)
+
+    path = _days.find_input(day, input_dir)
+    if path is None:
+        return None
+    with open(path) as f:
+        return f.read()
+
+
+def load_costs(path):
+    """Return (day, part) wall times from a previous `aoc run --json` file."""
+    with open(path) as f:
+        doc = json.load(f)
+    return {(r["day"], r["part"]): r["wall"]
+            for r in doc["results"] if r["wall"] is not None}
+
+
+def _run_job(number, part, text, trace_memory, cache, progress):
+    # Runs in a worker process, so takes the day's number rather than a Day.
+    if progress:
+        _progress.enable()
+    day, = _days.select([number])
+    return run_part(day, part, text, trace_memory=trace_memory, cache=cache)
+
+
+def run_days(days, parts=PARTS, input_dir=None, generate=None, seed=0,
+             trace_memory=False, jobs=1, costs=None, cache=None, progress=False):
+    """Run selected parts of <days>, yielding a Result for each.
+
+    With <jobs> above 1, parts run in that many worker processes, the most
+    expensive first according to <costs> (default: EXPECTED_COST).  Results
+    are still yielded in order of days and parts.  With <progress>, solvers
+    that support it report their progress to stderr.
+    """
+    todo = []
+    for day in days:
+        text = read_input(day, input_dir, generate=generate, seed=seed)
+        for part in parts:
+            todo.append((day, part, text))
+
+    if jobs == 1:
+        if progress:
+            _progress.enable()
+        try:
+            for day, part, text in todo:
+                if text is None:
+                    yield _missing_input(day, part)
+                else:
+                    yield run_part(day, part, text, trace_memory=trace_memory, cache=cache)
+        finally:
+            if progress:
+                _progress.disable()
+        return
+
+    if costs is None:
+        costs = EXPECTED_COST
+
+    with ProcessPoolExecutor(jobs or os.cpu_count()) as pool:
+        futures = {}
+        by_cost = sorted(todo, key=lambda job: -costs.get((job[0].number, job[1]), 0))
+        for day, part, text in by_cost:
+            if text is not None:
+                futures[day.number, part] = pool.submit(
+                    _run_job, day.number, part, text, trace_memory, cache, progress)
+
+        for day, part, text in todo:
+            future = futures.get((day.number, part))
+            if future is None:
+                yield _missing_input(day, part)
+            else:
+                yield future.result()
+
+
+def _missing_input(day, part):
+    return Result(day.number, day.name, part, None,
+                  None, None, None, None, "missing input")
+
+
+def format_table(results):
+    """Format results as a plain-text table."""
+    header = ("day", "part", "answer", "wall", "cpu", "peak rss", "peak traced")
+    rows = [header]
+    for r in results:
+        if r.status in ("ok", "cached"):
+            answer = str(r.answer)
+            if len(answer) > 32:
+                answer = answer[:29] + "..."
+        else:
+            answer = "(%s)" % r.status
+        rows.append((
+            "%02d %s" % (r.day, r.name),
+            str(r.part),
+            answer,
+            format_seconds(r.wall),
+            format_seconds(r.cpu),
+            format_bytes(r.peak_rss),
+            format_bytes(r.peak_traced),
+        ))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [c.ljust(w) if i < 3 else c.rjust(w)
+                 for i, (c, w) in enumerate(zip(row, widths))]
+        lines.append("  ".join(cells).rstrip())
+    return "\n".join(lines)
+
+
+def to_json(results):
+    """Return results as a JSON document, e.g. for nightly trend plots."""
+    doc = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [r._asdict() for r in results],
+    }
+    return json.dumps(doc, indent=2)
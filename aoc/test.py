@@ -0,0 +1,229 @@
+import json
+
+import pytest
+
+from . import bench, days, knothash, progress, runner
+from .cache import Cache
+from .measure import measure, format_bytes, format_seconds
+
+
+def test_discover():
+    found = days.discover()
+    assert [d.number for d in found] == list(range(1, 26))
+    assert found[0].name == "inverse-captcha"
+    assert found[24].name == "the-halting-problem"
+
+
+def test_select(tmp_path):
+    assert [d.number for d in days.select([5, 1, 5])] == [1, 5]
+    with pytest.raises(ValueError):
+        days.select(root=tmp_path)
+    try:
+        days.select([26])
+    except ValueError:
+        pass
+    else:
+        assert False, "Should throw for unknown day"
+
+
+# Importing a day must not compute anything, see dayNN-*/test.py for checks.
+IMPORT_BUDGET = 0.05
+
+
+def test_import_time_budget():
+    for day in days.discover():
+        if days.has_module(day):
+            days.load(day)      # warm up shared imports
+            elapsed = days.import_time(day)
+            assert elapsed < IMPORT_BUDGET, "%s imports in %.3fs" % (day.path.name, elapsed)
+
+
+def test_find_input(tmp_path):
+    day = days.select([1])[0]
+    assert days.find_input(day, tmp_path) is None
+
+    (tmp_path / "day01.txt").write_text("1122\n")
+    assert days.find_input(day, tmp_path) == tmp_path / "day01.txt"
+
+    (tmp_path / day.path.name).mkdir()
+    (tmp_path / day.path.name / "input").write_text("1122\n")
+    assert days.find_input(day, tmp_path) == tmp_path / day.path.name / "input"
+
+
+def test_measure():
+    result, m = measure(sum, range(1000))
+    assert result == 499500
+    assert m.wall >= 0 and m.cpu >= 0
+    assert m.peak_traced is None
+
+    result, m = measure(list, range(1000), trace_memory=True)
+    assert m.peak_traced > 1000
+
+
+def test_run_days(tmp_path):
+    (tmp_path / "day01.txt").write_text("91212129\n")
+    results = list(runner.run_days(days.select([1, 2, 23]), input_dir=tmp_path))
+
+    assert [(r.day, r.part, r.answer, r.status) for r in results] == [
+        (1, 1, 9, "ok"),
+        (1, 2, 6, "ok"),
+        (2, 1, None, "missing input"),
+        (2, 2, None, "missing input"),
+        (23, 1, None, "missing input"),
+        (23, 2, None, "missing input"),
+    ]
+
+    doc = json.loads(runner.to_json(results))
+    assert doc["results"][0]["answer"] == 9
+    assert doc["results"][0]["wall"] > 0
+
+    table = runner.format_table(results).split("\n")
+    assert len(table) == 1 + len(results)
+    assert "missing input" in table[-1]
+
+
+def test_run_part_missing():
+    text = "anything"
+    result = runner.run_part(days.select([23])[0], 1, text)
+    assert result.status == "missing solution"
+
+    result = runner.run_part(days.select([22])[0], 2, text)
+    assert result.status == "not implemented"
+
+
+def test_format():
+    assert format_seconds(None) == "-"
+    assert format_seconds(0.5e-3) == "500us"
+    assert format_seconds(0.25) == "250.0ms"
+    assert format_seconds(2) == "2.00s"
+    assert format_bytes(512) == "512B"
+    assert format_bytes(2048) == "2.0KiB"
+    assert format_bytes(3 * 1024 ** 3) == "3.0GiB"
+
+
+def test_run_generated():
+    results = list(runner.run_days(days.select([11, 23]), generate=50, seed=1))
+    assert [(r.day, r.status) for r in results] == [
+        (11, "ok"), (11, "ok"), (23, "missing input"), (23, "missing input")]
+    assert results[0].answer <= results[1].answer <= 50
+
+
+def test_cli_gen(tmp_path, capsys):
+    from .cli import main
+
+    out = tmp_path / "day11.txt"
+    assert main(["gen", "11", "20", "--seed", "2", "-o", str(out)]) == 0
+    assert len(out.read_text().strip().split(",")) == 20
+
+    assert main(["run", "11", "-i", str(tmp_path), "-q", "--json", "-"]) == 0
+    doc = json.loads(capsys.readouterr().out)
+    assert [r["status"] for r in doc["results"]] == ["ok", "ok"]
+
+
+def test_bench_compare(tmp_path):
+    calls = []
+    case = bench.Case("test.append", (1, 2), lambda size: lambda: calls.append(size))
+    timings = list(bench.run_cases([case], repeat=3, warmup=1))
+    assert calls == [1] * 4 + [2] * 4
+    assert [(t.name, t.size, t.repeat) for t in timings] == [
+        ("test.append", 1, 3), ("test.append", 2, 3)]
+
+    path = tmp_path / "baseline.json"
+    bench.save(timings, path)
+    baseline = bench.load(path)
+    assert baseline["test.append[1]"] == timings[0]
+
+    slower = [timings[0]._replace(min=timings[0].min * 1.2),
+              timings[1]._replace(min=timings[1].min * 1.05),
+              bench.Timing("test.new", 1, 1.0, 1.0, 1)]
+    changes = bench.compare(slower, baseline, threshold=10)
+    assert [(c.key, c.regressed) for c in changes] == [
+        ("test.append[1]", True), ("test.append[2]", False)]
+    assert "+20.0% !" in bench.format_timings(slower, changes)
+
+
+def test_bench_cases():
+    names = [c.name for c in bench.select()]
+    assert len(names) == len(set(names))
+    assert [c.name for c in bench.select(["day14.*"])] == [
+        "day14.disk_grid", "day14.build_grids", "day14.count_regions"]
+
+
+def test_run_days_parallel(tmp_path):
+    results = list(runner.run_days(days.select([11, 12, 23]), generate=50, seed=1))
+    parallel = list(runner.run_days(days.select([11, 12, 23]), generate=50, seed=1,
+                                    jobs=2, costs={(12, 2): 1}))
+    assert [(r.day, r.part, r.answer, r.status) for r in parallel] == \
+        [(r.day, r.part, r.answer, r.status) for r in results]
+
+    (tmp_path / "history.json").write_text(runner.to_json(results))
+    costs = runner.load_costs(tmp_path / "history.json")
+    assert set(costs) == {(11, 1), (11, 2), (12, 1), (12, 2)}
+
+
+def test_cache(tmp_path):
+    cache = Cache(tmp_path)
+    day = days.select([1])[0]
+
+    first = runner.run_part(day, 1, "1122", cache=cache)
+    again = runner.run_part(day, 1, "1122", cache=cache)
+    assert (first.status, again.status) == ("ok", "cached")
+    assert again._replace(status="ok") == first
+    assert runner.run_part(day, 1, "1111", cache=cache).status == "ok"
+    assert cache.info()[0] == 2
+
+    runner.run_part(days.select([2])[0], 1, "5 1 9 5", cache=cache)
+    assert cache.clear([1]) == 2
+    assert cache.info()[0] == 1
+
+    cache.max_size = 0
+    cache.evict()
+    assert cache.info() == (0, 0)
+
+
+def test_knothash():
+    assert list(knothash.knot([3, 4, 1, 5], size=5)) == [3, 4, 2, 1, 0]
+    with pytest.raises(ValueError):
+        knothash.knot([3, 6], size=5)
+    assert knothash.KnotHash().hexdigest() == 'a2582a3a0e66e6e86e3812dcb672a272'
+
+    h = knothash.KnotHash(b'AoC ')
+    c = h.copy()
+    h.update(b'2017')
+    assert h.hexdigest() == '33efeb34ea91902bb2f59c9920caa6cd'
+    assert c.digest() == knothash.KnotHash(b'AoC ').digest() != h.digest()
+    assert len(h.digest()) == h.digest_size
+
+    assert [d.hex() for d in knothash.hash_many([b'1,2,3', b'1,2,4'])] == [
+        '3efbe78a8d82f29979031a4aa0b16a9d', '63960835bcdc130f0b66d7ff4f6a5a8e']
+
+
+def test_progress():
+    reports = []
+    p = progress.Progress("spin", total=100, report=reports.append, interval=0)
+    check = p.update(0)
+    assert check > 0 and len(reports) == 1
+    p.update(50)
+    r = reports[-1]
+    assert (r.name, r.done, r.total) == ("spin", 50, 100)
+    assert r.rate > 0 and r.eta >= 0
+    assert "spin: 50 steps of 100 (50%)" in progress.format_report(r)
+    p.finish(100)
+    assert reports[-1].done == 100
+
+    assert progress.tracker("spin") is None
+    progress.enable(report=reports.append, interval=0)
+    try:
+        day15 = days.load(days.select([15])[0])
+        p = progress.tracker("day15")
+        assert day15.judge(day15.generator(16807, seed=65), day15.generator(48271, seed=8921),
+                           1000, progress=p) == day15.judge(
+            day15.generator(16807, seed=65), day15.generator(48271, seed=8921), 1000)
+        assert reports[-1].done == 1000 and reports[-1].total == 1000
+        assert reports[-1].eta == 0
+
+        result = runner.run_part(days.select([22])[0], 1, "..#\n#..\n...\n")
+        assert (result.status, result.answer) == ("ok", 5587)
+        assert reports[-1].name == "day22 part 1"
+    finally:
+        progress.disable()
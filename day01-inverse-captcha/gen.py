@@ -0,0 +1,11 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+DIGITS = bytes(ord('1') + n % 9 for n in range(256))
+
+
+def generate(size, seed=0):
+    """Return a captcha of <size> digits."""
+    rng = random.Random(seed)
+    return rng.randbytes(size).translate(DIGITS).decode() + '\n'
@@ -1,5 +1,38 @@
 #!/usr/bin/env python3
 
+import mmap
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bytes per chunk compared at once when summing a captcha in bulk.
+CHUNK_SIZE = 1 << 22
+
+# Translates digit characters to their values, anything else to 0.
+DIGIT_VALUES = bytes(c - ord('0') if chr(c).isdigit() else 0 for c in range(256))
+
+
+def _sum_equal(chunk, partner):
+    """Return sum of digits in <chunk> equal to those in <partner> at same index.
+
+    Both are handled as little-endian ints: their XOR has a zero byte where
+    they are equal, and these are found for all bytes at once without carries
+    crossing bytes.  Digit values are then summed by their four bit planes.
+    """
+    ones = int.from_bytes(b'\x01' * len(chunk), 'little')
+    low7 = ones * 0x7f
+
+    x = int.from_bytes(chunk, 'little') ^ int.from_bytes(partner, 'little')
+    equal = ~(((x & low7) + low7) | x | low7) >> 7 & ones
+    values = int.from_bytes(chunk.translate(DIGIT_VALUES), 'little') & equal * 0xf
+
+    return sum((values >> bit & ones).bit_count() << bit for bit in range(4))
+
 
 def solve_doubled_digit_captcha(s):
     def repeated_digits(s):
@@ -22,20 +55,136 @@ def solve_halfway_captcha(s):
     return sum(repeated_digits(s))
 
 
-assert solve_doubled_digit_captcha("1122") == 3
-assert solve_doubled_digit_captcha("1111") == 4
-assert solve_doubled_digit_captcha("1234") == 0
-assert solve_doubled_digit_captcha("91212129") == 9
+def _segments(offset, length, start, stop, chunk_size):
+    """Yield (begin, end, at), pairing positions from <begin> to <end> with
+    those from <at> on, in chunks, wrapping around <length>."""
+    for begin in range(start, stop, chunk_size):
+        end = min(begin + chunk_size, stop)
+        at = (begin + offset) % length
+        if at + end - begin > length:
+            split = begin + length - at
+            yield begin, split, at
+            begin, at = split, 0
+        yield begin, end, at
+
+
+def _release(buf, start, end):
+    # Let go of pages of a memory-mapped file that were read, or they add
+    # up in resident memory.
+    if isinstance(buf, mmap.mmap) and hasattr(mmap, 'MADV_DONTNEED'):
+        start -= start % mmap.PAGESIZE
+        buf.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+def captcha_sum(buf, offset, length=None, start=0, stop=None, chunk_size=CHUNK_SIZE):
+    """Return sum of digits in <buf> equal to the one <offset> further on.
+
+    <buf> is circular, of <length> bytes (default: all of it), and is read
+    in chunks of <chunk_size>, so it may be a memory-mapped file.  Only
+    digits from <start> to <stop> are summed.
+    """
+    if length is None:
+        length = len(buf)
+    if length == 0:
+        return 0
+    if stop is None:
+        stop = length
+
+    total = 0
+    for begin, end, at in _segments(offset % length, length, start, stop, chunk_size):
+        total += _sum_equal(buf[begin:end], buf[at:at + end - begin])
+        _release(buf, begin, end)
+        _release(buf, at, at + end - begin)
+    return total
+
+
+def _byte_sum(a):
+    """Return sum of small values (below 32) in uint8 array <a>."""
+    # Eight bytes at a time: multiplying a uint64 by 0x0101...01 adds up
+    # all its bytes in the top one.
+    whole = len(a) // 8 * 8
+    words = a[:whole].view(np.uint64)
+    return (int((words * np.uint64(0x0101010101010101) >> np.uint64(56)).sum()) +
+            int(a[whole:].sum()))
+
+
+def captcha_sum_numpy(buf, offset, length=None, start=0, stop=None, chunk_size=CHUNK_SIZE):
+    """Same as captcha_sum(), comparing views of a NumPy array of <buf>."""
+    if length is None:
+        length = len(buf)
+    if length == 0:
+        return 0
+    if stop is None:
+        stop = length
+
+    digits = np.frombuffer(buf, dtype=np.uint8, count=length)
+    total = 0
+    for begin, end, at in _segments(offset % length, length, start, stop, chunk_size):
+        chunk = digits[begin:end]
+        total += _byte_sum((chunk - ord('0')) * (chunk == digits[at:at + end - begin]))
+        _release(buf, begin, end)
+        _release(buf, at, at + end - begin)
+    return total
+
+
+def _digits_length(path):
+    """Return size of file at <path> without trailing whitespace."""
+    with open(path, 'rb') as f:
+        length = f.seek(0, 2)
+        while length:
+            f.seek(length - 1)
+            if f.read(1) not in b' \t\r\n':
+                break
+            length -= 1
+    return length
+
+
+def _solve_range(path, offset, length, start, stop, chunk_size, backend):
+    solve = captcha_sum_numpy if backend == 'numpy' else captcha_sum
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return solve(buf, offset, length, start, stop, chunk_size=chunk_size)
+
+
+def solve_captcha_file(path, halfway=False, chunk_size=CHUNK_SIZE, processes=1,
+                       backend=None):
+    """Solve captcha in file at <path>, memory-mapping rather than reading it.
+
+    With <processes> above 1 (None for one per CPU), the file is split in
+    that many ranges, each summed by a worker process of its own.  The
+    <backend> is 'numpy' or 'python', by default 'numpy' if it is installed.
+    """
+    length = _digits_length(path)
+    if length == 0:
+        return 0
+    offset = length // 2 if halfway else 1
+
+    if backend is None:
+        backend = 'python' if np is None else 'numpy'
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    bounds = [length * i // processes for i in range(processes + 1)]
+    jobs = [(path, offset, length, start, stop, chunk_size, backend)
+            for start, stop in zip(bounds, bounds[1:])]
+    if processes == 1:
+        return _solve_range(*jobs[0])
+
+    with ProcessPoolExecutor(processes) as pool:
+        return sum(pool.map(_solve_range, *zip(*jobs)))
+
+
+def part1(s):
+    return captcha_sum(s.strip().encode(), 1)
+
 
-assert solve_halfway_captcha("1212") == 6
-assert solve_halfway_captcha("1221") == 0
-assert solve_halfway_captcha("123425") == 4
-assert solve_halfway_captcha("123123") == 12
-assert solve_halfway_captcha("12131415") == 4
+def part2(s):
+    s = s.strip().encode()
+    return captcha_sum(s, len(s) // 2)
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.read().strip()
-        print(solve_doubled_digit_captcha(s))
-        print(solve_halfway_captcha(s))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,71 @@
+import pytest
+
+from .run import (solve_doubled_digit_captcha, solve_halfway_captcha, captcha_sum,
+                  captcha_sum_numpy, solve_captcha_file, part1, part2)
+from .gen import generate
+
+
+def test_doubled_digit_captcha():
+    assert solve_doubled_digit_captcha("1122") == 3
+    assert solve_doubled_digit_captcha("1111") == 4
+    assert solve_doubled_digit_captcha("1234") == 0
+    assert solve_doubled_digit_captcha("91212129") == 9
+
+
+def test_halfway_captcha():
+    assert solve_halfway_captcha("1212") == 6
+    assert solve_halfway_captcha("1221") == 0
+    assert solve_halfway_captcha("123425") == 4
+    assert solve_halfway_captcha("123123") == 12
+    assert solve_halfway_captcha("12131415") == 4
+
+
+def test_captcha_sum():
+    for s in ("1122", "1111", "1234", "91212129", "1212", "1221", "123425", "123123",
+              "12131415", "1", "12", ""):
+        assert part1(s) == captcha_sum(s.encode(), 1) == (solve_doubled_digit_captcha(s) if s else 0)
+        assert part2(s) == captcha_sum(s.encode(), len(s) // 2) == (solve_halfway_captcha(s) if s else 0)
+
+
+def test_solve_captcha_file(tmp_path):
+    s = generate(10007, seed=2)
+    path = tmp_path / "input"
+    path.write_text(s)
+
+    # Chunks much smaller than the input, so partners wrap around mid-chunk.
+    for chunk_size in (1, 13, 1000, 1 << 20):
+        assert solve_captcha_file(path, chunk_size=chunk_size) == part1(s)
+        assert solve_captcha_file(path, halfway=True, chunk_size=chunk_size) == part2(s)
+    assert part1(s) == solve_doubled_digit_captcha(s.strip())
+    assert part2(s) == solve_halfway_captcha(s.strip())
+
+    assert solve_captcha_file(path, backend='python', processes=3) == part1(s)
+    assert solve_captcha_file(path, halfway=True, backend='python', processes=3) == part2(s)
+
+    path.write_text("")
+    assert solve_captcha_file(path) == 0
+
+
+def test_captcha_sum_numpy(tmp_path):
+    pytest.importorskip('numpy')
+    for s in ("1122", "1111", "1234", "91212129", "1212", "123425", "12131415", "1", ""):
+        b = s.encode()
+        assert captcha_sum_numpy(b, 1) == captcha_sum(b, 1)
+        assert captcha_sum_numpy(b, len(b) // 2) == captcha_sum(b, len(b) // 2)
+
+    s = generate(10007, seed=3)
+    path = tmp_path / "input"
+    path.write_text(s)
+    for chunk_size in (13, 1 << 20):
+        for processes in (1, 3):
+            assert solve_captcha_file(path, backend='numpy', chunk_size=chunk_size,
+                                      processes=processes) == part1(s)
+            assert solve_captcha_file(path, halfway=True, backend='numpy',
+                                      chunk_size=chunk_size, processes=processes) == part2(s)
+
+
+def test_generate():
+    s = generate(1000, seed=1)
+    assert s == generate(1000, seed=1)
+    assert len(s.strip()) == 1000 and s.strip().isdigit()
+    assert solve_doubled_digit_captcha(s.strip()) >= 0
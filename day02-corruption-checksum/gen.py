@@ -0,0 +1,22 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0, width=16):
+    """Return a spreadsheet of <size> rows, <width> cells each.
+
+    Cells of a row are drawn from [lo, 2*lo), where none divides another,
+    and one multiple of a random cell is planted in each row.
+    """
+    rng = random.Random(seed)
+    lo = max(100, width)
+    rows = []
+
+    for _ in range(size):
+        row = rng.sample(range(lo, 2 * lo), width - 1)
+        row.append(rng.choice(row) * rng.randint(2, 9))
+        rng.shuffle(row)
+        rows.append('\t'.join(map(str, row)))
+
+    return '\n'.join(rows) + '\n'
@@ -1,5 +1,13 @@
 #!/usr/bin/env python3
 
+from array import array
+from collections import Counter
+from functools import lru_cache
+from math import isqrt
+
+# Rows up to this many cells are checked pair by pair.
+PAIRWISE_MAX = 32
+
 
 def row_min_max_checksum(s):
     nums = [int(n) for n in s.split()]
@@ -7,7 +15,36 @@ def row_min_max_checksum(s):
 
 
 def row_evenly_divisible_checksum(s):
-    nums = sorted([int(n) for n in s.split()])
+    return divisible_quotient([int(n) for n in s.split()])
+
+
+def divisible_quotient(nums):
+    """Return b // a for the smallest a dividing a larger or equal b in <nums>.
+
+    Of the multiples of that a, the smallest b is used; 0 if there is no
+    such pair.  Wide rows of positive numbers either check every pair, walk
+    the multiples of each number, or enumerate divisors of each number,
+    whichever the row's values make cheapest.
+    """
+    if len(nums) <= PAIRWISE_MAX or min(nums) <= 0:
+        return _pairwise_quotient(sorted(nums))
+
+    counts = Counter(nums)
+    values = sorted(counts)
+    largest = values[-1]
+
+    pairwise_cost = len(nums) ** 2 // 2
+    walk_cost = sum(largest // a for a in values)
+    divisors_cost = len(values) * isqrt(largest)
+    cheapest = min(pairwise_cost, walk_cost, divisors_cost)
+    if cheapest == pairwise_cost:
+        return _pairwise_quotient(sorted(nums))
+    if cheapest == walk_cost:
+        return _walk_multiples(values, counts)
+    return _enumerate_divisors(values, counts)
+
+
+def _pairwise_quotient(nums):
     for i in range(len(nums)):
         for j in range(i+1, len(nums)):
             if nums[j] % nums[i] == 0:
@@ -15,49 +52,123 @@ def row_evenly_divisible_checksum(s):
     return 0
 
 
+def _walk_multiples(values, counts):
+    largest = values[-1]
+    for a in values:
+        if counts[a] > 1:
+            return 1
+        for b in range(2 * a, largest + 1, a):
+            if b in counts:
+                return b // a
+    return 0
+
+
+def _enumerate_divisors(values, counts):
+    pairs = [(b, b) for b in values if counts[b] > 1]
+    for b in values:
+        for d in range(1, isqrt(b) + 1):
+            if b % d == 0:
+                pairs.extend((a, b) for a in (d, b // d) if a < b and a in counts)
+
+    if not pairs:
+        return 0
+    a, b = min(pairs)
+    return b // a
+
+
 def spreadsheet_checksum(spr, checksum):
     return sum(checksum(row) for row in spr)
 
 
-assert row_min_max_checksum('5 1 9 5') == 8
-assert row_min_max_checksum('7 5 3') == 4
-assert row_min_max_checksum('2 4 6 8') == 6
-assert row_min_max_checksum('2\t4\t6\t8') == 6
-assert row_min_max_checksum('') == 0
-
-assert row_evenly_divisible_checksum('5 9 2 8') == 4
-assert row_evenly_divisible_checksum('9 4 7 3') == 3
-assert row_evenly_divisible_checksum('3 8 6 5') == 2
-assert row_evenly_divisible_checksum('') == 0
-
-test_case = """
-5 1 9 5
-"""
-expected = 8
-assert spreadsheet_checksum(
-    test_case.split('\n'), checksum=row_min_max_checksum) == expected
-
-test_case = """
-5 1 9 5
-7 5 3
-2 4 6 8
-"""
-expected = 18
-assert spreadsheet_checksum(
-    test_case.split('\n'), checksum=row_min_max_checksum) == expected
-
-test_case = """
-5 9 2 8
-9 4 7 3
-3 8 6 5
-"""
-expected = 9
-assert spreadsheet_checksum(
-    test_case.split('\n'), checksum=row_evenly_divisible_checksum) == expected
+def row_checksums(nums):
+    """Return min/max and evenly divisible checksums of row <nums>."""
+    if not nums:
+        return 0, 0
+    return max(nums) - min(nums), divisible_quotient(nums)
+
+
+def sum_checksums(rows):
+    """Return both checksums of spreadsheet <rows>, in one pass over them."""
+    min_max = divisible = 0
+    for nums in rows:
+        a, b = row_checksums(nums)
+        min_max += a
+        divisible += b
+    return min_max, divisible
+
+
+class Spreadsheet:
+    """Spreadsheet parsed once, all cells in one array and rows by offsets.
+
+    Cells are 64-bit, unless a row holds a bigger one: then they are kept
+    in a list instead.  Each checksum is computed when first asked for.
+    """
+
+    def __init__(self):
+        self.cells = array('q')
+        self.offsets = array('q', [0])
+        self._min_max = self._divisible = None
+
+    @classmethod
+    def parse(cls, lines):
+        sheet = cls()
+        for line in lines:
+            sheet.add_row(int(n) for n in line.split())
+        return sheet
+
+    def add_row(self, nums):
+        nums = list(nums)
+        try:
+            self.cells.extend(nums)
+        except OverflowError:
+            self.cells = list(self.cells[:self.offsets[-1]])
+            self.cells.extend(nums)
+        if len(self.cells) > self.offsets[-1]:
+            self.offsets.append(len(self.cells))
+        self._min_max = self._divisible = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        cells, offsets = self.cells, self.offsets
+        for i in range(len(self)):
+            yield cells[offsets[i]:offsets[i + 1]]
+
+    def min_max_checksum(self):
+        if self._min_max is None:
+            self._min_max = sum(max(nums) - min(nums) for nums in self)
+        return self._min_max
+
+    def divisible_checksum(self):
+        if self._divisible is None:
+            self._divisible = sum(divisible_quotient(nums) for nums in self)
+        return self._divisible
+
+    def checksums(self):
+        return self.min_max_checksum(), self.divisible_checksum()
+
+
+def stream_checksums(lines):
+    """Return both checksums of <lines>, e.g. a file, parsing a row at a time."""
+    return sum_checksums([int(n) for n in line.split()] for line in lines)
+
+
+@lru_cache(maxsize=1)
+def parse(s):
+    """Return input <s> as a Spreadsheet, parsing it once for both parts."""
+    return Spreadsheet.parse(s.split('\n'))
+
+
+def part1(s):
+    return parse(s).min_max_checksum()
+
+
+def part2(s):
+    return parse(s).divisible_checksum()
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.readlines()
-        print(spreadsheet_checksum(s, checksum=row_min_max_checksum))
-        print(spreadsheet_checksum(s, checksum=row_evenly_divisible_checksum))
+        for checksum in stream_checksums(f):
+            print(checksum)
@@ -0,0 +1,121 @@
+import io
+import random
+
+from .run import (row_min_max_checksum, row_evenly_divisible_checksum, spreadsheet_checksum,
+                  divisible_quotient, Spreadsheet, stream_checksums, part1, part2,
+                  _pairwise_quotient, _walk_multiples, _enumerate_divisors)
+from .gen import generate
+
+
+def test_row_min_max_checksum():
+    assert row_min_max_checksum('5 1 9 5') == 8
+    assert row_min_max_checksum('7 5 3') == 4
+    assert row_min_max_checksum('2 4 6 8') == 6
+    assert row_min_max_checksum('2\t4\t6\t8') == 6
+    assert row_min_max_checksum('') == 0
+
+
+def test_row_evenly_divisible_checksum():
+    assert row_evenly_divisible_checksum('5 9 2 8') == 4
+    assert row_evenly_divisible_checksum('9 4 7 3') == 3
+    assert row_evenly_divisible_checksum('3 8 6 5') == 2
+    assert row_evenly_divisible_checksum('') == 0
+
+
+def test_divisible_quotient():
+    rng = random.Random(1)
+    for _ in range(300):
+        width = rng.choice((2, 5, 40, 200))
+        top = rng.choice((10, 1000, 10**6))
+        nums = [rng.randint(1, top) for _ in range(width)]
+        if rng.random() < 0.3:
+            nums = [n for n in nums if n > top // 2]    # often no pair at all
+        expected = _pairwise_quotient(sorted(nums))
+        assert divisible_quotient(nums) == expected, nums
+
+        if nums:
+            counts = {n: nums.count(n) for n in nums}
+            values = sorted(counts)
+            assert _walk_multiples(values, counts) == expected
+            assert _enumerate_divisors(values, counts) == expected
+
+    for _ in range(100):    # a few small values among huge ones
+        width = rng.choice((40, 200))
+        nums = [rng.randint(10**12, 2 * 10**12) for _ in range(width)]
+        for i in rng.sample(range(width), rng.randint(1, 3)):
+            nums[i] = rng.randint(2, 20)
+        assert divisible_quotient(nums) == _pairwise_quotient(sorted(nums)), nums
+
+    assert divisible_quotient([7] * 40) == 1
+    assert divisible_quotient(list(range(101, 141))) == 0
+    nums = [-4] + list(range(101, 141))
+    assert divisible_quotient(nums) == _pairwise_quotient(sorted(nums)) == -26
+
+
+def test_spreadsheet_checksum():
+    test_case = """
+5 1 9 5
+"""
+    expected = 8
+    assert spreadsheet_checksum(
+        test_case.split('\n'), checksum=row_min_max_checksum) == expected
+
+    test_case = """
+5 1 9 5
+7 5 3
+2 4 6 8
+"""
+    expected = 18
+    assert spreadsheet_checksum(
+        test_case.split('\n'), checksum=row_min_max_checksum) == expected
+
+    test_case = """
+5 9 2 8
+9 4 7 3
+3 8 6 5
+"""
+    expected = 9
+    assert spreadsheet_checksum(
+        test_case.split('\n'), checksum=row_evenly_divisible_checksum) == expected
+
+
+def test_spreadsheet():
+    sheet = Spreadsheet.parse("""
+5 9 2 8
+9 4 7 3
+
+3 8 6 5
+""".split('\n'))
+    assert len(sheet) == 3
+    assert [list(row) for row in sheet] == [[5, 9, 2, 8], [9, 4, 7, 3], [3, 8, 6, 5]]
+    assert sheet.checksums() == (7 + 6 + 5, 9)
+
+    sheet.add_row([2 ** 70, 2 ** 64, 3])    # too big for 64 bits
+    assert [list(row) for row in sheet][-2:] == [[3, 8, 6, 5], [2 ** 70, 2 ** 64, 3]]
+    assert sheet.checksums() == (7 + 6 + 5 + 2 ** 70 - 3, 9 + 64)
+    assert part1('5 1 9 5\n7 5 3\n2 4 6 8\n') == 18
+    assert part2('5 9 2 8\n9 4 7 3\n3 8 6 5\n') == 9
+
+
+def test_stream_checksums(tmp_path):
+    s = generate(50, seed=2, width=40)
+    rows = s.split('\n')
+    expected = (spreadsheet_checksum(rows, row_min_max_checksum),
+                spreadsheet_checksum(rows, row_evenly_divisible_checksum))
+
+    assert Spreadsheet.parse(rows).checksums() == expected
+    assert stream_checksums(io.StringIO(s)) == expected
+
+    path = tmp_path / "input"
+    path.write_text(s)
+    with open(path) as f:
+        assert stream_checksums(f) == expected
+
+
+def test_generate():
+    s = generate(10, seed=1, width=8)
+    assert s == generate(10, seed=1, width=8)
+    rows = s.strip().split('\n')
+    assert len(rows) == 10
+    assert all(len(row.split()) == 8 for row in rows)
+    assert all(row_evenly_divisible_checksum(row) > 1 for row in rows)
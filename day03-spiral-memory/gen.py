@@ -0,0 +1,9 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0):
+    """Return a spiral square number between <size> and 2 * <size>."""
+    rng = random.Random(seed)
+    return '%d\n' % rng.randrange(max(size, 1), 2 * max(size, 1))
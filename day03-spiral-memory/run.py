@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 
-from collections import defaultdict
+from itertools import count
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def distances_to_center():
@@ -28,11 +34,33 @@ def distances_to_center():
 
 
 def distance_to_center(n):
-    """Return Manhattan distance to center of spiral of length <n>."""
-    dist = distances_to_center()
-    for _ in range(n - 1):
-        next(dist)
-    return next(dist)
+    """Return Manhattan distance to center of spiral of length <n>.
+
+    Ring <k> around the center holds numbers up to (2k + 1)^2, in four
+    sides of 2k numbers each; a side is closest to the center at its middle.
+    """
+    if n == 1:
+        return 0
+    ring = (isqrt(n - 1) + 1) // 2
+    offset = (n - (2 * ring - 1) ** 2 - 1) % (2 * ring)
+    return ring + abs(offset - (ring - 1))
+
+
+def distances_to_center_many(ns):
+    """Return distances to center of all <ns>.
+
+    A NumPy integer array gets an array back, computed without a Python
+    loop; anything else a list.
+    """
+    if np is not None and isinstance(ns, np.ndarray) and ns.dtype.kind in 'iu':
+        m = ns.astype(np.int64) - 1
+        root = np.floor(np.sqrt(m.astype(np.float64))).astype(np.int64)
+        root -= root * root > m                 # undo float rounding
+        root += (root + 1) * (root + 1) <= m
+        ring = (root + 1) // 2
+        offset = (m - (2 * ring - 1) ** 2) % np.maximum(2 * ring, 1)
+        return np.where(m == 0, 0, ring + np.abs(offset - (ring - 1)))
+    return [distance_to_center(n) for n in ns]
 
 
 def unwind(g, num):
@@ -40,34 +68,6 @@ def unwind(g, num):
     return [next(g) for _ in range(num)]
 
 
-# print(unwind(distances_to_center(), 50))
-
-assert distance_to_center(1) == 0
-assert distance_to_center(2) == 1
-assert distance_to_center(3) == 2
-assert distance_to_center(4) == 1
-assert distance_to_center(5) == 2
-assert distance_to_center(6) == 1
-assert distance_to_center(7) == 2
-assert distance_to_center(8) == 1
-assert distance_to_center(9) == 2
-assert distance_to_center(10) == 3
-assert distance_to_center(11) == 2
-assert distance_to_center(12) == 3
-assert distance_to_center(13) == 4
-assert distance_to_center(14) == 3
-assert distance_to_center(15) == 2
-assert distance_to_center(23) == 2
-assert distance_to_center(1024) == 31
-
-
-spiral_length = 277678
-print(distance_to_center(spiral_length))
-
-
-# -------------------------------------
-
-
 def neighbourhood(p):
     """Returns 9 points belonging to neighbourhood of point <p>."""
     x, y = p
@@ -129,70 +129,119 @@ def spiral_points(start_pos):
             movements = next(run)
 
 
+def spiral_index(x, y):
+    """Return spiral number at point (<x>, <y>), the center being 1."""
+    ring = max(abs(x), abs(y))
+    if ring == 0:
+        return 1
+    start = (2 * ring - 1) ** 2
+    if x == ring and y > -ring:
+        return start + y + ring
+    if y == ring:
+        return start + 3 * ring - x
+    if x == -ring:
+        return start + 5 * ring - y
+    return start + 7 * ring + x
+
+
+class SpiralGrid:
+    """Neighbour sums of the spiral, in a flat list of cells.
+
+    The cells are a square around the center with a border of zeros, so
+    the eight neighbours of a cell are at fixed offsets from it.  The
+    square is reallocated twice as large when the spiral reaches the border.
+    """
+
+    def __init__(self, radius=8):
+        self.values = [1]           # by spiral number, starting at 1
+        self._cells = None
+        self._allocate(radius)
+        self._pos = self._center
+        self._cells[self._pos] = 1
+
+    def _allocate(self, radius):
+        width = 2 * radius + 3
+        cells = [0] * (width * width)
+
+        if self._cells is not None:
+            old = self._width
+            shift = (width - old) // 2
+            for row in range(old):
+                at = (row + shift) * width + shift
+                cells[at:at + old] = self._cells[row * old:(row + 1) * old]
+            row, col = divmod(self._pos, old)
+            self._pos = (row + shift) * width + col + shift
+
+        self._cells = cells
+        self._width = width
+        self._radius = radius
+        self._center = (radius + 1) * (width + 1)
+        self._steps = (1, width, -1, -width)    # RIGHT, UP, LEFT, DOWN
+
+    def _extend(self, n):
+        """Compute values up to the end of the ring of spiral number <n>."""
+        values = self.values
+        n = (2 * ((isqrt(n - 1) + 1) // 2) + 1) ** 2
+        while len(values) < n:
+            done = len(values)
+            ring = (isqrt(done) + 1) // 2
+            if ring > self._radius:
+                self._allocate(2 * self._radius)
+
+            # Steps around the ring: one right, then up, left, down and right.
+            right, up, left, down = self._steps
+            side = 2 * ring
+            steps = [right] + [up] * (side - 1) + [left] * side + [down] * side + [right] * side
+
+            cells, w, pos = self._cells, self._width, self._pos
+            for step in steps[done - (2 * ring - 1) ** 2:]:
+                pos += step
+                value = (cells[pos - w - 1] + cells[pos - w] + cells[pos - w + 1] +
+                         cells[pos - 1] + cells[pos + 1] +
+                         cells[pos + w - 1] + cells[pos + w] + cells[pos + w + 1])
+                cells[pos] = value
+                values.append(value)
+            self._pos = pos
+
+    def __iter__(self):
+        for n in count(1):
+            if n > len(self.values):
+                self._extend(n)
+            yield self.values[n - 1]
+
+    def value(self, n):
+        """Return value written at spiral number <n>."""
+        if n > len(self.values):
+            self._extend(n)
+        return self.values[n - 1]
+
+    def value_at(self, x, y):
+        """Return value written at point (<x>, <y>)."""
+        return self.value(spiral_index(x, y))
+
+    def first_above(self, threshold):
+        """Return first value written that is larger than <threshold>."""
+        return next(v for v in self if v > threshold)
+
+
 def neighbour_sums():
     """Walks through the spiral, generating sums out of neighbouring points."""
-    value_map = defaultdict(int)
-    spiral_pos = spiral_points((0, 0))
+    yield from SpiralGrid()
 
-    pos = next(spiral_pos)
-    value_map[pos] = 1
 
-    while True:
-        value_map[pos] = sum(value_map[p] for p in neighbourhood(pos))
-        yield value_map[pos]
-        pos = next(spiral_pos)
-
-
-actual = neighbourhood((0, 0))
-expected = [(0, 0), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
-assert actual == expected
-
-
-def assert_next(iter, expected):
-    actual = next(iter)
-    assert actual == expected, "expected %s, got %s" % (expected, actual)
-
-
-run = runs()
-assert_next(run, 1)
-assert_next(run, 1)
-assert_next(run, 2)
-assert_next(run, 2)
-assert_next(run, 3)
-
-pts = spiral_points((0, 0))
-assert_next(pts, (+0, +0))
-assert_next(pts, (+1, +0))
-assert_next(pts, (+1, +1))
-assert_next(pts, (+0, +1))
-assert_next(pts, (-1, +1))
-assert_next(pts, (-1, +0))
-assert_next(pts, (-1, -1))
-assert_next(pts, (+0, -1))
-assert_next(pts, (+1, -1))
-assert_next(pts, (+2, -1))
-assert_next(pts, (+2, +0))
-assert_next(pts, (+2, +1))
-assert_next(pts, (+2, +2))
-
-sums = neighbour_sums()
-assert_next(sums, 1)
-assert_next(sums, 1)
-assert_next(sums, 2)
-assert_next(sums, 4)
-assert_next(sums, 5)
-assert_next(sums, 10)
-assert_next(sums, 11)
-assert_next(sums, 23)
-assert_next(sums, 25)
-assert_next(sums, 26)
+def puzzle(spiral_length):
+    return SpiralGrid().first_above(spiral_length)
 
 
-def puzzle(spiral_length):
-    for s in neighbour_sums():
-        if s > spiral_length:
-            return s
+def part1(s):
+    return distance_to_center(int(s))
+
+
+def part2(s):
+    return puzzle(int(s))
 
 
-spiral_length = 277678
-print(puzzle(spiral_length))
+if __name__ == '__main__':
+    inp = '277678'
+    print(part1(inp))
+    print(part2(inp))
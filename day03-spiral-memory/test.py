@@ -0,0 +1,134 @@
+import pytest
+
+from .run import (distances_to_center, distance_to_center, distances_to_center_many,
+                  neighbourhood, runs, spiral_points, neighbour_sums, spiral_index,
+                  SpiralGrid, puzzle)
+from .gen import generate
+
+
+def assert_next(iter, expected):
+    actual = next(iter)
+    assert actual == expected, "expected %s, got %s" % (expected, actual)
+
+
+def test_distance_to_center():
+    assert distance_to_center(1) == 0
+    assert distance_to_center(2) == 1
+    assert distance_to_center(3) == 2
+    assert distance_to_center(4) == 1
+    assert distance_to_center(5) == 2
+    assert distance_to_center(6) == 1
+    assert distance_to_center(7) == 2
+    assert distance_to_center(8) == 1
+    assert distance_to_center(9) == 2
+    assert distance_to_center(10) == 3
+    assert distance_to_center(11) == 2
+    assert distance_to_center(12) == 3
+    assert distance_to_center(13) == 4
+    assert distance_to_center(14) == 3
+    assert distance_to_center(15) == 2
+    assert distance_to_center(23) == 2
+    assert distance_to_center(1024) == 31
+
+
+def test_distance_to_center_matches_walk():
+    dist = distances_to_center()
+    for n in range(1, 10000):
+        assert distance_to_center(n) == next(dist), n
+
+
+def test_distance_to_center_large():
+    # Last number of ring k is (2k + 1)^2, at a corner, 2k steps away.
+    k = 10**30
+    assert distance_to_center((2 * k + 1) ** 2) == 2 * k
+    assert distance_to_center((2 * k + 1) ** 2 + 1) == 2 * k + 1
+    assert distance_to_center((2 * k + 1) ** 2 - k) == k
+
+
+def test_distances_to_center_many():
+    ns = [int(generate(size, seed=seed)) for size in (1, 10, 10**6, 10**12) for seed in range(5)]
+    assert distances_to_center_many(ns) == [distance_to_center(n) for n in ns]
+
+
+def test_distances_to_center_many_numpy():
+    np = pytest.importorskip('numpy')
+    ns = np.array([1, 2, 9, 10, 1024] + [(2 * k + 1) ** 2 + d for k in (10**4, 10**9)
+                                          for d in (-1, 0, 1)], dtype=np.int64)
+    assert distances_to_center_many(ns).tolist() == [distance_to_center(int(n)) for n in ns]
+
+    ns = np.arange(1, 10**5)
+    assert distances_to_center_many(ns).tolist() == distances_to_center_many(ns.tolist())
+
+
+def test_neighbourhood():
+    actual = neighbourhood((0, 0))
+    expected = [(0, 0), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+    assert actual == expected
+
+
+def test_runs():
+    run = runs()
+    assert_next(run, 1)
+    assert_next(run, 1)
+    assert_next(run, 2)
+    assert_next(run, 2)
+    assert_next(run, 3)
+
+
+def test_spiral_points():
+    pts = spiral_points((0, 0))
+    assert_next(pts, (+0, +0))
+    assert_next(pts, (+1, +0))
+    assert_next(pts, (+1, +1))
+    assert_next(pts, (+0, +1))
+    assert_next(pts, (-1, +1))
+    assert_next(pts, (-1, +0))
+    assert_next(pts, (-1, -1))
+    assert_next(pts, (+0, -1))
+    assert_next(pts, (+1, -1))
+    assert_next(pts, (+2, -1))
+    assert_next(pts, (+2, +0))
+    assert_next(pts, (+2, +1))
+    assert_next(pts, (+2, +2))
+
+
+def test_neighbour_sums():
+    sums = neighbour_sums()
+    assert_next(sums, 1)
+    assert_next(sums, 1)
+    assert_next(sums, 2)
+    assert_next(sums, 4)
+    assert_next(sums, 5)
+    assert_next(sums, 10)
+    assert_next(sums, 11)
+    assert_next(sums, 23)
+    assert_next(sums, 25)
+    assert_next(sums, 26)
+
+
+def test_spiral_index():
+    pts = spiral_points((0, 0))
+    for n in range(1, 1000):
+        assert spiral_index(*next(pts)) == n
+
+
+def test_spiral_grid():
+    # Same sums over a dict of points, as neighbour_sums did before.
+    grid = SpiralGrid(radius=1)
+    values = {}
+    for n, p in zip(range(1, 2000), spiral_points((0, 0))):
+        values[p] = sum(values.get(q, 0) for q in neighbourhood(p)) or 1
+        assert grid.value(n) == values[p]
+    assert all(grid.value_at(x, y) == v for (x, y), v in values.items())
+
+
+def test_puzzle():
+    assert puzzle(1) == 2
+    assert puzzle(747) == 806
+    assert puzzle(10**100) > 10**100
+
+
+def test_generate():
+    s = generate(1000, seed=1)
+    assert s == generate(1000, seed=1)
+    assert 1000 <= int(s) < 2000
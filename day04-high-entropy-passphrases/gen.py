@@ -0,0 +1,28 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from string import ascii_lowercase
+
+
+def generate(size, seed=0):
+    """Return <size> passphrases, some with repeated words or anagrams."""
+    rng = random.Random(seed)
+    lines = []
+
+    for _ in range(size):
+        words = [''.join(rng.choices(ascii_lowercase, k=rng.randint(2, 7)))
+                 for _ in range(rng.randint(5, 10))]
+
+        dice = rng.random()
+        if dice < 0.2:
+            words.append(rng.choice(words))
+        elif dice < 0.4:
+            word = list(rng.choice(words))
+            rng.shuffle(word)
+            words.append(''.join(word))
+        rng.shuffle(words)
+
+        lines.append(' '.join(words))
+
+    return '\n'.join(lines) + '\n'
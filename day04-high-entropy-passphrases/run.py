@@ -1,5 +1,40 @@
 #!/usr/bin/env python3
 
+import os
+import time
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from string import ascii_lowercase
+
+# Letter counts of a word packed in an int, COUNTER_BITS per letter.
+COUNTER_BITS = 8
+LETTER_WEIGHTS = {c: 1 << (COUNTER_BITS * i) for i, c in enumerate(ascii_lowercase)}
+
+# Passphrase policies by name.  A passphrase is valid under a policy if no
+# two of its words have the same key, as made by the policy's canonicalizer
+# (None for the words themselves).
+POLICIES = {'no-repeats': None}
+
+# Passphrases with fewer words are checked for collisions all at once,
+# which is faster for them than stopping at the first one.
+EARLY_EXIT_WORDS = 16
+
+PolicyCount = namedtuple('PolicyCount', 'name valid seconds')
+
+# Result of an audit: time <shared> by all policies is that of splitting
+# lines into words and looking for repeats.
+Audit = namedtuple('Audit', 'lines seconds shared policies')
+
+
+def policy(name):
+    """Register decorated function as canonicalizer of policy <name>."""
+    def register(canonical):
+        POLICIES[name] = canonical
+        return canonical
+    return register
+
 
 def validate_no_repeated(passphrase):
     words = passphrase.strip().split()
@@ -11,22 +46,178 @@ def validate_no_anagrams(passphrase):
     return len(set(words)) == len(words)
 
 
-assert validate_no_repeated("aa bb cc dd ee")
-assert validate_no_repeated("aa bb cc dd aaa")
-assert not validate_no_repeated("aa bb cc dd aa")
+@policy('no-anagrams')
+def anagram_key(word):
+    """Return a key that is equal for anagrams of <word> only.
+
+    That is its letter counts packed in an int, or for words too long for
+    the counters or with other characters, its sorted letters.
+    """
+    if len(word) < 1 << COUNTER_BITS:
+        try:
+            return sum(map(LETTER_WEIGHTS.__getitem__, word))
+        except KeyError:
+            pass
+    return ''.join(sorted(word))
+
+
+def validate_passphrase(passphrase):
+    """Return whether <passphrase> has no repeated words, and no anagrams."""
+    words = passphrase.split()
+    if len(set(words)) != len(words):
+        return False, False     # repeated words are anagrams, too
+
+    if len(passphrase) < 1 << COUNTER_BITS:
+        try:
+            weight = LETTER_WEIGHTS.__getitem__
+            return True, len({sum(map(weight, word)) for word in words}) == len(words)
+        except KeyError:
+            pass
+    return True, len(set(map(anagram_key, words))) == len(words)
+
+
+def has_collision(words, canonical=None):
+    """Return whether two of <words> have the same key under <canonical>."""
+    keys = words if canonical is None else map(canonical, words)
+    if len(words) < EARLY_EXIT_WORDS:
+        return len(set(keys)) != len(words)
+
+    seen = set()
+    for key in keys:
+        if key in seen:
+            return True
+        seen.add(key)
+    return False
+
+
+def audit(passphrases, policies=None, block_size=4096):
+    """Count <passphrases> valid under each of <policies> (default: all).
+
+    Lines are split into words once, in blocks of <block_size>, for all
+    policies.  Words repeated in a line collide under any canonicalizer, so
+    only lines without repeats are checked further.
+    """
+    names = list(POLICIES) if policies is None else list(policies)
+    unknown = [name for name in names if name not in POLICIES]
+    if unknown:
+        raise ValueError('No such policy: %s' % ', '.join(unknown))
+    canonicals = [POLICIES[name] for name in names]
+
+    valid = [0] * len(names)
+    seconds = [0.0] * len(names)
+    lines = shared = 0
+    start = time.perf_counter()
+
+    passphrases = iter(passphrases)
+    while True:
+        block = list(islice(passphrases, block_size))
+        if not block:
+            break
+        lines += len(block)
+
+        t = time.perf_counter()
+        distinct = [words for words in map(str.split, block) if not has_collision(words)]
+        shared += time.perf_counter() - t
+
+        for i, canonical in enumerate(canonicals):
+            t = time.perf_counter()
+            if canonical is None:
+                valid[i] += len(distinct)
+            else:
+                valid[i] += sum(not has_collision(words, canonical) for words in distinct)
+            seconds[i] += time.perf_counter() - t
+
+    return Audit(lines, time.perf_counter() - start, shared,
+                 [PolicyCount(*p) for p in zip(names, valid, seconds)])
+
+
+def format_audit(audit):
+    """Format counts and throughput of each policy of <audit>."""
+    lines = ['%d passphrases in %.3fs, %.0f lines/s' % (
+        audit.lines, audit.seconds, audit.lines / audit.seconds if audit.seconds else 0)]
+    for p in audit.policies:
+        elapsed = audit.shared + p.seconds
+        lines.append('%-16s %10d valid  %12.0f lines/s' % (
+            p.name, p.valid, audit.lines / elapsed if elapsed else 0))
+    return '\n'.join(lines)
+
+
+def count_valid(passphrases):
+    """Return numbers of <passphrases> valid under either policy, in one pass.
+
+    Same as the counts of an audit() with both, but faster for having the
+    anagram keys inlined.
+    """
+    no_repeated = no_anagrams = 0
+    for passphrase in passphrases:
+        a, b = validate_passphrase(passphrase)
+        no_repeated += a
+        no_anagrams += b
+    return no_repeated, no_anagrams
+
+
+def _count_valid_range(path, start, end, block_size=1 << 20):
+    # Count lines starting from byte <start> up to <end>; a line that
+    # straddles <start> belongs to the previous range.
+    no_repeated = no_anagrams = 0
+
+    def count(lines):
+        nonlocal no_repeated, no_anagrams
+        a, b = count_valid(lines)
+        no_repeated += a
+        no_anagrams += b
+
+    with open(path, 'rb') as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+
+        rest = b''
+        while pos < end:
+            block = f.read(min(block_size, end - pos))
+            if not block:
+                break
+            pos += len(block)
+            data = rest + block
+            cut = data.rfind(b'\n') + 1
+            rest = data[cut:]
+            count(data[:cut].decode().split('\n')[:-1])
+
+        if rest:
+            rest += f.readline()    # it started before <end>
+            count([rest.decode()])
+
+    return no_repeated, no_anagrams
+
+
+def count_valid_file(path, processes=1):
+    """Return count_valid() of passphrase file at <path>, streaming it.
+
+    With <processes> above 1 (None for one per CPU), the file is split in
+    byte ranges, each counted by a worker process of its own.
+    """
+    size = os.path.getsize(path)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1:
+        return _count_valid_range(path, 0, size)
+
+    bounds = [size * i // processes for i in range(processes + 1)]
+    with ProcessPoolExecutor(processes) as pool:
+        counts = list(pool.map(_count_valid_range, [path] * processes, bounds, bounds[1:]))
+    return tuple(map(sum, zip(*counts)))
+
+
+def part1(s):
+    return sum(validate_no_repeated(passphrase) for passphrase in s.strip().split('\n'))
+
 
-assert validate_no_anagrams("aa bb cc dd ee")
-assert validate_no_anagrams("aa bb cc dd aaa")
-assert validate_no_anagrams("abcde fghij")
-assert validate_no_anagrams("a ab abc abd abf abj")
-assert validate_no_anagrams("iiii oiii ooii oooi oooo")
-assert not validate_no_anagrams("aa bb cc dd aa")
-assert not validate_no_anagrams("abcde xyz ecdab")
-assert not validate_no_anagrams("oiii ioii iioi iiio")
+def part2(s):
+    _, no_anagrams = count_valid(s.strip().split('\n'))
+    return no_anagrams
 
 
 if __name__ == '__main__':
-    with open('input') as f:
-        lines = f.readlines()
-        print(sum(validate_no_repeated(passphrase) for passphrase in lines))
-        print(sum(validate_no_anagrams(passphrase) for passphrase in lines))
+    for count in count_valid_file('input'):
+        print(count)
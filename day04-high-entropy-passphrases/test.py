@@ -0,0 +1,95 @@
+from .run import (validate_no_repeated, validate_no_anagrams, anagram_key, validate_passphrase,
+                  count_valid, count_valid_file, part1, part2, POLICIES, has_collision, audit,
+                  format_audit)
+from .gen import generate
+
+
+def test_validate_no_repeated():
+    assert validate_no_repeated("aa bb cc dd ee")
+    assert validate_no_repeated("aa bb cc dd aaa")
+    assert not validate_no_repeated("aa bb cc dd aa")
+
+
+def test_validate_no_anagrams():
+    assert validate_no_anagrams("aa bb cc dd ee")
+    assert validate_no_anagrams("aa bb cc dd aaa")
+    assert validate_no_anagrams("abcde fghij")
+    assert validate_no_anagrams("a ab abc abd abf abj")
+    assert validate_no_anagrams("iiii oiii ooii oooi oooo")
+    assert not validate_no_anagrams("aa bb cc dd aa")
+    assert not validate_no_anagrams("abcde xyz ecdab")
+    assert not validate_no_anagrams("oiii ioii iioi iiio")
+
+
+def test_anagram_key():
+    assert anagram_key('abc') == anagram_key('cab') != anagram_key('abd')
+    assert anagram_key('a' * 255) != anagram_key('b' * 255)
+    assert anagram_key('a' * 256) == 'a' * 256
+    assert anagram_key('Ab1') == anagram_key('1bA') == '1Ab'
+
+
+def test_validate_passphrase():
+    for passphrase in ("aa bb cc dd ee", "aa bb cc dd aa", "abcde xyz ecdab",
+                       "iiii oiii ooii oooi oooo", "oiii ioii iioi iiio", ""):
+        assert validate_passphrase(passphrase) == (validate_no_repeated(passphrase),
+                                                   validate_no_anagrams(passphrase))
+
+
+def test_count_valid_file(tmp_path):
+    s = generate(1000, seed=2)
+    lines = s.strip().split('\n')
+    expected = (sum(map(validate_no_repeated, lines)), sum(map(validate_no_anagrams, lines)))
+    assert count_valid(lines) == (part1(s), part2(s)) == expected
+
+    path = tmp_path / "input"
+    path.write_text(s)
+    for processes in (1, 2, 7):
+        assert count_valid_file(path, processes=processes) == expected
+
+    # Ranges that start exactly at, or right after, a line start.
+    path.write_text("a b\nc c\n")
+    for processes in (1, 2, 3, 4, 8):
+        assert count_valid_file(path, processes=processes) == (1, 1)
+
+
+def test_has_collision():
+    assert not has_collision([])
+    assert has_collision(['a', 'b', 'a'])
+    assert not has_collision(['ab', 'ba'])
+    assert has_collision(['ab', 'ba'], anagram_key)
+
+    # Long enough to stop at the first collision.
+    words = ['a', 'a'] + ['x' * n for n in range(1, 100)]
+    keys = []
+    assert has_collision(words, lambda w: keys.append(w) or w)
+    assert keys == ['a', 'a']
+
+
+def test_audit(monkeypatch):
+    s = generate(500, seed=4)
+    lines = s.strip().split('\n')
+    monkeypatch.setitem(POLICIES, 'no-same-length', len)
+
+    result = audit(lines, block_size=64)
+    assert result.lines == 500
+    assert [p.name for p in result.policies] == ['no-repeats', 'no-anagrams', 'no-same-length']
+    no_repeated, no_anagrams, no_same_length = [p.valid for p in result.policies]
+    assert (no_repeated, no_anagrams) == count_valid(lines)
+    assert no_same_length == sum(len(set(map(len, line.split()))) == len(line.split())
+                                 for line in lines)
+
+    assert 'no-same-length' in format_audit(result)
+    try:
+        audit(lines, ['no-such-policy'])
+    except ValueError:
+        pass
+    else:
+        assert False, "Should throw for unknown policy"
+
+
+def test_generate():
+    s = generate(100, seed=1)
+    assert s == generate(100, seed=1)
+    lines = s.strip().split('\n')
+    assert len(lines) == 100
+    assert 0 < sum(map(validate_no_anagrams, lines)) < sum(map(validate_no_repeated, lines)) < 100
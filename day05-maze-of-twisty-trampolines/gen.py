@@ -0,0 +1,15 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0, reach=None):
+    """Return a maze of <size> jump offsets, mostly jumping backwards.
+
+    Jumps go back at most <reach> offsets if given, else back up to the
+    start of the maze, which takes roughly size ** 2.8 jumps to escape.
+    """
+    rng = random.Random(seed)
+    if reach is None:
+        reach = size
+    return '\n'.join(str(rng.randint(-min(i, reach), 2)) for i in range(size)) + '\n'
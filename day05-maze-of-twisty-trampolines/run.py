@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 
 import itertools
+import sys
+
+from array import array
+
+SETTLED_BLOCK = 16
+PROGRESS_JUMPS = 1 << 20
 
 
 def increment(_):
@@ -11,15 +17,18 @@ def strange_jump(offset):
     return -1 if offset > 2 else 1
 
 
-def cpu_states(initial_state, increase_func, at=0):
+def cpu_states(initial_state, increase_func, at=0, progress=None):
     pos = at
+    check = progress.update(0) if progress else -1
 
     # Give this man a medal -- make a COPY of input data.
     # <https://www.reddit.com/r/adventofcode/comments/7hr5ya/psa2017_day_5_part_2_offset_of_three_or_more_is/dqtg5pz/>
     state = initial_state[:]
     num_instructions = len(state)
 
-    while True:
+    for step in itertools.count():
+        if step == check:
+            check = progress.update(step)
         yield state, pos
 
         if 0 <= pos < num_instructions:
@@ -29,7 +38,161 @@ def cpu_states(initial_state, increase_func, at=0):
             state[old_pos] += increase_func(offset)
 
 
+def _jumps(state, pos, strange, limit):
+    """Jump from <pos> until out of <state>, or <limit> times.
+
+    Return the position reached and the number of jumps.
+    """
+    num_instructions = len(state)
+    if strange:
+        for step in range(limit):
+            if not 0 <= pos < num_instructions:
+                return pos, step
+            offset = state[pos]
+            state[pos] = offset - 1 if offset > 2 else offset + 1
+            pos += offset
+    else:
+        for step in range(limit):
+            if not 0 <= pos < num_instructions:
+                return pos, step
+            offset = state[pos]
+            state[pos] = offset + 1
+            pos += offset
+    return pos, limit
+
+
+def run_maze(initial_state, strange=False, at=0, snapshot_every=None, snapshot=None,
+             progress=None):
+    """Return number of steps to jump out of maze, and its final state.
+
+    Offsets are increased by increment(), or by strange_jump() if <strange>.
+    Every <snapshot_every> steps, <snapshot> is called with the steps so
+    far, the state (an array, not to be modified) and the position.
+    <progress> is updated at snapshots, or every PROGRESS_JUMPS steps.
+    """
+    state = array('l', initial_state)
+    pos, steps = at, 0
+
+    if progress is not None:
+        def snapshot(steps, state, pos, snapshot=snapshot):
+            progress.update(steps)
+            if snapshot is not None:
+                snapshot(steps, state, pos)
+        snapshot_every = snapshot_every or PROGRESS_JUMPS
+
+    if snapshot_every is None:
+        pos, steps = _jumps(state, pos, strange, sys.maxsize)
+    else:
+        while True:
+            pos, jumps = _jumps(state, pos, strange, snapshot_every)
+            steps += jumps
+            if jumps < snapshot_every:
+                break
+            snapshot(steps, state, pos)
+
+    if progress is not None:
+        progress.finish(steps)
+    return steps, state.tolist()
+
+
+def _cross_block(pattern, entry, size):
+    """Jump through a settled block of <size> offsets from <entry>.
+
+    The block is a bit <pattern>, with set bits for 3s and clear bits for
+    2s. Return the new pattern, the position past the block, and the number
+    of jumps.
+    """
+    pos, steps = entry, 0
+    while pos < size:
+        bit = 1 << pos
+        steps += 1
+        if pattern & bit:
+            pattern ^= bit
+            pos += 3
+        else:
+            pattern |= bit
+            pos += 2
+    return pattern, pos - size, steps
+
+
+def run_settled_maze(initial_state, block_size=SETTLED_BLOCK, margin=2, progress=None):
+    """Return number of steps to jump out of maze with strange_jump(), and its final state.
+
+    Offsets of 2 and 3 only turn into each other, and the pointer only ever
+    moves forwards over them. Blocks at the start of the maze holding
+    nothing else are packed into bit patterns, and crossing one from an
+    entry point is looked up instead of jumped one offset at a time. Only
+    blocks <margin> blocks behind a long jump back are packed, as those
+    near the pointer are seldom crossed twice the same way.  Blocks must
+    be at least 3 long, so that no jump goes past the next block.
+    """
+    if block_size < 3:
+        raise ValueError("block_size must be at least 3, not %d" % block_size)
+
+    state = array('l', initial_state)
+    num_instructions = len(state)
+    blocks = []
+    crossings = {}
+    packed, low = 0, block_size
+    pos = steps = origin = 0
+    check = progress.update(0) if progress else sys.maxsize
+
+    while 0 <= pos < num_instructions:
+        if steps >= check:
+            check = progress.update(steps)
+
+        if pos >= low:
+            for jumps in itertools.count():
+                if not low <= pos < num_instructions:
+                    break
+                offset = state[pos]
+                state[pos] = offset - 1 if offset > 2 else offset + 1
+                pos += offset
+            steps += jumps
+            origin = pos - offset
+            continue
+
+        # Pack settled blocks, up to <margin> blocks before the jump back.
+        while packed + block_size <= origin - margin * block_size and all(
+                2 <= n <= 3 for n in state[packed:packed + block_size]):
+            blocks.append(sum(1 << i for i, n in enumerate(state[packed:packed + block_size]) if n == 3))
+            packed += block_size
+        low = packed + block_size
+
+        if pos < packed:
+            block, entry = divmod(pos, block_size)
+            for block in range(block, len(blocks)):
+                key = blocks[block] * block_size + entry
+                crossing = crossings.get(key)
+                if crossing is None:
+                    crossing = crossings[key] = _cross_block(blocks[block], entry, block_size)
+                blocks[block], entry, jumps = crossing
+                steps += jumps
+            pos = packed + entry
+
+        upper = min(low, num_instructions)
+        for jumps in itertools.count():
+            if not packed <= pos < upper:
+                break
+            offset = state[pos]
+            state[pos] = offset - 1 if offset > 2 else offset + 1
+            pos += offset
+        steps += jumps
+
+    for block, pattern in enumerate(blocks):
+        start = block * block_size
+        state[start:start + block_size] = array(
+            'l', (3 if pattern >> i & 1 else 2 for i in range(block_size)))
+
+    if progress is not None:
+        progress.finish(steps)
+    return steps, state.tolist()
+
+
 def puzzle(initial_state, increase_func=increment):
+    if increase_func in (increment, strange_jump):
+        return run_maze(initial_state, strange=increase_func is strange_jump)
+
     num_instructions = len(initial_state)
     state = cpu_states(initial_state, increase_func=increase_func)
 
@@ -40,54 +203,18 @@ def puzzle(initial_state, increase_func=increment):
             return step, cur_state
 
 
-def assert_next(iter, expected):
-    actual = next(iter)
-    assert actual == expected, "expected %s, got %s" % (expected, actual)
-
-
-assert increment(0) == 1
-
-assert all(strange_jump(n) == +1 for n in range(-10, 3))
-assert all(strange_jump(n) == -1 for n in range(3, 10))
+def part1(s, progress=None):
+    step, _ = run_maze([int(n) for n in s.split()], progress=progress)
+    return step
 
-state = cpu_states([0, 3, 0, 1, -3], increase_func=increment, at=0)
-assert_next(state, ([0, 3, 0, 1, -3], 0))
-assert_next(state, ([1, 3, 0, 1, -3], 0))
-assert_next(state, ([2, 3, 0, 1, -3], 1))
-assert_next(state, ([2, 4, 0, 1, -3], 4))
-assert_next(state, ([2, 4, 0, 1, -2], 1))
-assert_next(state, ([2, 5, 0, 1, -2], 5))
-assert_next(state, ([2, 5, 0, 1, -2], 5))
-assert_next(state, ([2, 5, 0, 1, -2], 5))
 
-state = cpu_states([2, 0], increase_func=increment, at=0)
-assert_next(state, ([2, 0], 0))
-assert_next(state, ([3, 0], 2))
-
-state = cpu_states([0, -2], increase_func=increment, at=1)
-assert_next(state, ([0, -2], 1))
-assert_next(state, ([0, -1], -1))
-
-steps, end_state = puzzle([0, 3, 0, 1, -3], increase_func=increment)
-assert steps == 5
-assert end_state == [2, 5, 0, 1, -2]
-
-steps, end_state = puzzle([2, 0], increase_func=increment)
-assert steps == 1
-assert end_state == [3, 0]
-
-steps, end_state = puzzle([0, 3, 0, 1, -3], increase_func=strange_jump)
-assert steps == 10
-assert end_state == [2, 3, 2, 3, -1]
+def part2(s, progress=None):
+    step, _ = run_settled_maze([int(n) for n in s.split()], progress=progress)
+    return step
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        lines = f.readlines()
-        initial_state = [int(line.strip()) for line in lines]
-
-        step, *_ = puzzle(initial_state, increase_func=increment)
-        print(step)
-
-        step, *_ = puzzle(initial_state, increase_func=strange_jump)
-        print(step)
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,119 @@
+import itertools
+
+import pytest
+
+from . import run
+from .run import increment, strange_jump, cpu_states, puzzle, run_maze, run_settled_maze
+from .gen import generate
+
+
+def assert_next(iter, expected):
+    actual = next(iter)
+    assert actual == expected, "expected %s, got %s" % (expected, actual)
+
+
+def test_increase_funcs():
+    assert increment(0) == 1
+
+    assert all(strange_jump(n) == +1 for n in range(-10, 3))
+    assert all(strange_jump(n) == -1 for n in range(3, 10))
+
+
+def test_cpu_states():
+    state = cpu_states([0, 3, 0, 1, -3], increase_func=increment, at=0)
+    assert_next(state, ([0, 3, 0, 1, -3], 0))
+    assert_next(state, ([1, 3, 0, 1, -3], 0))
+    assert_next(state, ([2, 3, 0, 1, -3], 1))
+    assert_next(state, ([2, 4, 0, 1, -3], 4))
+    assert_next(state, ([2, 4, 0, 1, -2], 1))
+    assert_next(state, ([2, 5, 0, 1, -2], 5))
+    assert_next(state, ([2, 5, 0, 1, -2], 5))
+    assert_next(state, ([2, 5, 0, 1, -2], 5))
+
+    state = cpu_states([2, 0], increase_func=increment, at=0)
+    assert_next(state, ([2, 0], 0))
+    assert_next(state, ([3, 0], 2))
+
+    state = cpu_states([0, -2], increase_func=increment, at=1)
+    assert_next(state, ([0, -2], 1))
+    assert_next(state, ([0, -1], -1))
+
+
+def test_puzzle():
+    steps, end_state = puzzle([0, 3, 0, 1, -3], increase_func=increment)
+    assert steps == 5
+    assert end_state == [2, 5, 0, 1, -2]
+
+    steps, end_state = puzzle([2, 0], increase_func=increment)
+    assert steps == 1
+    assert end_state == [3, 0]
+
+    steps, end_state = puzzle([0, 3, 0, 1, -3], increase_func=strange_jump)
+    assert steps == 10
+    assert end_state == [2, 3, 2, 3, -1]
+
+
+def test_run_maze():
+    assert run_maze([0, 3, 0, 1, -3]) == (5, [2, 5, 0, 1, -2])
+    assert run_maze([0, 3, 0, 1, -3], strange=True) == (10, [2, 3, 2, 3, -1])
+    assert run_maze([0, -2], at=1) == (1, [0, -1])
+    assert run_maze([]) == (0, [])
+
+    # Same as the generator, which puzzle() skips for these increase funcs.
+    state = [int(n) for n in generate(200, seed=2).split()]
+    for increase_func in (increment, strange_jump):
+        states = cpu_states(state, increase_func=increase_func)
+        for step in itertools.count():
+            end_state, pos = next(states)
+            if not 0 <= pos < len(state):
+                break
+        assert run_maze(state, strange=increase_func is strange_jump) == (step, end_state)
+
+
+def test_run_maze_snapshots():
+    snapshots = []
+    steps, end_state = run_maze([0, 3, 0, 1, -3], strange=True, snapshot_every=3,
+                                snapshot=lambda n, state, pos: snapshots.append((n, list(state), pos)))
+    assert steps == 10
+    assert snapshots == [
+        (3, [2, 2, 0, 1, -3], 4),
+        (6, [2, 3, 0, 2, -2], 4),
+        (9, [2, 3, 2, 2, -1], 3),
+    ]
+
+
+def test_run_settled_maze():
+    assert run_settled_maze([0, 3, 0, 1, -3]) == (10, [2, 3, 2, 3, -1])
+    assert run_settled_maze([]) == (0, [])
+
+    for size, reach, block_size in [(300, None, 16), (300, None, 4), (2000, 20, 8)]:
+        state = [int(n) for n in generate(size, reach=reach).split()]
+        assert run_settled_maze(state, block_size=block_size) == puzzle(state, increase_func=strange_jump)
+
+    for block_size in (3, 5):
+        state = [int(n) for n in generate(300, seed=block_size).split()]
+        assert run_settled_maze(state, block_size=block_size) == run_maze(state, strange=True)
+    with pytest.raises(ValueError):
+        run_settled_maze([0, 3, 0, 1, -3], block_size=2)
+
+
+def test_run_settled_maze_crossings(monkeypatch):
+    crossings = []
+    cross_block = run._cross_block
+    monkeypatch.setattr(run, '_cross_block', lambda *args: crossings.append(args) or cross_block(*args))
+
+    state = [int(n) for n in generate(300).split()]
+    assert run_settled_maze(state) == run_maze(state, strange=True)
+    assert len(crossings) > 1000
+
+
+def test_generate():
+    s = generate(100, seed=1)
+    assert s == generate(100, seed=1)
+    state = [int(n) for n in s.split()]
+    assert len(state) == 100
+    steps, _ = puzzle(state, increase_func=strange_jump)
+    assert steps > 100
+
+    state = [int(n) for n in generate(100, seed=1, reach=5).split()]
+    assert min(state) == -5
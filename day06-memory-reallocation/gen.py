@@ -0,0 +1,9 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0, max_blocks=15):
+    """Return <size> memory banks holding up to <max_blocks> blocks each."""
+    rng = random.Random(seed)
+    return '\t'.join(str(rng.randint(0, max_blocks)) for _ in range(size)) + '\n'
@@ -1,57 +1,189 @@
 #!/usr/bin/env python3
 
-from functools import reduce
+import sys
+
+from array import array
 from itertools import count
 
 
 def redistribute(banks):
+    """Empty the fullest bank, the first of equals, over the banks after it, in place.
+
+    Every bank gets a whole round of blocks at once, and the rest go one
+    each to the banks following the emptied one, wrapping around.
+    """
     num_banks = len(banks)
-    at, val = reduce(lambda a, b: b if a[1] < b[1] else a, enumerate(banks))
+    val = max(banks)
+    at = banks.index(val)
     banks[at] = 0
 
-    for i in range(val):
-        banks[(at + 1 + i) % num_banks] += 1
+    rounds, rest = divmod(val, num_banks)
+    if rounds:
+        for i in range(num_banks):
+            banks[i] += rounds
+
+    end = at + 1 + rest
+    for i in range(at + 1, min(end, num_banks)):
+        banks[i] += 1
+    for i in range(end - num_banks):
+        banks[i] += 1
 
     return banks
 
 
-def redistribute_generator(banks):
-    while True:
+def redistribute_generator(banks, progress=None):
+    check = progress.update(0) if progress else -1
+    for step in count(1):
         banks = redistribute(banks)
         yield banks
+        if step == check:
+            check = progress.update(step)
+
+
+MODES = ('auto', 'tuple', 'packed', 'fingerprint', 'brent')
+
+# Bytes to remember a state by, besides its key: a dict slot and a step.
+ENTRY_SIZE = 64
+FINGERPRINT_SIZE = sys.getsizeof(1 << 62)
+MEMORY_BUDGET = 256 << 20
+
+
+def compact_banks(banks):
+    """Return <banks> as an array of the smallest type holding all their blocks."""
+    total = sum(banks)
+    for typecode in 'BHILQ':
+        if total < 1 << 8 * array(typecode).itemsize:
+            return array(typecode, banks)
+    raise OverflowError("%d blocks do not fit in 64 bits" % total)
+
+
+def _state_at(banks, step):
+    state = compact_banks(banks)
+    for _ in range(step + 1):
+        redistribute(state)
+    return state
+
+
+def _search_seen(states, packed, max_packed, max_fingerprints):
+    """Find the first repeat in <states>.
+
+    Return the step it happens at, the step it repeats and whether it was
+    found by fingerprint.  States are remembered as packed bytes while
+    <packed>, up to <max_packed> of them, and by their hashes (64-bit
+    fingerprints) after that.  Return None if more than <max_fingerprints>
+    are needed.
+    """
+    seen = {}
+    for step, state in enumerate(states):
+        key = state.tobytes()
+        if not packed:
+            key = hash(key)
+        if key in seen:
+            return step, seen[key], not packed
+
+        if len(seen) >= (max_packed if packed else max_fingerprints):
+            if not packed or max_packed >= max_fingerprints:
+                return None
+            seen = {hash(k): v for k, v in seen.items()}
+            packed, key = False, hash(key)
+        seen[key] = step
+
+
+def _brent(banks, progress=None):
+    """Return the steps of the first repeat and of the state it repeats, in O(1) states.
+
+    Brent's algorithm: the hare runs ahead in powers of two until it meets
+    the tortoise, giving the loop length, then both run a loop length
+    apart from the start until they meet at the start of the loop.
+    """
+    steps = 0
+    check = progress.update(0) if progress else -1
+
+    tortoise = redistribute(compact_banks(banks))
+    hare = redistribute(tortoise[:])
+    power = length = 1
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare[:]
+            power *= 2
+            length = 0
+        redistribute(hare)
+        length += 1
+        steps += 1
+        if steps == check:
+            check = progress.update(steps)
+
+    tortoise = redistribute(compact_banks(banks))
+    hare = _state_at(banks, length)
+    start = 0
+    while tortoise != hare:
+        redistribute(tortoise)
+        redistribute(hare)
+        start += 1
+
+    return start + length, start
+
+
+def locate_redistribute_loop(banks, mode='auto', memory_budget=MEMORY_BUDGET, progress=None):
+    """Return the (0-based) step of the first repeated state, and of its first occurrence.
+
+    <mode> is how visited states are remembered: as tuples, as 'packed'
+    bytes, as 64-bit hashes ('fingerprint', checked by replaying the
+    earlier state on a match), or not at all ('brent', which takes some
+    more steps).  With 'auto', states are packed, then hashed once past
+    <memory_budget> bytes, falling back to 'brent' if hashes do not fit
+    either.
+    """
+    if mode not in MODES:
+        raise ValueError("unknown mode %r, expected one of %s" % (mode, ", ".join(MODES)))
+
+    if mode == 'brent':
+        found = _brent(banks, progress)
+    elif mode == 'tuple':
+        seen = dict()
+        states = redistribute_generator(array('q', banks), progress=progress)
+        for step in count():
+            bank = tuple(next(states))
+            if bank in seen:
+                found = (step, seen[bank])
+                break
+            seen[bank] = step
+    else:
+        state = compact_banks(banks)
+        states = redistribute_generator(state, progress=progress)
+        if mode == 'auto':
+            max_packed = memory_budget // (ENTRY_SIZE + sys.getsizeof(state.tobytes()))
+            max_fingerprints = memory_budget // (ENTRY_SIZE + FINGERPRINT_SIZE)
+        else:
+            max_packed = max_fingerprints = float('inf')
 
-
-def locate_redistribute_loop(banks):
-    seen = dict()
-    banks = redistribute_generator(banks)
-
-    for step in count():
-        bank = tuple(next(banks))
-        if bank in seen:
-            return (step, seen[bank])
+        found = _search_seen(states, mode != 'fingerprint', max_packed, max_fingerprints)
+        if found is None:
+            found = _brent(banks, progress)
         else:
-            seen[bank] = step
+            step, first, hashed = found
+            found = step, first
+            if hashed and _state_at(banks, first) != state:
+                # Two states with the same hash: rather than look further, start over.
+                found = _brent(banks, progress)
 
+    if progress is not None:
+        progress.finish(found[0])
+    return found
 
-def assert_next(iter, expected):
-    actual = next(iter)
-    assert actual == expected, "expected %s, got %s" % (expected, actual)
 
+def part1(s, progress=None):
+    pos, run_length = locate_redistribute_loop([int(n) for n in s.split()], progress=progress)
+    return pos + 1
 
-banks = redistribute_generator([0, 2, 7, 0])
-assert_next(banks, [2, 4, 1, 2])
-assert_next(banks, [3, 1, 2, 3])
-assert_next(banks, [0, 2, 3, 4])
-assert_next(banks, [1, 3, 4, 1])
-assert_next(banks, [2, 4, 1, 2])
 
-pos, run_length = locate_redistribute_loop([0, 2, 7, 0])
-assert pos + 1 == 5     # positions are 0-based!
-assert (pos - run_length) == 4
+def part2(s, progress=None):
+    pos, run_length = locate_redistribute_loop([int(n) for n in s.split()], progress=progress)
+    return pos - run_length
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        banks = [int(n) for n in f.read().strip().split()]
-        pos, run_length = locate_redistribute_loop(banks)
-        print(pos - run_length)
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
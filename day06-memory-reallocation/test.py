@@ -0,0 +1,80 @@
+import random
+
+from array import array
+
+import pytest
+
+from . import run
+from .run import MODES, redistribute, redistribute_generator, locate_redistribute_loop
+from .gen import generate
+
+
+def assert_next(iter, expected):
+    actual = next(iter)
+    assert actual == expected, "expected %s, got %s" % (expected, actual)
+
+
+def redistribute_one_by_one(banks):
+    at = banks.index(max(banks))
+    val, banks[at] = banks[at], 0
+    for i in range(val):
+        banks[(at + 1 + i) % len(banks)] += 1
+    return banks
+
+
+def test_redistribute():
+    assert redistribute([3, 1, 3, 0]) == [0, 2, 4, 1]   # first of equals
+    assert redistribute([0, 9, 0]) == [3, 3, 3]
+
+    banks = array('q', [1, 2, 10**6, 4])
+    assert redistribute(banks) is banks
+    assert banks == array('q', [250001, 250002, 250000, 250004])
+
+    rng = random.Random(1)
+    for _ in range(100):
+        banks = [rng.randrange(50) for _ in range(rng.randint(1, 12))]
+        assert redistribute(banks[:]) == redistribute_one_by_one(banks[:])
+
+
+def test_redistribute_generator():
+    banks = redistribute_generator([0, 2, 7, 0])
+    assert_next(banks, [2, 4, 1, 2])
+    assert_next(banks, [3, 1, 2, 3])
+    assert_next(banks, [0, 2, 3, 4])
+    assert_next(banks, [1, 3, 4, 1])
+    assert_next(banks, [2, 4, 1, 2])
+
+
+def test_locate_redistribute_loop():
+    pos, run_length = locate_redistribute_loop([0, 2, 7, 0])
+    assert pos + 1 == 5     # positions are 0-based!
+    assert (pos - run_length) == 4
+
+
+def test_locate_modes(monkeypatch):
+    for size, seed in [(4, 0), (8, 1), (16, 2)]:
+        banks = [int(n) for n in generate(size, seed=seed).split()]
+        expected = locate_redistribute_loop(banks, mode='tuple')
+        for mode in MODES:
+            assert locate_redistribute_loop(banks, mode=mode) == expected
+        # Room for fingerprints but not packed states, then for neither.
+        fingerprints = (expected[0] + 1) * (run.ENTRY_SIZE + run.FINGERPRINT_SIZE)
+        assert locate_redistribute_loop(banks, memory_budget=fingerprints) == expected
+        assert locate_redistribute_loop(banks, memory_budget=0) == expected
+
+        # Every state collides, so the match is found false and Brent's takes over.
+        monkeypatch.setattr(run, 'hash', lambda key: 0, raising=False)
+        assert locate_redistribute_loop(banks, mode='fingerprint') == expected
+        monkeypatch.undo()
+
+    with pytest.raises(ValueError):
+        locate_redistribute_loop([0, 2, 7, 0], mode='set')
+
+
+def test_generate():
+    s = generate(16, seed=1)
+    assert s == generate(16, seed=1)
+    banks = [int(n) for n in s.split()]
+    assert len(banks) == 16
+    pos, run_length = locate_redistribute_loop(banks)
+    assert pos > run_length
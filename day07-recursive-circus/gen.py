@@ -0,0 +1,62 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from string import ascii_lowercase
+
+
+def unique_names(rng, num):
+    length = 4
+    while 26 ** length < 10 * num:
+        length += 1
+
+    names = set()
+    while len(names) < num:
+        names.add(''.join(rng.choices(ascii_lowercase, k=length)))
+    return list(names)
+
+
+def generate(size, seed=0):
+    """Return a tower of <size> programs with exactly one wrong weight.
+
+    Every program holds 3 to 5 others until <size> is reached, so the
+    unbalanced program always has a well-defined odd one out.
+    """
+    rng = random.Random(seed)
+    names = unique_names(rng, size)
+    weights = [rng.randint(1, 99) for _ in range(size)]
+    children = [[] for _ in range(size)]
+
+    # breadth-first shape, node 0 at the bottom
+    holder, placed = 0, 1
+    while placed < size:
+        num = min(rng.randint(3, 5), size - placed)
+        children[holder] = list(range(placed, placed + num))
+        placed += num
+        holder += 1
+
+    # bottom-up, top up lighter sub-towers until all discs are balanced
+    totals = weights[:]
+    for node in reversed(range(size)):
+        if children[node]:
+            target = max(totals[c] for c in children[node])
+            for c in children[node]:
+                weights[c] += target - totals[c]
+            totals[node] = weights[node] + target * len(children[node])
+
+    candidates = [c for node in range(size) if len(children[node]) >= 3
+                  for c in children[node]]
+    if candidates:
+        odd = rng.choice(candidates)
+        delta = rng.randint(1, 9)
+        weights[odd] += delta if weights[odd] <= delta or rng.random() < 0.5 else -delta
+
+    lines = []
+    for node in range(size):
+        line = '%s (%d)' % (names[node], weights[node])
+        if children[node]:
+            line += ' -> ' + ', '.join(names[c] for c in children[node])
+        lines.append(line)
+    rng.shuffle(lines)
+
+    return '\n'.join(lines) + '\n'
@@ -2,11 +2,12 @@
 
 import statistics
 
-from collections import deque
-
 
 class Program:
 
+    __slots__ = ('name', 'weight', 'parents', 'children', 'depth', 'tower_weight', 'unbalanced',
+                 'held_weight')
+
     def __init__(self, name, weight):
         self.name = name
         self.weight = weight
@@ -19,44 +20,75 @@ class Program:
 
 
 def build_tree(data):
-    data = data.strip().split('\n')
-    data.sort(key=lambda entry: '->' in entry)
-    data = deque(data)
-
-    elems = dict()
-
-    while len(data):
-        entry = data.popleft()
-
-        if '->' in entry:
-            name, weight, _, *parents = entry.split()
-            parents = [e.strip(',') for e in parents]
-        else:
-            name, weight = entry.split()
-            parents = []
-
-        weight = int(weight.strip('()'))
-
-        if name not in elems:
-            elems[name] = Program(name, weight)
-
-        try:
-            for parent in parents:
-                elems[name].parents[parent] = elems[parent]
-                elems[parent].children[name] = elems[name]
-                assert all(type(parent) == Program for parent in elems[name].parents.values())
-                assert all(type(child) == Program for child in elems[parent].children.values())
-        except KeyError:
-            data.append(entry)
-
-    return elems
+    """Return programs by name, linked to those they hold and are held by, and annotated.
+
+    All programs are made first, so entries may name programs listed
+    after them.
+    """
+    elems = Tower()
+    held = []
+
+    for entry in data.split('\n'):
+        if not entry.strip():
+            continue
+        name, weight, *parents = entry.replace(',', ' ').split()
+        elems[name] = Program(name, int(weight.strip('()')))
+        if parents:
+            held.append((name, parents[1:]))
+
+    for name, parents in held:
+        prog = elems[name]
+        for parent in parents:
+            above = elems[parent]
+            prog.parents[parent] = above
+            above.children[name] = prog
+
+    return elems.annotate()
+
+
+def _odd_one_out(held):
+    # Return the first program not of the most common tower weight, or
+    # None, and that weight.  Like statistics.mode(), the first weight seen
+    # wins a tie.
+    weights = [p.tower_weight for p in held]
+    if min(weights) == max(weights):
+        return None, weights[0]
+    mode = statistics.mode(weights)
+    return next(p for p, w in zip(held, weights) if w != mode), mode
+
+
+def annotate(tree):
+    """Store on every program its depth, tower weight and unbalanced held program.
+
+    Depth counts programs held on top of each other, from 0 at the top;
+    the tower weight includes all programs held; and the unbalanced held
+    program is the odd one out in tower weight, if any, from the most
+    common tower weight of those held, stored as the held weight.  Each tower is
+    visited once without recursion, in reverse breadth-first order so
+    that programs come after those they hold.
+    """
+    for bottom in tree.values():
+        if bottom.children:
+            continue
+        order = [bottom]
+        for prog in order:
+            order.extend(prog.parents.values())
+
+        for prog in reversed(order):
+            held = prog.parents.values()
+            if held:
+                prog.depth = max(p.depth for p in held) + 1
+                prog.tower_weight = prog.weight + sum(p.tower_weight for p in held)
+                prog.unbalanced, prog.held_weight = _odd_one_out(held)
+            else:
+                prog.depth = 0
+                prog.tower_weight = prog.weight
+                prog.unbalanced = prog.held_weight = None
+    return tree
 
 
 def depth(prog):
-    if not prog.parents.values():
-        return 0
-    else:
-        return max(depth(p) for p in prog.parents.values()) + 1
+    return prog.depth
 
 
 def puzzle(tree):
@@ -64,95 +96,82 @@ def puzzle(tree):
 
 
 def height(prog):
-    return prog.weight + sum(height(p) for p in prog.parents.values())
+    return prog.tower_weight
 
 
 def is_balanced(prog):
-    if not prog.parents.values():
-        return True
-    else:
-        heights = [height(p) for p in prog.parents.values()]
-        if max(heights) != min(heights):
-            return False
-        else:
-            return True
+    return prog.unbalanced is None
 
 
 def find_unbalanced_parent(prog):
-    parents = prog.parents.values()
-    heights = [height(e) for e in parents]
-    mode = statistics.mode(heights)
-    unbal = next((p for p, h in zip(parents, heights) if h != mode), None)
-
-    if unbal:
-        return unbal, mode - height(unbal)
-    else:
+    unbal = prog.unbalanced
+    if unbal is None:
         return None, 0
 
+    return unbal, prog.held_weight - unbal.tower_weight
+
 
 def puzzle2(tree):
-    disc = sorted((e for e in tree.values() if not is_balanced(e)), key=height)
-    parent, delta = find_unbalanced_parent(disc[0])
+    disc = min((e for e in tree.values() if not is_balanced(e)), key=height)
+    parent, delta = find_unbalanced_parent(disc)
     return parent.weight + delta
 
 
-inp = """
-pbga (66)
-xhth (57)
-ebii (61)
-havc (66)
-ktlj (57)
-fwft (72) -> ktlj, cntj, xhth
-qoyq (66)
-padx (45) -> pbga, havc, qoyq
-tknk (41) -> ugml, padx, fwft
-jptl (61)
-ugml (68) -> gyxo, ebii, jptl
-gyxo (61)
-cntj (57)
-"""
-
-elems = build_tree(inp)
-assert elems
-
-# test parents
-assert sorted(elems['tknk'].parents.keys()) == sorted(['ugml', 'padx', 'fwft'])
-assert sorted(elems['ugml'].parents.keys()) == sorted(['gyxo', 'ebii', 'jptl'])
-assert sorted(elems['fwft'].parents.keys()) == sorted(['ktlj', 'cntj', 'xhth'])
-
-# test children
-assert list(elems['ugml'].children.keys()) == ['tknk']
-assert list(elems['padx'].children.keys()) == ['tknk']
-assert list(elems['fwft'].children.keys()) == ['tknk']
-assert list(elems['ebii'].children.keys()) == ['ugml']
-
-# depths
-assert all(depth(elems[e]) == 0 for e in ['gyxo', 'havc', 'xhth'])
-assert all(depth(elems[e]) == 1 for e in ['ugml', 'padx', 'fwft'])
-assert depth(elems['tknk']) == 2
-
-# heights
-assert height(elems['ktlj']) == 57
-assert height(elems['cntj']) == 57
-assert height(elems['xhth']) == 57
-assert height(elems['fwft']) == \
-    72 + sum(height(elems[e]) for e in ['ktlj', 'cntj', 'xhth'])
-assert height(elems['tknk']) == \
-    41 + sum(height(elems[e]) for e in ['ugml', 'padx', 'fwft'])
-
-# balancing
-assert all(is_balanced(elems[e]) for e in ['gyxo', 'havc', 'xhth'])
-assert all(is_balanced(elems[e]) for e in ['ugml', 'padx', 'fwft'])
-assert not is_balanced(elems['tknk'])
-
-assert puzzle(elems) == elems['tknk']
-
-assert find_unbalanced_parent(elems['tknk']) == (elems['ugml'], -8)
-assert puzzle2(elems) == 60
+class Tower(dict):
+    """Annotated programs by name, with the names of unbalanced ones in <unbalanced>.
+
+    set_weight() keeps both up to date, so whether the tower balances, and
+    the weight that would correct it, are quick to ask again after each
+    change.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unbalanced = set()
+
+    def annotate(self):
+        annotate(self)
+        self.unbalanced = {name for name, prog in self.items() if not is_balanced(prog)}
+        return self
+
+    def set_weight(self, name, weight):
+        """Change the weight of program <name>, updating the programs below it."""
+        prog = self[name]
+        delta = weight - prog.weight
+        prog.weight = weight
+        prog.tower_weight += delta
+
+        while prog.children:
+            prog, = prog.children.values()
+            prog.tower_weight += delta
+            prog.unbalanced, prog.held_weight = _odd_one_out(prog.parents.values())
+            if prog.unbalanced is None:
+                self.unbalanced.discard(prog.name)
+            else:
+                self.unbalanced.add(prog.name)
+
+    def is_balanced(self):
+        return not self.unbalanced
+
+    def corrective_weight(self):
+        """Return what puzzle2() would, or None if the tower is balanced."""
+        if not self.unbalanced:
+            return None
+        disc = min((self[name] for name in self.unbalanced), key=height)
+        parent, delta = find_unbalanced_parent(disc)
+        return parent.weight + delta
+
+
+def part1(s):
+    return puzzle(build_tree(s)).name
+
+
+def part2(s):
+    return puzzle2(build_tree(s))
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        tree = build_tree(f.read())
-        print(puzzle(tree))
-        print(puzzle2(tree))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,141 @@
+import random
+
+from .run import build_tree, depth, height, is_balanced, puzzle, find_unbalanced_parent, puzzle2
+from .gen import generate
+
+inp = """
+pbga (66)
+xhth (57)
+ebii (61)
+havc (66)
+ktlj (57)
+fwft (72) -> ktlj, cntj, xhth
+qoyq (66)
+padx (45) -> pbga, havc, qoyq
+tknk (41) -> ugml, padx, fwft
+jptl (61)
+ugml (68) -> gyxo, ebii, jptl
+gyxo (61)
+cntj (57)
+"""
+
+
+def test_parents():
+    elems = build_tree(inp)
+    assert elems
+
+    assert sorted(elems['tknk'].parents.keys()) == sorted(['ugml', 'padx', 'fwft'])
+    assert sorted(elems['ugml'].parents.keys()) == sorted(['gyxo', 'ebii', 'jptl'])
+    assert sorted(elems['fwft'].parents.keys()) == sorted(['ktlj', 'cntj', 'xhth'])
+
+
+def test_children():
+    elems = build_tree(inp)
+
+    assert list(elems['ugml'].children.keys()) == ['tknk']
+    assert list(elems['padx'].children.keys()) == ['tknk']
+    assert list(elems['fwft'].children.keys()) == ['tknk']
+    assert list(elems['ebii'].children.keys()) == ['ugml']
+
+
+def test_build_tree_order():
+    lines = inp.strip().split('\n')
+    for ordering in (lines[::-1], sorted(lines, key=lambda entry: '->' not in entry)):
+        elems = build_tree('\n'.join(ordering))
+        assert {name: (p.weight, sorted(p.parents), sorted(p.children))
+                for name, p in elems.items()} == \
+            {name: (p.weight, sorted(p.parents), sorted(p.children))
+             for name, p in build_tree(inp).items()}
+
+    assert not hasattr(elems['tknk'], '__dict__')
+
+
+def test_depth():
+    elems = build_tree(inp)
+
+    assert all(depth(elems[e]) == 0 for e in ['gyxo', 'havc', 'xhth'])
+    assert all(depth(elems[e]) == 1 for e in ['ugml', 'padx', 'fwft'])
+    assert depth(elems['tknk']) == 2
+
+
+def test_height():
+    elems = build_tree(inp)
+
+    assert height(elems['ktlj']) == 57
+    assert height(elems['cntj']) == 57
+    assert height(elems['xhth']) == 57
+    assert height(elems['fwft']) == \
+        72 + sum(height(elems[e]) for e in ['ktlj', 'cntj', 'xhth'])
+    assert height(elems['tknk']) == \
+        41 + sum(height(elems[e]) for e in ['ugml', 'padx', 'fwft'])
+
+
+def test_balancing():
+    elems = build_tree(inp)
+
+    assert all(is_balanced(elems[e]) for e in ['gyxo', 'havc', 'xhth'])
+    assert all(is_balanced(elems[e]) for e in ['ugml', 'padx', 'fwft'])
+    assert not is_balanced(elems['tknk'])
+
+
+def test_deep_tower():
+    n = 5000    # well past the recursion limit
+    lines = ['p%d (1) -> p%d' % (i, i + 1) for i in range(n - 1)] + ['p%d (2)' % (n - 1)]
+    tree = build_tree('\n'.join(lines))
+
+    assert puzzle(tree) == tree['p0']
+    assert depth(tree['p0']) == n - 1
+    assert height(tree['p0']) == n + 1
+    assert all(is_balanced(p) for p in tree.values())
+
+
+def test_puzzle():
+    elems = build_tree(inp)
+
+    assert puzzle(elems) == elems['tknk']
+
+    assert find_unbalanced_parent(elems['tknk']) == (elems['ugml'], -8)
+    assert puzzle2(elems) == 60
+
+    # Three different tower weights: correct to the most common one.
+    elems = build_tree("r (1) -> a, b, c, d\na (7)\nb (9)\nc (5)\nd (5)")
+    assert find_unbalanced_parent(elems['r']) == (elems['a'], -2)
+    assert puzzle2(elems) == 5
+
+
+def test_set_weight():
+    tower = build_tree(inp)
+    assert tower.unbalanced == {'tknk'}
+    assert tower.corrective_weight() == 60
+
+    tower.set_weight('ugml', 60)
+    assert tower.is_balanced() and tower.corrective_weight() is None
+    assert height(tower['tknk']) == 41 + 3 * 243
+    tower.set_weight('gyxo', 62)
+    assert tower.unbalanced == {'ugml', 'tknk'}
+    assert tower.corrective_weight() == 61
+
+    tower = build_tree("r (1) -> a, b, c, d\na (5)\nb (9)\nc (5)\nd (5)")
+    assert tower.corrective_weight() == 5
+    tower.set_weight('a', 7)    # three different tower weights on r
+    assert find_unbalanced_parent(tower['r']) == (tower['a'], -2)
+    assert tower.corrective_weight() == puzzle2(tower) == 5
+    assert puzzle2(build_tree("r (1) -> a, b, c, d\na (7)\nb (9)\nc (5)\nd (5)")) == 5
+
+    tower = build_tree(generate(500, seed=2))
+    rng = random.Random(2)
+    for name in rng.sample(sorted(tower), 50):
+        tower.set_weight(name, rng.randint(1, 99))
+        unbalanced, weights = set(tower.unbalanced), {n: height(p) for n, p in tower.items()}
+        tower.annotate()
+        assert tower.unbalanced == unbalanced
+        assert {n: height(p) for n, p in tower.items()} == weights
+
+
+def test_generate():
+    s = generate(500, seed=1)
+    assert s == generate(500, seed=1)
+    tree = build_tree(s)
+    assert len(tree) == 500
+    assert puzzle(tree).children == {}
+    assert puzzle2(tree) > 0
@@ -0,0 +1,27 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from string import ascii_lowercase
+
+OPS = ('<', '>', '<=', '>=', '==', '!=')
+
+
+def generate(size, seed=0, registers=None):
+    """Return a program of <size> instructions over <registers> registers."""
+    rng = random.Random(seed)
+    if registers is None:
+        registers = min(26 * 26, int(size ** 0.5) + 1)
+
+    names = set()
+    while len(names) < registers:
+        names.add(''.join(rng.choices(ascii_lowercase, k=rng.randint(1, 3))))
+    names = sorted(names)
+
+    lines = []
+    for _ in range(size):
+        lines.append('%s %s %d if %s %s %d' % (
+            rng.choice(names), rng.choice(('inc', 'dec')), rng.randint(-1000, 1000),
+            rng.choice(names), rng.choice(OPS), rng.randint(-1000, 1000)))
+
+    return '\n'.join(lines) + '\n'
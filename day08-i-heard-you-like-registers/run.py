@@ -44,49 +44,18 @@ def max_register_value(program):
             return max(state.values()), overall_max
 
 
-def assert_next(iter, expected):
-    actual = next(iter)
-    assert actual == expected, "expected %s, got %s" % (expected, actual)
-
-
-program = """
-b inc 5 if a > 1
-a inc 1 if b < 5
-c dec -10 if a >= 1
-c inc -20 if c == 10
-""".strip().split('\n')
-
-assert valid_cond(3, '<',  6)
-assert not valid_cond(3, '>=', 6)
-assert valid_cond(3, '<=', 6)
-assert not valid_cond(3, '>',  6)
-assert valid_cond(3, '!=', 6)
-assert not valid_cond(3, '==', 6)
-
-try:
-    valid_cond(3, '<=>', 6)
-except ValueError:
-    pass
-else:
-    assert False, 'Should throw for unsupported operation'
-
-states = register_states(program)
-assert_next(states, {'a': 0})                       # b inc 5 if a > 1
-assert_next(states, {'a': 1, 'b': 0})               # a inc 1 if b < 5
-assert_next(states, {'a': 1, 'b': 0, 'c': 10})      # c dec -10 if a >= 1
-assert_next(states, {'a': 1, 'b': 0, 'c': -10})     # c inc -20 if c == 10
-
-try:
-    next(states)
-except StopIteration:
-    pass
-else:
-    assert False, 'Should throw past last state'
-
-assert max_register_value(program) == (1, 10)
+def part1(s):
+    final_max, _ = max_register_value(s.strip().split('\n'))
+    return final_max
+
+
+def part2(s):
+    _, overall_max = max_register_value(s.strip().split('\n'))
+    return overall_max
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.read().strip().split('\n')
-        print(max_register_value(s))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,57 @@
+from .run import valid_cond, register_states, max_register_value
+from .gen import generate
+
+program = """
+b inc 5 if a > 1
+a inc 1 if b < 5
+c dec -10 if a >= 1
+c inc -20 if c == 10
+""".strip().split('\n')
+
+
+def assert_next(iter, expected):
+    actual = next(iter)
+    assert actual == expected, "expected %s, got %s" % (expected, actual)
+
+
+def test_valid_cond():
+    assert valid_cond(3, '<',  6)
+    assert not valid_cond(3, '>=', 6)
+    assert valid_cond(3, '<=', 6)
+    assert not valid_cond(3, '>',  6)
+    assert valid_cond(3, '!=', 6)
+    assert not valid_cond(3, '==', 6)
+
+    try:
+        valid_cond(3, '<=>', 6)
+    except ValueError:
+        pass
+    else:
+        assert False, 'Should throw for unsupported operation'
+
+
+def test_register_states():
+    states = register_states(program)
+    assert_next(states, {'a': 0})                       # b inc 5 if a > 1
+    assert_next(states, {'a': 1, 'b': 0})               # a inc 1 if b < 5
+    assert_next(states, {'a': 1, 'b': 0, 'c': 10})      # c dec -10 if a >= 1
+    assert_next(states, {'a': 1, 'b': 0, 'c': -10})     # c inc -20 if c == 10
+
+    try:
+        next(states)
+    except StopIteration:
+        pass
+    else:
+        assert False, 'Should throw past last state'
+
+
+def test_max_register_value():
+    assert max_register_value(program) == (1, 10)
+
+
+def test_generate():
+    s = generate(1000, seed=1)
+    assert s == generate(1000, seed=1)
+    program = s.strip().split('\n')
+    assert len(program) == 1000
+    assert sum(1 for _ in register_states(program)) == 1000
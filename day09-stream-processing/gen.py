@@ -0,0 +1,49 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+GARBAGE = 'abcdeiou{}<,\'"'
+
+
+def garbage(rng):
+    chars = ['<']
+    for _ in range(rng.randint(0, 20)):
+        if rng.random() < 0.1:
+            chars.append('!' + rng.choice(GARBAGE + '!>'))
+        else:
+            chars.append(rng.choice(GARBAGE))
+    chars.append('>')
+    return ''.join(chars)
+
+
+def generate(size, seed=0, max_depth=50):
+    """Return a stream of roughly <size> characters.
+
+    Groups nest at most <max_depth> deep, which keeps the recursive parser
+    well within Python's recursion limit.
+    """
+    rng = random.Random(seed)
+    out = ['{']
+    length = 1
+    depth = 1
+    first = True    # no element yet in the innermost group
+
+    while length < size or depth > 0:
+        dice = rng.random()
+        if length >= size or (depth > 1 and dice < 0.3) or depth >= max_depth:
+            elem = '}'
+            depth -= 1
+            first = False
+        else:
+            elem = '' if first else ','
+            if dice < 0.65:
+                elem += '{'
+                depth += 1
+                first = True
+            else:
+                elem += garbage(rng)
+                first = False
+        out.append(elem)
+        length += len(elem)
+
+    return ''.join(out) + '\n'
@@ -0,0 +1,82 @@
+from .run import parse_stream, get_score, count_garbage
+from .gen import generate
+
+
+def assert_next(iter, expected):
+    actual = next(iter)
+    assert actual == expected, "expected %s, got %s" % (expected, actual)
+
+
+def test_parse_empty():
+    stream = parse_stream('')
+    try:
+        next(stream)
+    except StopIteration:
+        pass
+    else:
+        assert False, 'Should immediately finish on empty stream'
+
+
+def test_parse_garbage():
+    assert_next(parse_stream('<>'), '')
+    assert_next(parse_stream('<random characters>'), 'random characters')
+    assert_next(parse_stream('<<<<>'), '<<<')
+    assert_next(parse_stream('<{!>}>'), '{}')
+    assert_next(parse_stream('<!!>'), '')
+    assert_next(parse_stream('<!!!>>'), '')
+    assert_next(parse_stream('<{o"i!a,<{i<a>'), '{o"i,<{i<a')
+
+
+def test_parse_groups():
+    assert_next(parse_stream('{}'), [])
+    assert_next(parse_stream('{{{}}}'), [[[]]])
+    assert_next(parse_stream('{{}, {}}'), [[], []])
+    assert_next(parse_stream('{{{},{},{{}}}}'), [[[], [], [[]]]])
+
+    stream = parse_stream('{<a>,<a>,<a>,<a>}')
+    assert_next(stream, ['a', 'a', 'a', 'a'])
+
+    stream = parse_stream('{{<ab>},{<ab>},{<ab>},{<ab>}}')
+    assert_next(stream, [['ab'], ['ab'], ['ab'], ['ab']])
+
+    stream = parse_stream('{{<!!>},{<!!>},{<!!>},{<!!>}}')
+    assert_next(stream, [[''], [''], [''], ['']])
+
+    stream = parse_stream('{{<a!>},{<a!>},{<a!>},{<ab>}}')
+    assert_next(stream, [['a},{<a},{<a},{<ab']])
+
+
+def test_get_score():
+    assert get_score(parse_stream('{}')) == 1
+    assert get_score(parse_stream('{{{}}}')) == 6
+    assert get_score(parse_stream('{{},{}}')) == 5
+    assert get_score(parse_stream('{{{},{},{{}}}}')) == 16
+    assert get_score(parse_stream('{<a>,<a>,<a>,<a>}')) == 1
+    assert get_score(parse_stream('{{<ab>},{<ab>},{<ab>},{<ab>}}')) == 9
+    assert get_score(parse_stream('{{<!!>},{<!!>},{<!!>},{<!!>}}')) == 9
+    assert get_score(parse_stream('{{<a!>},{<a!>},{<a!>},{<ab>}}')) == 3
+
+
+def test_count_garbage():
+    assert count_garbage(parse_stream('<>')) == 0
+    assert count_garbage(parse_stream('<random characters>')) == 17
+    assert count_garbage(parse_stream('<<<<>')) == 3
+    assert count_garbage(parse_stream('<{!>}>')) == 2
+    assert count_garbage(parse_stream('<!!>')) == 0
+    assert count_garbage(parse_stream('<!!!>>')) == 0
+    assert count_garbage(parse_stream('<{o"i!a,<{i<a>')) == 10
+
+    assert count_garbage(parse_stream('{<>}')) == 0
+    assert count_garbage(parse_stream('{<random characters>}')) == 17
+    assert count_garbage(parse_stream('{{<random characters>}}')) == 17
+    assert count_garbage(parse_stream('{<random characters>, <abc>}')) == 20
+
+
+def test_generate():
+    s = generate(10000, seed=1)
+    assert s == generate(10000, seed=1)
+    assert len(s) >= 10000
+    tree = list(parse_stream(s.strip()))
+    assert len(tree) == 1
+    assert get_score(tree) > 0
+    assert count_garbage(tree) > 0
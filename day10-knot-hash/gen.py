@@ -0,0 +1,9 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0):
+    """Return <size> comma-separated lengths, each at most 255."""
+    rng = random.Random(seed)
+    return ','.join(str(rng.randint(0, 255)) for _ in range(size)) + '\n'
@@ -0,0 +1,88 @@
+import random
+
+from collections import deque
+
+from .run import knot_hash, puzzle_multiply, xor_block, xor_blocks, to_hex, puzzle_hash
+from .gen import generate
+
+
+def hash_states(size=256):
+    # The original one-mark-at-a-time solution, kept as a reference.
+    state = deque(range(size))
+    skip_size = 0
+    at = 0
+
+    while True:
+        rev_length = yield
+
+        if rev_length > 1:
+            state.rotate(-at)
+            for v in [state.popleft() for _ in range(rev_length)]:
+                state.appendleft(v)
+            state.rotate(at)
+
+        yield state
+        at += rev_length + skip_size
+        skip_size += 1
+
+
+def assert_send(coroutine, value, expected):
+    next(coroutine)
+    actual = coroutine.send(value)
+    assert actual == expected, "expected %s, got %s" % (expected, actual)
+
+
+def test_hash_states():
+    h = hash_states(5)
+    assert_send(h, 3, deque([2, 1, 0, 3, 4]))
+    assert_send(h, 4, deque([4, 3, 0, 1, 2]))
+    assert_send(h, 1, deque([4, 3, 0, 1, 2]))
+    assert_send(h, 5, deque([3, 4, 2, 1, 0]))
+
+
+def test_knot_hash():
+    rng = random.Random(1)
+    for size in (1, 5, 17, 256):
+        lengths = [rng.randint(0, size) for _ in range(40)]
+        h = hash_states(size)
+        for length in lengths:
+            next(h)
+            state = h.send(length)
+        assert knot_hash(lengths, size) == list(state)
+
+
+def test_puzzle_multiply():
+    assert puzzle_multiply([3, 4, 1, 5], size=5) == 12
+
+
+def test_xor_blocks():
+    assert xor_block([65, 27, 9, 1, 4, 3, 40, 50, 91, 7, 6, 0, 2, 5, 68, 22]) == \
+           65 ^ 27 ^ 9 ^ 1 ^ 4 ^ 3 ^ 40 ^ 50 ^ 91 ^ 7 ^ 6 ^ 0 ^ 2 ^ 5 ^ 68 ^ 22 == 64
+    assert xor_blocks([65, 27, 9, 1, 4, 3, 40, 50, 91, 7, 6, 0, 2, 5, 68, 22], numblocks=1) == [64]
+    assert xor_blocks([65, 27, 9, 1, 4, 3, 40, 50, 91, 7, 6, 0, 2, 5, 68, 22], numblocks=16, blocklen=1) == \
+           [65, 27, 9, 1, 4, 3, 40, 50, 91, 7, 6, 0, 2, 5, 68, 22]
+    assert xor_blocks([65, 27, 9, 1, 4, 3, 40, 50, 91, 7, 6, 0, 2, 5, 68, 22], numblocks=8, blocklen=2) == \
+           [65 ^ 27, 9 ^ 1, 4 ^ 3, 40 ^ 50, 91 ^ 7, 6 ^ 0, 2 ^ 5, 68 ^ 22]
+
+
+def test_to_hex():
+    assert to_hex([]) == ''
+    assert to_hex([32]) == '20'
+    assert to_hex([64, 7, 255]) == '4007ff'
+    assert to_hex([1, 2, 3, 4]) == '01020304'
+
+
+def test_puzzle_hash():
+    assert puzzle_hash('') == 'a2582a3a0e66e6e86e3812dcb672a272'
+    assert puzzle_hash('AoC 2017') == '33efeb34ea91902bb2f59c9920caa6cd'
+    assert puzzle_hash('1,2,3') == '3efbe78a8d82f29979031a4aa0b16a9d'
+    assert puzzle_hash('1,2,4') == '63960835bcdc130f0b66d7ff4f6a5a8e'
+
+
+def test_generate():
+    s = generate(16, seed=1)
+    assert s == generate(16, seed=1)
+    lengths = list(map(int, s.strip().split(',')))
+    assert len(lengths) == 16
+    assert all(0 <= n <= 255 for n in lengths)
+    assert puzzle_multiply(lengths) >= 0
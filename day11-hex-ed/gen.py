@@ -0,0 +1,11 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+DIRECTIONS = ('n', 'ne', 'se', 's', 'sw', 'nw')
+
+
+def generate(size, seed=0):
+    """Return a path of <size> hexagonal steps."""
+    rng = random.Random(seed)
+    return ','.join(rng.choices(DIRECTIONS, k=size)) + '\n'
@@ -76,26 +76,16 @@ def puzzle_max_distance(movements):
     return max(hex_distance_qr(p) for p in hex_path_points(movements))
 
 
-assert cube_to_qr((0, 0, 0)) == (0, 0)
-assert cube_to_qr((1, 2, 3)) == (1, 3)
-assert qr_to_cube((0, 0)) == (0, 0, 0)
-assert qr_to_cube((1, 3)) == (1, -4, 3)  # sic
-assert all(cube_to_qr(qr_to_cube((q, r))) == (q, r) for q in range(-5, 6) for r in range(-5, 6))
+def part1(s):
+    return puzzle_final_distance(s.strip().split(','))
 
-assert hex_path([NE, NE, NE]) == (3, -3)
-assert hex_path([NE, NE, SW, SW]) == (0, 0)
-assert hex_path([NE, NE, S, S]) == (2, 0)
-assert hex_path([SE, SW, SE, SW, SW]) == (-1, 3)
 
-assert hex_distance_qr(hex_path([NE, NE, NE])) == 3
-assert hex_distance_qr(hex_path([NE, NE, SW, SW])) == 0
-assert hex_distance_qr(hex_path([NE, NE, S, S])) == 2
-assert hex_distance_qr(hex_path([SE, SW, SE, SW, SW])) == 3
+def part2(s):
+    return puzzle_max_distance(s.strip().split(','))
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.read().strip()
-        movements = s.split(',')
-        print(puzzle_final_distance(movements))
-        print(puzzle_max_distance(movements))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
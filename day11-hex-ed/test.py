@@ -0,0 +1,32 @@
+from .run import NE, SE, S, SW, cube_to_qr, qr_to_cube, hex_path, hex_distance_qr
+from .gen import generate
+
+
+def test_coordinates():
+    assert cube_to_qr((0, 0, 0)) == (0, 0)
+    assert cube_to_qr((1, 2, 3)) == (1, 3)
+    assert qr_to_cube((0, 0)) == (0, 0, 0)
+    assert qr_to_cube((1, 3)) == (1, -4, 3)  # sic
+    assert all(cube_to_qr(qr_to_cube((q, r))) == (q, r) for q in range(-5, 6) for r in range(-5, 6))
+
+
+def test_hex_path():
+    assert hex_path([NE, NE, NE]) == (3, -3)
+    assert hex_path([NE, NE, SW, SW]) == (0, 0)
+    assert hex_path([NE, NE, S, S]) == (2, 0)
+    assert hex_path([SE, SW, SE, SW, SW]) == (-1, 3)
+
+
+def test_hex_distance():
+    assert hex_distance_qr(hex_path([NE, NE, NE])) == 3
+    assert hex_distance_qr(hex_path([NE, NE, SW, SW])) == 0
+    assert hex_distance_qr(hex_path([NE, NE, S, S])) == 2
+    assert hex_distance_qr(hex_path([SE, SW, SE, SW, SW])) == 3
+
+
+def test_generate():
+    s = generate(100, seed=1)
+    assert s == generate(100, seed=1)
+    movements = s.strip().split(',')
+    assert len(movements) == 100
+    assert 0 <= hex_distance_qr(hex_path(movements)) <= 100
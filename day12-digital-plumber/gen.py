@@ -0,0 +1,22 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0, max_edges=3):
+    """Return a graph of <size> programs with up to <max_edges> pipes each."""
+    rng = random.Random(seed)
+    graph = [set() for _ in range(size)]
+
+    for node in range(size):
+        for _ in range(rng.randint(0, max_edges)):
+            other = rng.randrange(size)
+            graph[node].add(other)
+            graph[other].add(node)
+
+    lines = []
+    for node, neighbours in enumerate(graph):
+        neighbours = sorted(neighbours) or [node]
+        lines.append('%d <-> %s' % (node, ', '.join(map(str, neighbours))))
+
+    return '\n'.join(lines) + '\n'
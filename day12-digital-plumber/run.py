@@ -37,45 +37,27 @@ def count_groups(graph):
     return sum(1 for group in groups(graph))
 
 
-completed = {0: {2, 3}, 2: {0, 3}, 3: {0, 2}}
-assert complete_neighbours(completed) == completed
+def parse_graph(s):
+    graph = defaultdict(set)
 
-actual = complete_neighbours({0: {2}, 2: {3}, 3: set()})
-expected = {0: {2}, 2: {0, 3}, 3: {2}}
-assert actual == expected
+    for edge in s.strip().split('\n'):
+        vertex, neighbours = edge.split(' <-> ')
+        vertex, neighbours = int(vertex), map(int, neighbours.split(', '))
+        graph[vertex].update(neighbours)
 
-actual = complete_neighbours({0: {2}, 2: {3}, 3: {0}})
-expected = {0: {2, 3}, 2: {0, 3}, 3: {0, 2}}
-assert actual == expected
+    return complete_neighbours(graph)
 
-g = {
-    0: {2},
-    1: {1},
-    2: {0, 3, 4},
-    3: {2, 4},
-    4: {2, 3, 6},
-    5: {6},
-    6: {4, 5},
-}
 
-assert flood(g, 0) == {0, 2, 3, 4, 5, 6}
-assert flood(g, 1) == {1}
+def part1(s):
+    return len(flood(parse_graph(s), 0))
 
-assert count_groups(g) == 2
+
+def part2(s):
+    return count_groups(parse_graph(s))
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.read().strip()
-
-        graph = defaultdict(set)
-        edges = s.split('\n')
-
-        for edge in edges:
-            vertex, neighbours = edge.split(' <-> ')
-            vertex, neighbours = int(vertex), map(int, neighbours.split(', '))
-            graph[vertex].update(neighbours)
-
-        graph = complete_neighbours(graph)
-        print(len(flood(graph, 0)))
-        print(count_groups(graph))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,40 @@
+from .run import complete_neighbours, flood, count_groups, parse_graph
+from .gen import generate
+
+
+def test_complete_neighbours():
+    completed = {0: {2, 3}, 2: {0, 3}, 3: {0, 2}}
+    assert complete_neighbours(completed) == completed
+
+    actual = complete_neighbours({0: {2}, 2: {3}, 3: set()})
+    expected = {0: {2}, 2: {0, 3}, 3: {2}}
+    assert actual == expected
+
+    actual = complete_neighbours({0: {2}, 2: {3}, 3: {0}})
+    expected = {0: {2, 3}, 2: {0, 3}, 3: {0, 2}}
+    assert actual == expected
+
+
+def test_groups():
+    g = {
+        0: {2},
+        1: {1},
+        2: {0, 3, 4},
+        3: {2, 4},
+        4: {2, 3, 6},
+        5: {6},
+        6: {4, 5},
+    }
+
+    assert flood(g, 0) == {0, 2, 3, 4, 5, 6}
+    assert flood(g, 1) == {1}
+
+    assert count_groups(g) == 2
+
+
+def test_generate():
+    s = generate(1000, seed=1)
+    assert s == generate(1000, seed=1)
+    graph = parse_graph(s)
+    assert len(graph) == 1000
+    assert all(node in graph[n] for node, neighbours in graph.items() for n in neighbours)
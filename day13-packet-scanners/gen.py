@@ -0,0 +1,26 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0, delay=None):
+    """Return a firewall of <size> layers with ranges between 2 and 20.
+
+    Ranges are chosen so that a packet delayed by <delay> picoseconds gets
+    through, so a safe trip always exists.
+    """
+    rng = random.Random(seed)
+    if delay is None:
+        delay = rng.randrange(1000, 10000)
+
+    lines = []
+    for depth in range(size):
+        if depth and rng.random() < 0.4:
+            continue
+        while True:
+            scan_range = rng.randint(2, 20)
+            if (delay + depth) % (2 * (scan_range - 1)) != 0:
+                break
+        lines.append('%d: %d' % (depth, scan_range))
+
+    return '\n'.join(lines) + '\n'
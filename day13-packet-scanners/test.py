@@ -0,0 +1,35 @@
+from .run import array_from_sparse_dict, trip_severity, safe_trip, parse_depths
+from .gen import generate
+
+
+def test_array_from_sparse_dict():
+    assert array_from_sparse_dict({}) == []
+    assert array_from_sparse_dict({0: 3}) == [3]
+    assert array_from_sparse_dict({0: 3, 1: 2}) == [3, 2]
+    assert array_from_sparse_dict({0: 3, 2: 8}) == [3, 0, 8]
+    assert array_from_sparse_dict({1: 5, 2: 8}) == [0, 5, 8]
+
+
+def test_trip_severity():
+    actual = trip_severity([3, 2, 0, 0, 4, 0, 4])
+    assert actual == 24, actual
+
+    actual = trip_severity([3, 2, 0, 0, 4, 0, 4], delay=4)
+    assert actual == 0, actual
+
+    actual = trip_severity([3, 2, 0, 0, 4, 0, 4], delay=10)
+    assert actual == 0, actual
+
+
+def test_safe_trip():
+    actual = safe_trip([3, 2, 0, 0, 4, 0, 4])
+    assert actual == 10, actual
+
+
+def test_generate():
+    s = generate(40, seed=1, delay=1234)
+    assert s == generate(40, seed=1, delay=1234)
+    depths = parse_depths(s)
+    assert len(depths) <= 40
+    assert trip_severity(depths, delay=1234) == 0
+    assert safe_trip(depths) <= 1234
@@ -0,0 +1,11 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from string import ascii_lowercase
+
+
+def generate(size=8, seed=0):
+    """Return a random key string of <size> letters."""
+    rng = random.Random(seed)
+    return ''.join(rng.choices(ascii_lowercase, k=size)) + '\n'
@@ -0,0 +1,163 @@
+from .run import (hex_to_bin, count_char, array_grid_from_string, flood, grid_find, count_regions,
+                  row_runs, DiskGrid, build_grids, disk_grid, part1, part2)
+from .gen import generate
+
+
+def test_hex_to_bin():
+    assert hex_to_bin('0') == '0000'
+    assert hex_to_bin('1') == '0001'
+    assert hex_to_bin('e') == '1110'
+    assert hex_to_bin('f') == '1111'
+    assert hex_to_bin('a0c2017') == '1010000011000010000000010111'
+
+
+def test_count_char():
+    assert count_char('', '1') == 0
+    assert count_char('0', '1') == 0
+    assert count_char('02', '1') == 0
+    assert count_char('1', '1') == 1
+    assert count_char('11', '1') == 2
+
+
+def test_array_grid_from_string():
+    assert array_grid_from_string("""
+0
+""") == [[0]]
+
+    assert array_grid_from_string("""
+00
+00
+""") == [[0, 0], [0, 0]]
+
+    assert array_grid_from_string("""
+01
+23
+""") == [[0, 1], [2, 3]]
+
+
+def test_flood():
+    assert flood([[0]], 0, 0) == [[0]]
+    assert flood([[1]], 0, 0) == [[0]]
+    assert flood([[2]], 0, 0) == [[2]]
+    assert flood([[1, 1], [1, 1]], 0, 0) == [[0, 0], [0, 0]]
+    assert flood([[1, 1], [1, 1]], 1, 1) == [[0, 0], [0, 0]]
+    assert flood([[1, 1], [1, 2]], 0, 0) == [[0, 0], [0, 2]]
+    assert flood([[1, 1], [1, 2]], 1, 1) == [[1, 1], [1, 2]]
+    assert flood([[1, 1, 1], [1, 2, 1], [1, 1, 1]], 0, 0) == [[0, 0, 0], [0, 2, 0], [0, 0, 0]]
+    assert flood([[1, 1, 1], [1, 2, 1], [1, 1, 1]], 2, 2) == [[0, 0, 0], [0, 2, 0], [0, 0, 0]]
+    assert flood([[1, 1, 1], [1, 2, 1], [1, 1, 1]], 0, 2) == [[0, 0, 0], [0, 2, 0], [0, 0, 0]]
+    assert flood([[1, 0, 1], [1, 0, 1], [1, 0, 1]], 0, 0) == [[0, 0, 1], [0, 0, 1], [0, 0, 1]]
+    assert flood([[1, 0, 1], [0, 0, 0], [1, 0, 1]], 0, 0) == [[0, 0, 1], [0, 0, 0], [1, 0, 1]]
+
+
+def test_grid_find():
+    assert grid_find([[0]], 0) == (0, 0)
+    assert grid_find([[0]], 1) is None
+    assert grid_find([[0, 0], [0, 1]], 1) == (1, 1)
+
+
+def test_count_regions():
+    assert count_regions("""
+0
+""") == 0
+
+    assert count_regions("""
+1
+""") == 1
+
+    assert count_regions("""
+11
+11
+""") == 1
+
+    assert count_regions("""
+111
+101
+111
+""") == 1
+
+    assert count_regions("""
+010
+111
+010
+""") == 1
+
+    assert count_regions("""
+101
+101
+101
+""") == 2
+
+    assert count_regions("""
+101
+010
+101
+""") == 5
+
+
+def test_row_runs():
+    assert list(row_runs(0)) == []
+    assert list(row_runs(0b1)) == [(0, 1)]
+    assert list(row_runs(0b1101110)) == [(1, 4), (5, 7)]
+
+
+def test_region_sizes():
+    assert DiskGrid.from_string('0').region_sizes() == []
+    assert DiskGrid.from_string("""
+101
+101
+111
+""").region_sizes() == [7]
+    assert DiskGrid.from_string("""
+11011
+00100
+11011
+""").region_sizes() == [2, 2, 2, 2, 1]
+    assert DiskGrid.from_string("""
+10101
+11111
+""").region_sizes() == [8]
+
+
+def test_region_sizes_large():
+    # A single region zigzagging through all rows, far too deep to flood recursively.
+    width, height = 1000, 1000
+    full, left, right = (1 << width) - 1, 1 << (width - 1), 1
+    rows = [full if y % 2 == 0 else (right if y % 4 == 1 else left) for y in range(height)]
+    grid = DiskGrid(rows)
+    assert grid.region_sizes() == [grid.used()]
+    assert grid.used() == width * height // 2 + height // 2
+
+
+def test_disk_grid():
+    grid = disk_grid('flqrgnkx').split('\n')
+    assert len(grid) == 128
+    assert [row[:8] for row in grid[:8]] == [
+        '11010100',
+        '01010101',
+        '00001010',
+        '10101101',
+        '01101000',
+        '11001001',
+        '01000100',
+        '11010110',
+    ]
+
+
+def test_build_grids():
+    grids = build_grids(['flqrgnkx', 'abc', 'flqrgnkx'], processes=1)
+    assert len(grids) == 3 and grids[0] == grids[2] != grids[1]
+    assert [len(rows) for rows in grids] == [128, 128, 128]
+    assert grids[0][0] >> 120 == 0b11010100
+    assert build_grids(['flqrgnkx', 'abc', 'flqrgnkx'], processes=2, chunksize=100) == grids
+
+
+def test_parts():
+    assert part1('flqrgnkx') == 8108
+    assert part2('flqrgnkx') == 1242
+
+
+def test_generate():
+    s = generate(8, seed=1)
+    assert s == generate(8, seed=1)
+    assert len(s.strip()) == 8 and s.strip().isalpha()
@@ -0,0 +1,13 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size=0, seed=0):
+    """Return random starting values for both generators.
+
+    The amount of work is fixed by the puzzle, so <size> is ignored.
+    """
+    rng = random.Random(seed)
+    return 'Generator A starts with %d\nGenerator B starts with %d\n' % (
+        rng.randrange(1, 1000), rng.randrange(1, 1000))
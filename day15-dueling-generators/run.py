@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import re
+
 
 def generator(factor, seed=0, modulus=2147483647, multiple_of=1):
     assert multiple_of != 0
@@ -10,68 +12,48 @@ def generator(factor, seed=0, modulus=2147483647, multiple_of=1):
             yield seed
 
 
-def judge(gen_a, gen_b, num_comparisons, bits=16):
+def judge(gen_a, gen_b, num_comparisons, bits=16, progress=None):
     matched = 0
     mask = (1 << bits) - 1
-    for _ in range(num_comparisons):
+    check = -1
+    if progress is not None:
+        progress.total = num_comparisons
+        check = progress.update(0)
+    for i in range(num_comparisons):
+        if i == check:
+            check = progress.update(i)
         a = next(gen_a) & mask
         b = next(gen_b) & mask
         if a == b:
             matched += 1
+    if progress is not None:
+        progress.finish(num_comparisons)
     return matched
 
 
-gen_a = generator(16807, seed=65)
-assert next(gen_a) == 1092455
-assert next(gen_a) == 1181022009
-assert next(gen_a) == 245556042
-assert next(gen_a) == 1744312007
-assert next(gen_a) == 1352636452
-
-gen_b = generator(48271, seed=8921)
-assert next(gen_b) == 430625591
-assert next(gen_b) == 1233683848
-assert next(gen_b) == 1431495498
-assert next(gen_b) == 137874439
-assert next(gen_b) == 285222916
-
-gen_a = generator(16807, seed=65)
-gen_b = generator(48271, seed=8921)
-assert judge(gen_a, gen_b, 5) == 1
-
-assert False, "unoptimized"
-
-gen_a = generator(16807, seed=65)
-gen_b = generator(48271, seed=8921)
-assert judge(gen_a, gen_b, int(40e6)) == 588
-
-gen_a = generator(16807, seed=591)
-gen_b = generator(48271, seed=393)
-print(judge(gen_a, gen_b, int(40e6)))
+def read_seeds(s):
+    seed_a, seed_b = map(int, re.findall(r'\d+', s))
+    return seed_a, seed_b
 
 
-gen_a = generator(16807, seed=65, multiple_of=4)
-assert next(gen_a) == 1352636452
-assert next(gen_a) == 1992081072
-assert next(gen_a) == 530830436
-assert next(gen_a) == 1980017072
-assert next(gen_a) == 740335192
+def part1(s, progress=None):
+    seed_a, seed_b = read_seeds(s)
+    gen_a = generator(16807, seed=seed_a)
+    gen_b = generator(48271, seed=seed_b)
+    return judge(gen_a, gen_b, int(40e6), progress=progress)
 
-gen_b = generator(48271, seed=8921, multiple_of=8)
-assert next(gen_b) == 1233683848
-assert next(gen_b) == 862516352
-assert next(gen_b) == 1159784568
-assert next(gen_b) == 1616057672
-assert next(gen_b) == 412269392
 
-gen_a = generator(16807, seed=65, multiple_of=4)
-gen_b = generator(48271, seed=8921, multiple_of=8)
-assert judge(gen_a, gen_b, 1056) == 1
+def part2(s, progress=None):
+    seed_a, seed_b = read_seeds(s)
+    gen_a = generator(16807, seed=seed_a, multiple_of=4)
+    gen_b = generator(48271, seed=seed_b, multiple_of=8)
+    return judge(gen_a, gen_b, int(5e6), progress=progress)
 
-gen_a = generator(16807, seed=65, multiple_of=4)
-gen_b = generator(48271, seed=8921, multiple_of=8)
-assert judge(gen_a, gen_b, int(5e6)) == 309
 
-gen_a = generator(16807, seed=591, multiple_of=4)
-gen_b = generator(48271, seed=393, multiple_of=8)
-print(judge(gen_a, gen_b, int(5e6)))
+if __name__ == '__main__':
+    inp = """
+Generator A starts with 591
+Generator B starts with 393
+"""
+    print(part1(inp))
+    print(part2(inp))
@@ -0,0 +1,69 @@
+import pytest
+
+from .run import generator, judge, read_seeds
+from .gen import generate
+
+
+def test_generator():
+    gen_a = generator(16807, seed=65)
+    assert next(gen_a) == 1092455
+    assert next(gen_a) == 1181022009
+    assert next(gen_a) == 245556042
+    assert next(gen_a) == 1744312007
+    assert next(gen_a) == 1352636452
+
+    gen_b = generator(48271, seed=8921)
+    assert next(gen_b) == 430625591
+    assert next(gen_b) == 1233683848
+    assert next(gen_b) == 1431495498
+    assert next(gen_b) == 137874439
+    assert next(gen_b) == 285222916
+
+
+def test_judge():
+    gen_a = generator(16807, seed=65)
+    gen_b = generator(48271, seed=8921)
+    assert judge(gen_a, gen_b, 5) == 1
+
+
+@pytest.mark.slow
+def test_judge_full():
+    gen_a = generator(16807, seed=65)
+    gen_b = generator(48271, seed=8921)
+    assert judge(gen_a, gen_b, int(40e6)) == 588
+
+
+def test_generator_multiple_of():
+    gen_a = generator(16807, seed=65, multiple_of=4)
+    assert next(gen_a) == 1352636452
+    assert next(gen_a) == 1992081072
+    assert next(gen_a) == 530830436
+    assert next(gen_a) == 1980017072
+    assert next(gen_a) == 740335192
+
+    gen_b = generator(48271, seed=8921, multiple_of=8)
+    assert next(gen_b) == 1233683848
+    assert next(gen_b) == 862516352
+    assert next(gen_b) == 1159784568
+    assert next(gen_b) == 1616057672
+    assert next(gen_b) == 412269392
+
+
+def test_judge_multiple_of():
+    gen_a = generator(16807, seed=65, multiple_of=4)
+    gen_b = generator(48271, seed=8921, multiple_of=8)
+    assert judge(gen_a, gen_b, 1056) == 1
+
+
+@pytest.mark.slow
+def test_judge_multiple_of_full():
+    gen_a = generator(16807, seed=65, multiple_of=4)
+    gen_b = generator(48271, seed=8921, multiple_of=8)
+    assert judge(gen_a, gen_b, int(5e6)) == 309
+
+
+def test_generate():
+    s = generate(seed=1)
+    assert s == generate(seed=1)
+    seed_a, seed_b = read_seeds(s)
+    assert seed_a > 0 and seed_b > 0
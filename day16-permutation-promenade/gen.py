@@ -0,0 +1,22 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+PROGRAMS = 'abcdefghijklmnop'
+
+
+def generate(size, seed=0):
+    """Return <size> dance moves for 16 programs."""
+    rng = random.Random(seed)
+    moves = []
+
+    for _ in range(size):
+        move = rng.choice('sxp')
+        if move == 's':
+            moves.append('s%d' % rng.randint(1, 15))
+        elif move == 'x':
+            moves.append('x%d/%d' % tuple(rng.sample(range(16), 2)))
+        else:
+            moves.append('p%s/%s' % tuple(rng.sample(PROGRAMS, 2)))
+
+    return ','.join(moves) + '\n'
@@ -23,47 +23,36 @@ def dance(progs=START):
         yield ''.join(progs)
 
 
-def test_dance():
-    d = dance("abcde")
+def dance_rounds(moves, rounds, progs=START):
+    """Return programs' order after performing <moves> <rounds> times."""
+    d = dance(progs)
+    result = progs
 
-    next(d)
-    assert d.send("s1") == "eabcd"
-
-    next(d)
-    assert d.send("x3/4") == "eabdc"
-
-    next(d)
-    assert d.send("pe/b") == "baedc"
+    i = 0
+    while i < rounds:
+        i += 1
 
+        for move in moves:
+            next(d)
+            result = d.send(move)
 
-if __name__ == '__main__':
-    NUM_ITERS = 1_000_000_000
+        if result == progs:
+            # cycle detected, skip all of its full repetitions
+            i = rounds - rounds % i
 
-    with open('input') as f:
-        s = f.read().strip()
-        moves = s.split(',')
+    return result
 
-    d = dance()
 
-    i = 0
-    while i < NUM_ITERS:
-        i += 1
+def part1(s):
+    return dance_rounds(s.strip().split(','), 1)
 
-        # execute once
-        for move in moves:
-            next(d)
-            progs = d.send(move)
 
-        if i == 1:
-            # part 1
-            print(progs, i)
+def part2(s):
+    return dance_rounds(s.strip().split(','), 1_000_000_000)
 
-        elif progs == START:
-            # cycle detected
-            print(progs, i)
-            i = NUM_ITERS - NUM_ITERS % i
 
-        elif i >= NUM_ITERS:
-            # part 2
-            print(progs, i)
-            break
+if __name__ == '__main__':
+    with open('input') as f:
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,23 @@
+from .run import dance, START, dance_rounds
+from .gen import generate
+
+
+def test_dance():
+    d = dance("abcde")
+
+    next(d)
+    assert d.send("s1") == "eabcd"
+
+    next(d)
+    assert d.send("x3/4") == "eabdc"
+
+    next(d)
+    assert d.send("pe/b") == "baedc"
+
+
+def test_generate():
+    s = generate(100, seed=1)
+    assert s == generate(100, seed=1)
+    moves = s.strip().split(',')
+    assert len(moves) == 100
+    assert sorted(dance_rounds(moves, 1)) == sorted(START)
@@ -0,0 +1,9 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size=400, seed=0):
+    """Return a random step count between 1 and <size>."""
+    rng = random.Random(seed)
+    return '%d\n' % rng.randint(1, max(size, 1))
@@ -5,57 +5,32 @@ from collections import deque
 from itertools import count, islice
 
 
-def spinlock(step):
+def spinlock(step, progress=None):
     state = deque([0])
+    check = progress.update(0) if progress else -1
     for n in count(1):
+        if n == check:
+            check = progress.update(n)
         yield state
         state.rotate(-step)
         state.append(n)
 
 
-s = spinlock(3)
+def part1(s):
+    state = next(islice(spinlock(int(s)), 2017, 2018))
+    return state[0]
 
-state = next(s)
-assert list(state) == [0], state
 
-state = next(s)
-assert list(state) == [0, 1], state
+def part2(s, progress=None):
+    if progress is not None:
+        progress.total = 50000000
+    state = next(islice(spinlock(int(s), progress=progress), 50000000, 50000000+1))
+    if progress is not None:
+        progress.finish(50000000)
+    return state[state.index(0) + 1]
 
-state = next(s)
-assert list(state) == [1, 0, 2], state
 
-state = next(s)
-assert list(state) == [1, 0, 2, 3], state
-
-state = next(s)
-assert list(state) == [3, 1, 0, 2, 4], state
-
-state = next(s)
-assert list(state) == [2, 4, 3, 1, 0, 5], state
-
-state = next(s)
-assert list(state) == [1, 0, 5, 2, 4, 3, 6], state
-
-state = next(s)
-assert list(state) == [2, 4, 3, 6, 1, 0, 5, 7], state
-
-state = next(s)
-assert list(state) == [6, 1, 0, 5, 7, 2, 4, 3, 8], state
-
-state = next(s)
-assert list(state) == [5, 7, 2, 4, 3, 8, 6, 1, 0, 9], state
-
-s = spinlock(3)
-state = next(islice(s, 2017, 2018))
-assert state[0] == 638
-
-puzzle_input = 376
-s = spinlock(puzzle_input)
-state = next(islice(s, 2017, 2018))
-print(state[0])
-
-assert False, "unoptimized"
-
-s = spinlock(puzzle_input)
-state = next(islice(s, 50000000, 50000000+1))
-print(state[state.index(0) + 1])
+if __name__ == '__main__':
+    inp = '376'
+    print(part1(inp))
+    print(part2(inp))
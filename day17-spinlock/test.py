@@ -0,0 +1,50 @@
+from itertools import islice
+
+from .run import spinlock
+from .gen import generate
+
+
+def test_spinlock():
+    s = spinlock(3)
+
+    state = next(s)
+    assert list(state) == [0], state
+
+    state = next(s)
+    assert list(state) == [0, 1], state
+
+    state = next(s)
+    assert list(state) == [1, 0, 2], state
+
+    state = next(s)
+    assert list(state) == [1, 0, 2, 3], state
+
+    state = next(s)
+    assert list(state) == [3, 1, 0, 2, 4], state
+
+    state = next(s)
+    assert list(state) == [2, 4, 3, 1, 0, 5], state
+
+    state = next(s)
+    assert list(state) == [1, 0, 5, 2, 4, 3, 6], state
+
+    state = next(s)
+    assert list(state) == [2, 4, 3, 6, 1, 0, 5, 7], state
+
+    state = next(s)
+    assert list(state) == [6, 1, 0, 5, 7, 2, 4, 3, 8], state
+
+    state = next(s)
+    assert list(state) == [5, 7, 2, 4, 3, 8, 6, 1, 0, 9], state
+
+
+def test_spinlock_2017():
+    s = spinlock(3)
+    state = next(islice(s, 2017, 2018))
+    assert state[0] == 638
+
+
+def test_generate():
+    s = generate(400, seed=1)
+    assert s == generate(400, seed=1)
+    assert 1 <= int(s) <= 400
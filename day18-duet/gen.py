@@ -0,0 +1,56 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+# Program 0 sends <count> pseudo-random numbers, then both programs
+# bubble-sort them by passing them back and forth until deadlock.
+TEMPLATE = """\
+set i 31
+set a 1
+mul p 17
+jgz p p
+mul a 2
+add i -1
+jgz i -2
+add a -1
+set i {count}
+set p {seed}
+mul p 8505
+mod p a
+mul p 129749
+add p 12345
+mod p a
+set b p
+mod b 10000
+snd b
+add i -1
+jgz i -9
+jgz a 3
+rcv b
+jgz b -1
+set f 0
+set i {count_1}
+rcv a
+rcv b
+set p a
+mul p -1
+add p b
+jgz p 4
+snd a
+set a b
+jgz 1 3
+snd b
+set f 1
+add i -1
+jgz i -11
+snd a
+jgz f -16
+jgz a -19
+"""
+
+
+def generate(size=127, seed=0):
+    """Return a duet program that sorts <size> numbers between two programs."""
+    rng = random.Random(seed)
+    size = max(size, 2)
+    return TEMPLATE.format(count=size, count_1=size - 1, seed=rng.randint(1, 999))
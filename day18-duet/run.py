@@ -129,18 +129,14 @@ class interpreter:
         return self.get("rcv")
 
 
-if __name__ == "__main__":
-    with open("input") as f:
-        prog = f.read().strip()
-
-    # part 1
-
-    p0 = interpreter(prog)
-    regs = p0.run(lambda i: i.rcv() > 0)
-    print(p0.snd())
+def part1(s):
+    p0 = interpreter(s.strip())
+    p0.run(lambda i: i.rcv() > 0)
+    return p0.snd()
 
-    # part 2
 
+def part2(s):
+    prog = s.strip()
     p1 = interpreter(prog, p=0)
     p2 = interpreter(prog, p=1)
     while True:
@@ -158,4 +154,11 @@ if __name__ == "__main__":
             # deadlock
             break
 
-    print(p2.sendn)
+    return p2.sendn
+
+
+if __name__ == "__main__":
+    with open("input") as f:
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -1,4 +1,5 @@
-from .run import interpreter
+from .run import interpreter, part1, part2
+from .gen import generate
 
 
 def test_set():
@@ -169,3 +170,10 @@ def test_receive_some():
     assert intp.pc == 4
     assert intp.rcv() == 7
     assert not intp.next()
+
+
+def test_generate():
+    s = generate(20, seed=1)
+    assert s == generate(20, seed=1)
+    assert part1(s) > 0
+    assert part2(s) > 0
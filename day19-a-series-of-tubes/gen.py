@@ -0,0 +1,42 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from string import ascii_uppercase
+
+
+def generate(size, seed=0):
+    """Return a diagram with a path of roughly <size> steps.
+
+    The path snakes down and up columns four characters apart, joined by
+    alternating bottom and top connectors.  The top line holds only the
+    entry, so every turn has a blank above or below it.
+    """
+    rng = random.Random(seed)
+    height = max(4, int(size ** 0.5))
+    columns = max(1, size // (height + 3))
+    width = 4 * (columns - 1) + 1
+    grid = [[' '] * width for _ in range(height)]
+
+    for col in range(columns):
+        x = 4 * col
+        top = 0 if col == 0 else 1
+        for y in range(top, height):
+            grid[y][x] = '|'
+
+        if col + 1 < columns:
+            y = height - 1 if col % 2 == 0 else 1
+            grid[y][x] = grid[y][x + 4] = '+'
+            for dx in range(1, 4):
+                grid[y][x + dx] = '-'
+        if col > 0:
+            y = height - 1 if col % 2 == 1 else 1
+            grid[y][x] = '+'
+
+    letters = iter(ascii_uppercase * (size // 26 + 1))
+    for y, row in enumerate(grid):
+        for x, c in enumerate(row):
+            if y and c in '|-' and rng.random() < 0.05:
+                row[x] = next(letters)
+
+    return '\n'.join(''.join(row) for row in grid) + '\n'
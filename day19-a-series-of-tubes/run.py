@@ -82,180 +82,16 @@ def _follow_diagram(diagram):
             raise RuntimeError('Incorrect direction (%d, %d)' % direction)
 
 
-assert get_diagram_size('') == (0, 0)
-assert get_diagram_size('.') == (1, 1)
-assert get_diagram_size('..\n..') == (2, 2)
+def part1(s):
+    return follow_diagram(s)
 
-diagram = """
-|
-"""
-assert follow_diagram(diagram) == ''
-assert get_path_length(diagram) == 1
 
-diagram = """
-|
-A
-"""
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 2
-
-diagram = """
-|
- 
-A
-""" # noqa
-assert follow_diagram(diagram) == ''
-assert get_path_length(diagram) == 1
-
-diagram = """
-|
-A
-|
-B
-C
-|
-"""
-assert follow_diagram(diagram) == 'ABC'
-assert get_path_length(diagram) == 6
-
-diagram = """
-   |
-   A
-"""
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 2
-
-diagram = """
-   |
-  A+
-"""
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 3
-
-diagram = """
-   |
-B A+
-"""
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 3
-
-diagram = """
-   | 
-   +A
-""" # noqa
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 3
-
-diagram = """
-   |   
-   +A B
-""" # noqa
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 3
-
-diagram = """
-|    
-+AB-C
-""" # noqa
-assert follow_diagram(diagram) == 'ABC'
-assert get_path_length(diagram) == 6
-
-diagram = """
-    |
-AB-C+
-"""
-assert follow_diagram(diagram) == 'CBA'
-assert get_path_length(diagram) == 6
-
-diagram = """
-|  
-+-+
-  A
-""" # noqa
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 5
-
-diagram = """
-  |
-+-+
-A  
-""" # noqa
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 5
-
-diagram = """
-| A
-+-+
-"""
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 5
-
-diagram = """
-B |
-+A+
-"""
-assert follow_diagram(diagram) == 'AB'
-assert get_path_length(diagram) == 5
-
-diagram = """
-| 
-++
- A
-""" # noqa
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 4
-
-diagram = """
- |
-++
-A 
-""" # noqa
-assert follow_diagram(diagram) == 'A'
-assert get_path_length(diagram) == 4
-
-diagram = """
-B|
-|A
-++
-"""
-assert follow_diagram(diagram) == 'AB'
-assert get_path_length(diagram) == 6
-
-diagram = """
-| C-+
-A   |
-+-B-+
-"""
-assert follow_diagram(diagram) == 'ABC'
-assert get_path_length(diagram) == 11
-
-diagram = """
-|   +-C
-A   |  
-+-B-+  
-""" # noqa
-assert follow_diagram(diagram) == 'ABC'
-assert get_path_length(diagram) == 11
-
-diagram = """
-     |          
-     |  +--+    
-     A  |  C    
- F---|----E|--+ 
-     |  |  |  D 
-     +B-+  +--+ 
-""" # noqa
-assert follow_diagram(diagram) == 'ABCDEF'
-assert get_path_length(diagram) == 38
+def part2(s):
+    return get_path_length(s)
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        diagram = f.read().strip('\n')
-
-    width, height = get_diagram_size(diagram)
-    assert width == 201, width
-    assert height == 201, height
-
-    print('letters', follow_diagram(diagram))
-    print('length', get_path_length(diagram))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
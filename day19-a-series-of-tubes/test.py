@@ -0,0 +1,180 @@
+from .run import get_diagram_size, follow_diagram, get_path_length
+from .gen import generate
+
+
+def test_get_diagram_size():
+    assert get_diagram_size('') == (0, 0)
+    assert get_diagram_size('.') == (1, 1)
+    assert get_diagram_size('..\n..') == (2, 2)
+
+
+def test_follow_diagram():
+    diagram = """
+|
+"""
+    assert follow_diagram(diagram) == ''
+    assert get_path_length(diagram) == 1
+
+    diagram = """
+|
+A
+"""
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 2
+
+    diagram = """
+|
+ 
+A
+""" # noqa
+    assert follow_diagram(diagram) == ''
+    assert get_path_length(diagram) == 1
+
+    diagram = """
+|
+A
+|
+B
+C
+|
+"""
+    assert follow_diagram(diagram) == 'ABC'
+    assert get_path_length(diagram) == 6
+
+    diagram = """
+   |
+   A
+"""
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 2
+
+    diagram = """
+   |
+  A+
+"""
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 3
+
+    diagram = """
+   |
+B A+
+"""
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 3
+
+    diagram = """
+   | 
+   +A
+""" # noqa
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 3
+
+    diagram = """
+   |   
+   +A B
+""" # noqa
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 3
+
+    diagram = """
+|    
++AB-C
+""" # noqa
+    assert follow_diagram(diagram) == 'ABC'
+    assert get_path_length(diagram) == 6
+
+    diagram = """
+    |
+AB-C+
+"""
+    assert follow_diagram(diagram) == 'CBA'
+    assert get_path_length(diagram) == 6
+
+    diagram = """
+|  
++-+
+  A
+""" # noqa
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 5
+
+    diagram = """
+  |
++-+
+A  
+""" # noqa
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 5
+
+    diagram = """
+| A
++-+
+"""
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 5
+
+    diagram = """
+B |
++A+
+"""
+    assert follow_diagram(diagram) == 'AB'
+    assert get_path_length(diagram) == 5
+
+    diagram = """
+| 
+++
+ A
+""" # noqa
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 4
+
+    diagram = """
+ |
+++
+A 
+""" # noqa
+    assert follow_diagram(diagram) == 'A'
+    assert get_path_length(diagram) == 4
+
+    diagram = """
+B|
+|A
+++
+"""
+    assert follow_diagram(diagram) == 'AB'
+    assert get_path_length(diagram) == 6
+
+    diagram = """
+| C-+
+A   |
++-B-+
+"""
+    assert follow_diagram(diagram) == 'ABC'
+    assert get_path_length(diagram) == 11
+
+    diagram = """
+|   +-C
+A   |  
++-B-+  
+""" # noqa
+    assert follow_diagram(diagram) == 'ABC'
+    assert get_path_length(diagram) == 11
+
+    diagram = """
+     |          
+     |  +--+    
+     A  |  C    
+ F---|----E|--+ 
+     |  |  |  D 
+     +B-+  +--+ 
+""" # noqa
+    assert follow_diagram(diagram) == 'ABCDEF'
+    assert get_path_length(diagram) == 38
+
+
+def test_generate():
+    s = generate(400, seed=1)
+    assert s == generate(400, seed=1)
+    letters = follow_diagram(s)
+    assert letters and letters.isupper()
+    assert 300 <= get_path_length(s) <= 400
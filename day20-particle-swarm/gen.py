@@ -0,0 +1,15 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def vector(rng, limit):
+    return ','.join(str(rng.randint(-limit, limit)) for _ in range(3))
+
+
+def generate(size, seed=0):
+    """Return <size> particles."""
+    rng = random.Random(seed)
+    lines = ['p=<%s>, v=<%s>, a=<%s>' % (vector(rng, 5000), vector(rng, 200), vector(rng, 20))
+             for _ in range(size)]
+    return '\n'.join(lines) + '\n'
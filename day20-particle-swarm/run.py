@@ -53,70 +53,22 @@ def remove_duplicated(it, sort_key=None, groupby_key=None):
             yield from g
 
 
-p1 = particle(p=(3, 0, 0), v=(2, 0, 0), a=(-1, 0, 0))
-p2 = particle(p=(4, 0, 0), v=(0, 0, 0), a=(-2, 0, 0))
-
-assert p1.p == (3, 0, 0)
-assert p1.v == (2, 0, 0)
-assert p1.a == (-1, 0, 0)
-
-p1 = tick(p1)
-assert p1.p == (4, 0, 0)
-assert p1.v == (1, 0, 0)
-assert p1.a == (-1, 0, 0)
-
-p1 = tick(p1)
-assert p1.p == (4, 0, 0)
-assert p1.v == (0, 0, 0)
-assert p1.a == (-1, 0, 0)
-
-p1 = tick(p1)
-assert p1.p == (3, 0, 0)
-assert p1.v == (-1, 0, 0)
-assert p1.a == (-1, 0, 0)
-
-z3 = (0, 0, 0)
-
-p = particle(p=(0, 0, 0), v=z3, a=z3)
-assert manhattan_distance(p) == 0
-
-p = particle(p=(1, 2, 8), v=z3, a=z3)
-assert manhattan_distance(p) == 11
-
-p = particle(p=(-5, 2, 3), v=z3, a=z3)
-assert manhattan_distance(p) == 10
-
-actual = particle_from_string('p=<2395,-194,549>, v=<-141,23,-78>, a=<-9,-1,5>')
-expected = particle(p=(2395, -194, 549), v=(-141, 23, -78), a=(-9, -1, 5))
-assert actual == expected
-
-actual = list(remove_duplicated([1, 2, 3, 4]))
-expected = [1, 2, 3, 4]
-assert actual == expected, actual
-
-actual = list(remove_duplicated([0, 0, 3, 4]))
-expected = [3, 4]
-assert actual == expected, actual
+def part1(s):
+    particles = [particle_from_string(line) for line in s.strip().split('\n')]
+    sim = next(islice(simulate(particles), 1000, 1001))
+    distances = [manhattan_distance(p) for p in sim]
+    min_idx, min_dist = min(enumerate(distances), key=itemgetter(1))
+    return min_idx
 
-actual = list(remove_duplicated([1, 0, 0, 4]))
-expected = [1, 4]
-assert actual == expected, actual
 
-actual = list(remove_duplicated([1, 2, 0, 0]))
-expected = [1, 2]
-assert actual == expected, actual
+def part2(s):
+    particles = [particle_from_string(line) for line in s.strip().split('\n')]
+    sim = next(islice(simulate_with_collision(particles), 1000, 1001))
+    return len(sim)
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.read().strip().split('\n')
-
-    particles = [particle_from_string(line) for line in s]
-
-    sim = next(islice(simulate(particles), 1000, 1001))
-    distances = [manhattan_distance(p) for p in sim]
-    min_idx, min_dist = min(enumerate(distances), key=itemgetter(1))
-    print(min_idx, min_dist)
-
-    sim = next(islice(simulate_with_collision(particles), 1000, 1001))
-    print(len(sim))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,69 @@
+from .run import particle, tick, manhattan_distance, particle_from_string, remove_duplicated
+from .gen import generate
+
+
+def test_tick():
+    p1 = particle(p=(3, 0, 0), v=(2, 0, 0), a=(-1, 0, 0))
+
+    assert p1.p == (3, 0, 0)
+    assert p1.v == (2, 0, 0)
+    assert p1.a == (-1, 0, 0)
+
+    p1 = tick(p1)
+    assert p1.p == (4, 0, 0)
+    assert p1.v == (1, 0, 0)
+    assert p1.a == (-1, 0, 0)
+
+    p1 = tick(p1)
+    assert p1.p == (4, 0, 0)
+    assert p1.v == (0, 0, 0)
+    assert p1.a == (-1, 0, 0)
+
+    p1 = tick(p1)
+    assert p1.p == (3, 0, 0)
+    assert p1.v == (-1, 0, 0)
+    assert p1.a == (-1, 0, 0)
+
+
+def test_manhattan_distance():
+    z3 = (0, 0, 0)
+
+    p = particle(p=(0, 0, 0), v=z3, a=z3)
+    assert manhattan_distance(p) == 0
+
+    p = particle(p=(1, 2, 8), v=z3, a=z3)
+    assert manhattan_distance(p) == 11
+
+    p = particle(p=(-5, 2, 3), v=z3, a=z3)
+    assert manhattan_distance(p) == 10
+
+
+def test_particle_from_string():
+    actual = particle_from_string('p=<2395,-194,549>, v=<-141,23,-78>, a=<-9,-1,5>')
+    expected = particle(p=(2395, -194, 549), v=(-141, 23, -78), a=(-9, -1, 5))
+    assert actual == expected
+
+
+def test_remove_duplicated():
+    actual = list(remove_duplicated([1, 2, 3, 4]))
+    expected = [1, 2, 3, 4]
+    assert actual == expected, actual
+
+    actual = list(remove_duplicated([0, 0, 3, 4]))
+    expected = [3, 4]
+    assert actual == expected, actual
+
+    actual = list(remove_duplicated([1, 0, 0, 4]))
+    expected = [1, 4]
+    assert actual == expected, actual
+
+    actual = list(remove_duplicated([1, 2, 0, 0]))
+    expected = [1, 2]
+    assert actual == expected, actual
+
+
+def test_generate():
+    s = generate(50, seed=1)
+    assert s == generate(50, seed=1)
+    particles = [particle_from_string(line) for line in s.strip().split('\n')]
+    assert len(particles) == 50
@@ -0,0 +1,30 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from itertools import product
+
+from .run import normalize
+
+
+def pattern(cells, n):
+    return '\n'.join(''.join(cells[i:i+n]) for i in range(0, n * n, n))
+
+
+def generate(size=0, seed=0):
+    """Return a complete rulebook with random enhancements.
+
+    Every 2x2 and 3x3 pattern needs a rule, so <size> is ignored.
+    """
+    rng = random.Random(seed)
+    rules = {}
+
+    for n in (2, 3):
+        for cells in product('.#', repeat=n * n):
+            key = normalize(pattern(cells, n))
+            if key not in rules:
+                out = pattern(rng.choices('.#', k=(n + 1) ** 2), n + 1)
+                rules[key] = out
+
+    lines = ['%s => %s' % (k.replace('\n', '/'), v.replace('\n', '/')) for k, v in rules.items()]
+    return '\n'.join(lines) + '\n'
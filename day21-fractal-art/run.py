@@ -129,197 +129,28 @@ def grid_states(rules, grid=None):
         yield grid
 
 
-assert get_grid_size("") == 0
-assert get_grid_size(".") == 1
-assert get_grid_size("..\n..") == 2
-assert get_grid_size("...\n...\n...") == 3
-
-
-actual = flip_h("##\n.#")
-expected = "##\n#."
-assert actual == expected, actual
-
-actual = flip_h("##.\n.#.\n..#")
-expected = ".##\n.#.\n#.."
-assert actual == expected, actual
-
-
-actual = flip_v("##\n.#")
-expected = ".#\n##"
-assert actual == expected, actual
-
-actual = flip_v("##.\n.#.\n..#")
-expected = "..#\n.#.\n##."
-assert actual == expected, actual
-
-
-actual = rotate(".")
-expected = "."
-assert actual == expected, actual
-
-
-actual = rotate(".#\n##")
-expected = "#.\n##"
-assert actual == expected, actual
-
-actual = rotate("#.\n##")
-expected = "##\n#."
-assert actual == expected, actual
-
-actual = rotate("##\n#.")
-expected = "##\n.#"
-assert actual == expected, actual
-
-actual = rotate("##\n.#")
-expected = ".#\n##"
-assert actual == expected, actual
-
-actual = rotate(rotate(rotate(rotate(".#\n##"))))
-expected = ".#\n##"
-assert actual == expected, actual
-
-
-actual = rotate(".#.\n..#\n###")
-expected = "#..\n#.#\n##."
-assert actual == expected, actual
-
-actual = rotate("#..\n#.#\n##.")
-expected = "###\n#..\n.#."
-assert actual == expected, actual
-
-actual = rotate("###\n#..\n.#.")
-expected = ".##\n#.#\n..#"
-assert actual == expected, actual
-
-actual = rotate(".##\n#.#\n..#")
-expected = ".#.\n..#\n###"
-assert actual == expected, actual
-
-actual = rotate(rotate(rotate(rotate(".##\n#.#\n..#"))))
-expected = ".##\n#.#\n..#"
-assert actual == expected, actual
-
-
-assert len(all_permutations(".")) == 1
-assert len(all_permutations(".#\n##")) == 4
-assert len(all_permutations(".#.\n..#\n###")) == 8
-
-
-assert '#' < '.'
-assert normalize(".#\n##") == "##\n#."
-assert normalize(".#.\n..#\n###") == "###\n#..\n.#."
-
-
-rules = {
-    normalize("..\n.#"): "##.\n#..\n...",
-    normalize(".#.\n..#\n###"): "#..#\n....\n....\n#..#",
-}
-assert apply_rule(rules, "..\n.#") == "##.\n#..\n..."
-assert apply_rule(rules, ".#.\n..#\n###") == "#..#\n....\n....\n#..#"
-
-
-assert list(each_n([], n=2)) == []
-assert list(each_n([1, 2], n=2)) == [(1, 2)]
-assert list(each_n([1, 2, 3, 4, 5, 6], n=2)) == [(1, 2), (3, 4), (5, 6)]
-
-
-assert list(each_n([], n=3)) == []
-assert list(each_n([1, 2, 3], n=3)) == [(1, 2, 3)]
-assert list(each_n([1, 2, 3, 4, 5, 6], n=3)) == [(1, 2, 3), (4, 5, 6)]
-
-
-actual = list(split_grid_mod2(".#\n##"))
-expected = [".#\n##"]
-assert actual == expected, actual
-
-actual = list(split_grid_mod2("..##\n..##\n.##.\n#.##"))
-expected = ["..\n..", "##\n##", ".#\n#.", "#.\n##"]
-assert actual == expected, actual
-
-
-actual = list(split_grid_mod3(".#.\n..#\n###"))
-expected = [".#.\n..#\n###"]
-assert actual == expected, actual
-
-# ...|###
-# ...|###
-# ...|###
-# ---+---
-# ..#|.#.
-# .#.|..#
-# #..|###
-
-actual = list(split_grid_mod3("...###\n...###\n...###\n..#.#.\n.#...#\n#..###"))
-expected = ["...\n...\n...", "###\n###\n###", "..#\n.#.\n#..", ".#.\n..#\n###"]
-assert actual == expected, actual
-
-
-actual = list(split_grid(".#\n##"))
-expected = [".#\n##"]
-assert actual == expected, actual
-
-actual = list(split_grid("..##\n..##\n.##.\n#.##"))
-expected = ["..\n..", "##\n##", ".#\n#.", "#.\n##"]
-assert actual == expected, actual
-
-actual = list(split_grid(".#.\n..#\n###"))
-expected = [".#.\n..#\n###"]
-assert actual == expected, actual
-
-# ..|.#|##
-# ..|.#|##
-# --+--+--
-# ..|.#|##
-# ..|#.|#.
-# --+--+--
-# .#|..|.#
-# #.|.#|##
-
-actual = list(split_grid("...###\n...###\n...###\n..#.#.\n.#...#\n#..###"))
-expected = ["..\n..", ".#\n.#", "##\n##",
-            "..\n..", ".#\n#.", "##\n#.",
-            ".#\n#.", "..\n.#", ".#\n##"]
-assert actual == expected, actual
-
-
-actual = '\n'.join(combine_grid([".", "#", "#", "."]))
-expected = ".#\n#."
-assert actual == expected, actual
-
-actual = '\n'.join(combine_grid(["..\n..", "##\n##", "##\n##", "..\n.."]))
-expected = "..##\n..##\n##..\n##.."
-assert actual == expected, actual
+def read_rules(s):
+    rules = dict()
+    for line in s.strip().split('\n'):
+        k, v = line.split(' => ')
+        k = normalize(k.replace('/', '\n'))
+        v = v.replace('/', '\n')
+        rules[k] = v
+    return rules
 
 
-rules = {
-    normalize("..\n.#"): "##.\n#..\n...",
-    normalize(".#.\n..#\n###"): "#..#\n....\n....\n#..#",
-}
-states = grid_states(rules)
+def part1(s):
+    grid = next(islice(grid_states(read_rules(s)), 4, 5))
+    return grid.count('#')
 
-actual = next(states)
-expected = "#..#\n....\n....\n#..#"
-assert actual == expected, actual
 
-actual = next(states)
-expected = "##.##.\n#..#..\n......\n##.##.\n#..#..\n......"
-assert actual == expected, actual
+def part2(s):
+    grid = next(islice(grid_states(read_rules(s)), 17, 18))
+    return grid.count('#')
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        s = f.read().strip().split('\n')
-
-    rules = dict()
-    for line in s:
-        k, v = line.split(' => ')
-        k = normalize(k.replace('/', '\n'))
-        v = v.replace('/', '\n')
-        rules[k] = v
-
-    states = grid_states(rules)
-    grid = next(islice(states, 4, 5))
-    print(grid.count('#'))
-
-    grid = next(islice(states, 12, 13))
-    print(grid.count('#'))
+        s = f.read()
+        print(part1(s))
+        print(part2(s))
@@ -0,0 +1,200 @@
+from .run import (get_grid_size, flip_h, flip_v, rotate, all_permutations, normalize, apply_rule,
+                  each_n, split_grid_mod2, split_grid_mod3, split_grid, combine_grid, grid_states, read_rules)
+from .gen import generate
+
+
+def test_get_grid_size():
+    assert get_grid_size("") == 0
+    assert get_grid_size(".") == 1
+    assert get_grid_size("..\n..") == 2
+    assert get_grid_size("...\n...\n...") == 3
+
+
+def test_flip_h():
+    actual = flip_h("##\n.#")
+    expected = "##\n#."
+    assert actual == expected, actual
+
+    actual = flip_h("##.\n.#.\n..#")
+    expected = ".##\n.#.\n#.."
+    assert actual == expected, actual
+
+
+def test_flip_v():
+    actual = flip_v("##\n.#")
+    expected = ".#\n##"
+    assert actual == expected, actual
+
+    actual = flip_v("##.\n.#.\n..#")
+    expected = "..#\n.#.\n##."
+    assert actual == expected, actual
+
+
+def test_rotate():
+    actual = rotate(".")
+    expected = "."
+    assert actual == expected, actual
+
+    actual = rotate(".#\n##")
+    expected = "#.\n##"
+    assert actual == expected, actual
+
+    actual = rotate("#.\n##")
+    expected = "##\n#."
+    assert actual == expected, actual
+
+    actual = rotate("##\n#.")
+    expected = "##\n.#"
+    assert actual == expected, actual
+
+    actual = rotate("##\n.#")
+    expected = ".#\n##"
+    assert actual == expected, actual
+
+    actual = rotate(rotate(rotate(rotate(".#\n##"))))
+    expected = ".#\n##"
+    assert actual == expected, actual
+
+    actual = rotate(".#.\n..#\n###")
+    expected = "#..\n#.#\n##."
+    assert actual == expected, actual
+
+    actual = rotate("#..\n#.#\n##.")
+    expected = "###\n#..\n.#."
+    assert actual == expected, actual
+
+    actual = rotate("###\n#..\n.#.")
+    expected = ".##\n#.#\n..#"
+    assert actual == expected, actual
+
+    actual = rotate(".##\n#.#\n..#")
+    expected = ".#.\n..#\n###"
+    assert actual == expected, actual
+
+    actual = rotate(rotate(rotate(rotate(".##\n#.#\n..#"))))
+    expected = ".##\n#.#\n..#"
+    assert actual == expected, actual
+
+
+def test_all_permutations():
+    assert len(all_permutations(".")) == 1
+    assert len(all_permutations(".#\n##")) == 4
+    assert len(all_permutations(".#.\n..#\n###")) == 8
+
+
+def test_normalize():
+    assert '#' < '.'
+    assert normalize(".#\n##") == "##\n#."
+    assert normalize(".#.\n..#\n###") == "###\n#..\n.#."
+
+
+def test_apply_rule():
+    rules = {
+        normalize("..\n.#"): "##.\n#..\n...",
+        normalize(".#.\n..#\n###"): "#..#\n....\n....\n#..#",
+    }
+    assert apply_rule(rules, "..\n.#") == "##.\n#..\n..."
+    assert apply_rule(rules, ".#.\n..#\n###") == "#..#\n....\n....\n#..#"
+
+
+def test_each_n():
+    assert list(each_n([], n=2)) == []
+    assert list(each_n([1, 2], n=2)) == [(1, 2)]
+    assert list(each_n([1, 2, 3, 4, 5, 6], n=2)) == [(1, 2), (3, 4), (5, 6)]
+
+    assert list(each_n([], n=3)) == []
+    assert list(each_n([1, 2, 3], n=3)) == [(1, 2, 3)]
+    assert list(each_n([1, 2, 3, 4, 5, 6], n=3)) == [(1, 2, 3), (4, 5, 6)]
+
+
+def test_split_grid_mod2():
+    actual = list(split_grid_mod2(".#\n##"))
+    expected = [".#\n##"]
+    assert actual == expected, actual
+
+    actual = list(split_grid_mod2("..##\n..##\n.##.\n#.##"))
+    expected = ["..\n..", "##\n##", ".#\n#.", "#.\n##"]
+    assert actual == expected, actual
+
+
+def test_split_grid_mod3():
+    actual = list(split_grid_mod3(".#.\n..#\n###"))
+    expected = [".#.\n..#\n###"]
+    assert actual == expected, actual
+
+    # ...|###
+    # ...|###
+    # ...|###
+    # ---+---
+    # ..#|.#.
+    # .#.|..#
+    # #..|###
+
+    actual = list(split_grid_mod3("...###\n...###\n...###\n..#.#.\n.#...#\n#..###"))
+    expected = ["...\n...\n...", "###\n###\n###", "..#\n.#.\n#..", ".#.\n..#\n###"]
+    assert actual == expected, actual
+
+
+def test_split_grid():
+    actual = list(split_grid(".#\n##"))
+    expected = [".#\n##"]
+    assert actual == expected, actual
+
+    actual = list(split_grid("..##\n..##\n.##.\n#.##"))
+    expected = ["..\n..", "##\n##", ".#\n#.", "#.\n##"]
+    assert actual == expected, actual
+
+    actual = list(split_grid(".#.\n..#\n###"))
+    expected = [".#.\n..#\n###"]
+    assert actual == expected, actual
+
+    # ..|.#|##
+    # ..|.#|##
+    # --+--+--
+    # ..|.#|##
+    # ..|#.|#.
+    # --+--+--
+    # .#|..|.#
+    # #.|.#|##
+
+    actual = list(split_grid("...###\n...###\n...###\n..#.#.\n.#...#\n#..###"))
+    expected = ["..\n..", ".#\n.#", "##\n##",
+                "..\n..", ".#\n#.", "##\n#.",
+                ".#\n#.", "..\n.#", ".#\n##"]
+    assert actual == expected, actual
+
+
+def test_combine_grid():
+    actual = '\n'.join(combine_grid([".", "#", "#", "."]))
+    expected = ".#\n#."
+    assert actual == expected, actual
+
+    actual = '\n'.join(combine_grid(["..\n..", "##\n##", "##\n##", "..\n.."]))
+    expected = "..##\n..##\n##..\n##.."
+    assert actual == expected, actual
+
+
+def test_grid_states():
+    rules = {
+        normalize("..\n.#"): "##.\n#..\n...",
+        normalize(".#.\n..#\n###"): "#..#\n....\n....\n#..#",
+    }
+    states = grid_states(rules)
+
+    actual = next(states)
+    expected = "#..#\n....\n....\n#..#"
+    assert actual == expected, actual
+
+    actual = next(states)
+    expected = "##.##.\n#..#..\n......\n##.##.\n#..#..\n......"
+    assert actual == expected, actual
+
+
+def test_generate():
+    s = generate(seed=1)
+    assert s == generate(seed=1)
+    rules = read_rules(s)
+    assert len(rules) == 6 + 102
+    states = grid_states(rules)
+    for _ in range(5):
+        next(states)
@@ -0,0 +1,11 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+
+def generate(size, seed=0, density=0.5):
+    """Return a square grid of edge <size> (made odd), <density> infected."""
+    rng = random.Random(seed)
+    size |= 1
+    return '\n'.join(''.join('#' if rng.random() < density else '.' for _ in range(size))
+                     for _ in range(size)) + '\n'
@@ -12,7 +12,7 @@ def load_grid(s):
     return grid
 
 
-def bursts(grid, stop):
+def bursts(grid, stop, progress=None):
     directions = (
         (0, -1),
         (1, 0),
@@ -23,8 +23,14 @@ def bursts(grid, stop):
     pos = (0, 0)
     dir = (0, -1)
     grid = load_grid(grid)
-
-    for _ in range(stop):
+    check = -1
+    if progress is not None:
+        progress.total = stop
+        check = progress.update(0)
+
+    for i in range(stop):
+        if i == check:
+            check = progress.update(i)
         idx = (directions.index(dir) + (1 if pos in grid else -1)) % num_dirs
         dir = directions[idx]
         try:
@@ -36,59 +42,16 @@ def bursts(grid, stop):
         pos = tuple(x + y for x, y in zip(pos, dir))
         yield grid
 
+    if progress is not None:
+        progress.finish(stop)
 
-actual = load_grid(".##\n..#\n...")
-expected = {(0, -1), (1, -1), (1, 0)}
-assert actual == expected, actual
-
-actual = load_grid("..#\n#..\n...")
-expected = {(1, -1), (-1, 0)}
-assert actual == expected, actual
-
-burst = bursts("""
-..#
-#..
-...
-""", stop=1000)
-grid = filter(lambda e: type(e) == set, burst)
-
-actual = next(grid)
-expected = {(-1, 0), (0, 0), (1, -1)}
-assert actual == expected, actual
 
-actual = next(grid)
-expected = {(0, 0), (1, -1)}
-assert actual == expected, actual
-
-burst = bursts("""
-..#
-#..
-...
-""", stop=7)
-actual = sum(v for v in burst if type(v) == int)
-assert actual == 5
-
-burst = bursts("""
-..#
-#..
-...
-""", stop=70)
-actual = sum(v for v in burst if type(v) == int)
-assert actual == 41
-
-burst = bursts("""
-..#
-#..
-...
-""", stop=10000)
-actual = sum(v for v in burst if type(v) == int)
-assert actual == 5587
+def part1(s, progress=None):
+    burst = bursts(s.strip(), stop=10000, progress=progress)
+    return sum(v for v in burst if type(v) == int)
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        grid = f.read().strip()
-
-    burst = bursts(grid, stop=10000)
-    infections = sum(v for v in burst if type(v) == int)
-    print(infections)
+        s = f.read()
+        print(part1(s))
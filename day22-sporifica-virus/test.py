@@ -0,0 +1,62 @@
+from .run import load_grid, bursts
+from .gen import generate
+
+
+def test_load_grid():
+    actual = load_grid(".##\n..#\n...")
+    expected = {(0, -1), (1, -1), (1, 0)}
+    assert actual == expected, actual
+
+    actual = load_grid("..#\n#..\n...")
+    expected = {(1, -1), (-1, 0)}
+    assert actual == expected, actual
+
+
+def test_bursts_grid():
+    burst = bursts("""
+..#
+#..
+...
+""", stop=1000)
+    grid = filter(lambda e: type(e) == set, burst)
+
+    actual = next(grid)
+    expected = {(-1, 0), (0, 0), (1, -1)}
+    assert actual == expected, actual
+
+    actual = next(grid)
+    expected = {(0, 0), (1, -1)}
+    assert actual == expected, actual
+
+
+def test_bursts_infections():
+    burst = bursts("""
+..#
+#..
+...
+""", stop=7)
+    actual = sum(v for v in burst if type(v) == int)
+    assert actual == 5
+
+    burst = bursts("""
+..#
+#..
+...
+""", stop=70)
+    actual = sum(v for v in burst if type(v) == int)
+    assert actual == 41
+
+    burst = bursts("""
+..#
+#..
+...
+""", stop=10000)
+    actual = sum(v for v in burst if type(v) == int)
+    assert actual == 5587
+
+
+def test_generate():
+    s = generate(24, seed=1)
+    assert s == generate(24, seed=1)
+    assert s.count('\n') == 25
+    assert 0 < len(load_grid(s)) < 25 * 25
@@ -0,0 +1,28 @@
+"""Synthetic puzzle inputs, for benchmarking at scale."""
+
+import random
+
+from string import ascii_uppercase
+
+RULE = """\
+  If the current value is {value}:
+    - Write the value {write}.
+    - Move one slot to the {move}.
+    - Continue with state {state}.
+"""
+
+
+def generate(size, seed=0, states=6):
+    """Return a blueprint running <size> steps on <states> states."""
+    rng = random.Random(seed)
+    names = ascii_uppercase[:states]
+
+    blocks = ['Begin in state A.\nPerform a diagnostic checksum after %d steps.\n' % size]
+    for name in names:
+        block = 'In state %s:\n' % name
+        for value in (0, 1):
+            block += RULE.format(value=value, write=rng.randint(0, 1),
+                                 move=rng.choice(('left', 'right')), state=rng.choice(names))
+        blocks.append(block)
+
+    return '\n'.join(blocks)
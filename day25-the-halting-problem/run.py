@@ -39,12 +39,20 @@ def read_rules(s):
     return initial_state, checksum_after, rules
 
 
-def turing_machine(initial_state, rules, checksum_after):
+def turing_machine(initial_state, rules, checksum_after, progress=None):
     at = 0
     tape = defaultdict(int, {at: 0, 'state': initial_state})
+    check = -1
+    if progress is not None:
+        progress.total = checksum_after
+        check = progress.update(0)
 
     for n in count():
+        if n == check:
+            check = progress.update(n)
         if n == checksum_after:
+            if progress is not None:
+                progress.finish(n)
             yield sum(v for k, v in tape.items() if k != 'state')
 
         rule = rules[tape['state']][tape[at]]
@@ -55,102 +63,13 @@ def turing_machine(initial_state, rules, checksum_after):
         yield tape
 
 
-initial_state, checksum_after, rules = read_rules("""
-Begin in state A.
-Perform a diagnostic checksum after 6 steps.
-
-In state A:
-  If the current value is 0:
-    - Write the value 1.
-    - Move one slot to the right.
-    - Continue with state B.
-  If the current value is 1:
-    - Write the value 0.
-    - Move one slot to the left.
-    - Continue with state B.
-
-In state B:
-  If the current value is 0:
-    - Write the value 1.
-    - Move one slot to the left.
-    - Continue with state A.
-  If the current value is 1:
-    - Write the value 1.
-    - Move one slot to the right.
-    - Continue with state A.
-""")
-
-expected = {
-    'A': {
-        0: {
-            'write': 1,
-            'move': 1,
-            'state': 'B',
-        },
-        1: {
-            'write': 0,
-            'move': -1,
-            'state': 'B',
-        }
-    },
-    'B': {
-        0: {
-            'write': 1,
-            'move': -1,
-            'state': 'A',
-        },
-        1: {
-            'write': 1,
-            'move': 1,
-            'state': 'A',
-        },
-    },
-}
-
-assert initial_state == 'A'
-assert checksum_after == 6
-assert rules == expected
-
-tm = turing_machine('A', rules, checksum_after=6)
-
-actual = next(tm)
-expected = {0: 1, 1: 0, 'state': 'B'}
-assert actual == expected, actual
-
-actual = next(tm)
-expected = {0: 1, 1: 1, 'state': 'A'}
-assert actual == expected, actual
-
-actual = next(tm)
-expected = {-1: 0, 0: 0, 1: 1, 'state': 'B'}
-assert actual == expected, actual
-
-actual = next(tm)
-expected = {-2: 0, -1: 1, 0: 0, 1: 1, 'state': 'A'}
-assert actual == expected, actual
-
-actual = next(tm)
-expected = {-2: 1, -1: 1, 0: 0, 1: 1, 'state': 'B'}
-assert actual == expected, actual
-
-actual = next(tm)
-expected = {-2: 1, -1: 1, 0: 0, 1: 1, 'state': 'A'}
-assert actual == expected, actual
-
-actual = next(tm)
-expected = 3
-assert actual == expected, actual
-
-tm = turing_machine('A', rules, checksum_after=6)
-actual = next(islice(tm, 6, 7))
-expected = 3
-assert actual == expected, actual
+def part1(s, progress=None):
+    initial_state, checksum_after, rules = read_rules(s)
+    tm = turing_machine(initial_state, rules, checksum_after=checksum_after, progress=progress)
+    return next(islice(tm, checksum_after, checksum_after + 1))
 
 
 if __name__ == '__main__':
     with open('input') as f:
-        rules = f.read().strip()
-
-    initial_state, checksum_after, rules = read_rules(rules)
-    tm = turing_machine(initial_state, rules, checksum_after=checksum_after)
-    print(next(islice(tm, checksum_after, checksum_after + 1)))
+        s = f.read()
+        print(part1(s))
@@ -0,0 +1,113 @@
+from itertools import islice
+
+from .run import read_rules, turing_machine
+from .gen import generate
+
+blueprint = """
+Begin in state A.
+Perform a diagnostic checksum after 6 steps.
+
+In state A:
+  If the current value is 0:
+    - Write the value 1.
+    - Move one slot to the right.
+    - Continue with state B.
+  If the current value is 1:
+    - Write the value 0.
+    - Move one slot to the left.
+    - Continue with state B.
+
+In state B:
+  If the current value is 0:
+    - Write the value 1.
+    - Move one slot to the left.
+    - Continue with state A.
+  If the current value is 1:
+    - Write the value 1.
+    - Move one slot to the right.
+    - Continue with state A.
+"""
+
+
+def test_read_rules():
+    initial_state, checksum_after, rules = read_rules(blueprint)
+    expected = {
+        'A': {
+            0: {
+                'write': 1,
+                'move': 1,
+                'state': 'B',
+            },
+            1: {
+                'write': 0,
+                'move': -1,
+                'state': 'B',
+            }
+        },
+        'B': {
+            0: {
+                'write': 1,
+                'move': -1,
+                'state': 'A',
+            },
+            1: {
+                'write': 1,
+                'move': 1,
+                'state': 'A',
+            },
+        },
+    }
+
+    assert initial_state == 'A'
+    assert checksum_after == 6
+    assert rules == expected
+
+
+def test_turing_machine():
+    _, _, rules = read_rules(blueprint)
+
+    tm = turing_machine('A', rules, checksum_after=6)
+
+    actual = next(tm)
+    expected = {0: 1, 1: 0, 'state': 'B'}
+    assert actual == expected, actual
+
+    actual = next(tm)
+    expected = {0: 1, 1: 1, 'state': 'A'}
+    assert actual == expected, actual
+
+    actual = next(tm)
+    expected = {-1: 0, 0: 0, 1: 1, 'state': 'B'}
+    assert actual == expected, actual
+
+    actual = next(tm)
+    expected = {-2: 0, -1: 1, 0: 0, 1: 1, 'state': 'A'}
+    assert actual == expected, actual
+
+    actual = next(tm)
+    expected = {-2: 1, -1: 1, 0: 0, 1: 1, 'state': 'B'}
+    assert actual == expected, actual
+
+    actual = next(tm)
+    expected = {-2: 1, -1: 1, 0: 0, 1: 1, 'state': 'A'}
+    assert actual == expected, actual
+
+    actual = next(tm)
+    expected = 3
+    assert actual == expected, actual
+
+    tm = turing_machine('A', rules, checksum_after=6)
+    actual = next(islice(tm, 6, 7))
+    expected = 3
+    assert actual == expected, actual
+
+
+def test_generate():
+    s = generate(1000, seed=1, states=4)
+    assert s == generate(1000, seed=1, states=4)
+    initial_state, checksum_after, rules = read_rules(s)
+    assert initial_state == 'A'
+    assert checksum_after == 1000
+    assert sorted(rules) == ['A', 'B', 'C', 'D']
+    tm = turing_machine(initial_state, rules, checksum_after=checksum_after)
+    assert 0 <= next(islice(tm, checksum_after, checksum_after + 1)) <= 1000